@@ -6,162 +6,709 @@
 import os
 import json
 import logging
-import requests
 import time
-import gc
-from typing import Dict, List, Optional, Any, Tuple
+import io
+import re
+import hashlib
+import threading
+import traceback
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Iterable, Union, IO, Callable, TYPE_CHECKING
 from datetime import datetime
 from abc import ABC, abstractmethod
 
+from collectors.delta import DeltaTracker, write_delta
+from collectors.normalize import normalize_record
+from collectors.metrics import metrics, TimedRecords
+from collectors.memory import memory_budget, parse_working_set
+
+if TYPE_CHECKING:
+    import requests  # 다운로드할 때만 임포트 (명령행 시작 시간 단축)
+
 # 환경 설정
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 OUTPUT_DIR = 'docs/data'
 TEMP_DIR = 'temp'
 LOG_DIR = 'logs'
-MAX_MEMORY_PERCENT = 80  # 최대 메모리 사용량 제한 (%)
 REQUEST_TIMEOUT = 60  # 요청 타임아웃 (초)
-CHUNK_SIZE = 10000  # 청크 단위로 처리할 항목 수
-
-# 디렉토리 생성
-for directory in [OUTPUT_DIR, TEMP_DIR, LOG_DIR]:
-    os.makedirs(directory, exist_ok=True)
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "sanctions_collector.log")),
-        logging.StreamHandler()
-    ]
-)
+WRITE_BUFFER_SIZE = 1024 * 1024  # JSON 출력 파일 쓰기 버퍼 크기 (bytes)
+READ_CHUNK_SIZE = 256 * 1024  # JSON 스트리밍 읽기 청크 크기 (문자 수)
+# 소스별 출력 형식: 'json'(단일 JSON 문서) 또는 'ndjson'(한 줄에 한 항목)
+OUTPUT_FORMAT = os.environ.get('SANCTIONS_OUTPUT_FORMAT', 'json')
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # 다운로드 스트림 청크 크기 (bytes)
+HTTP_POOL_SIZE = 10  # 호스트별 HTTP 연결 풀 크기
+HTTP_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'application/xml,text/xml,application/zip,*/*',
+    'Accept-Encoding': 'gzip, deflate',
+}
+# XML 파싱 방식: 'stream'(iterparse, 메모리 일정) 또는 'tree'(fromstring, 기존 방식)
+PARSE_MODE = os.environ.get('SANCTIONS_PARSE_MODE', 'stream')
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE = os.path.join(LOG_DIR, "sanctions_collector.log")
+
 logger = logging.getLogger("sanctions_collector")
 
-def get_memory_usage() -> float:
-    """현재 메모리 사용률(%)을 반환합니다."""
-    import psutil
-    return psutil.Process(os.getpid()).memory_percent()
+def ensure_directories() -> None:
+    """출력/임시/로그 디렉토리를 생성합니다. (임포트 시가 아니라 명령을 실행할 때 호출)"""
+    for directory in [OUTPUT_DIR, TEMP_DIR, LOG_DIR]:
+        os.makedirs(directory, exist_ok=True)
 
-def download_sanctions_data(url: str, output_file: str) -> Optional[bytes]:
-    """제재 데이터를 다운로드합니다."""
+def setup_logging(log_file: Optional[str] = LOG_FILE, level: int = logging.INFO) -> None:
+    """콘솔과 로그 파일 로깅을 설정합니다. (임포트 시가 아니라 명령을 실행할 때 호출, log_file이 None이면 콘솔만)"""
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+        handlers.insert(0, logging.FileHandler(log_file))
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> "requests.Session":
+    """수집기들이 공유하는 연결 풀 기반 HTTP 세션을 반환합니다."""
+    global _http_session
+    import requests
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(HTTP_HEADERS)
+            _http_session = session
+    return _http_session
+
+def _validators_path(output_file: str) -> str:
+    """다운로드 검증자(ETag 등) 파일 경로를 반환합니다."""
+    return os.path.join(TEMP_DIR, f"{output_file}.validators.json")
+
+def load_validators(output_file: str) -> Dict:
+    """임시 파일 옆에 저장된 다운로드 검증자를 읽습니다."""
+    try:
+        with open(_validators_path(output_file), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_validators(output_file: str, validators: Dict) -> None:
+    """다운로드 검증자를 임시 파일 옆에 저장합니다."""
+    try:
+        with open(_validators_path(output_file), 'w', encoding='utf-8') as f:
+            json.dump(validators, f, ensure_ascii=False, indent=2)
+    except OSError as e:
+        logger.warning(f"다운로드 검증자 저장 실패: {output_file}, 오류: {str(e)}")
+
+def _conditional_headers(url: str, validators: Dict, temp_file_path: str) -> Dict[str, str]:
+    """이전 검증자로 조건부 요청 헤더를 만듭니다. 재사용할 임시 파일이 없으면 빈 헤더를 반환합니다."""
+    headers = {}
+    if validators.get('url') == url and os.path.exists(temp_file_path):
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('lastModified'):
+            headers['If-Modified-Since'] = validators['lastModified']
+    return headers
+
+def _response_validators(url: str, response: "requests.Response", digest) -> Dict:
+    """응답 헤더와 본문 해시로 다운로드 검증자를 만듭니다."""
+    return {
+        "url": url,
+        "etag": response.headers.get('ETag', ''),
+        "lastModified": response.headers.get('Last-Modified', ''),
+        "sha256": digest.hexdigest()
+    }
+
+def download_sanctions_file(url: str, output_file: str, validators: Optional[Dict] = None,
+                            source: str = "") -> Tuple[Optional[str], Dict]:
+    """제재 데이터를 임시 파일로 다운로드하고 (파일 경로, 검증자)를 반환합니다.
+    
+    이전 검증자(ETag, Last-Modified)가 있고 임시 파일이 남아 있으면 조건부 요청을 보냅니다.
+    304 응답이면 기존 임시 파일과 이전 검증자를 그대로 반환합니다.
+    전송이 중간에 끊기면 다음 시도에서 HTTP Range로 받은 지점부터 이어받습니다.
+    반환된 검증자의 sha256을 이전 값과 비교하면 원본 변경 여부를 알 수 있습니다.
+    받은 바이트 수는 실행 지표(download_bytes)에 source 레이블로 기록합니다.
+    """
+    import requests
+    
+    validators = validators or {}
+    temp_file_path = os.path.join(TEMP_DIR, output_file)
+    part_file_path = f"{temp_file_path}.part"
+    session = get_http_session()
+    
+    digest = hashlib.sha256()
+    received = 0
+    first_response = None
+    
     for attempt in range(MAX_RETRIES):
+        if received:
+            # 이어받기: 압축 없이 요청해야 바이트 위치가 파일과 일치
+            headers = {'Range': f'bytes={received}-', 'Accept-Encoding': 'identity'}
+            if first_response is not None and first_response.headers.get('ETag'):
+                headers['If-Range'] = first_response.headers['ETag']
+        else:
+            headers = _conditional_headers(url, validators, temp_file_path)
+        
         try:
-            response = requests.get(
-                url,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    'Accept': 'application/xml,text/xml,*/*',
-                },
-                timeout=REQUEST_TIMEOUT,
-                stream=True
-            )
-            response.raise_for_status()
-            
-            # XML 임시 파일 저장
-            temp_file_path = os.path.join(TEMP_DIR, output_file)
-            with open(temp_file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=1024*1024):
-                    if chunk:
-                        f.write(chunk)
-                        
-                        # 주기적으로 메모리 확인
-                        if get_memory_usage() > MAX_MEMORY_PERCENT:
-                            gc.collect()
+            with session.get(url, headers=headers, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if response.status_code == 304:
+                    logger.info(f"제재 데이터 변경 없음 (304): {output_file}")
+                    return temp_file_path, dict(validators)
                 
-            logger.info(f"제재 데이터 다운로드 완료: {output_file}")
-            
-            # 파일 내용 반환
-            with open(temp_file_path, 'rb') as f:
-                return f.read()
+                response.raise_for_status()
+                
+                if response.status_code != 206:
+                    # 전체 응답 - 처음부터 다시 받음
+                    received = 0
+                    digest = hashlib.sha256()
+                    first_response = response
                 
+                # 임시 파일 저장 (저장하면서 해시 계산, gzip/deflate는 자동 해제)
+                with open(part_file_path, 'ab' if received else 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        received += len(chunk)
+            
+            os.replace(part_file_path, temp_file_path)
+            metrics.add("download_bytes", received, source=source)
+            logger.info(f"제재 데이터 다운로드 완료: {output_file} ({received} bytes)")
+            return temp_file_path, _response_validators(url, first_response, digest)
+        
         except requests.exceptions.RequestException as e:
             logger.error(f"다운로드 시도 {attempt + 1}/{MAX_RETRIES} 실패: {str(e)}")
             if attempt < MAX_RETRIES - 1:
                 time.sleep(RETRY_DELAY)
-    return None
+    
+    if os.path.exists(part_file_path):
+        os.remove(part_file_path)
+    return None, {}
+
+class ResponseStream(io.RawIOBase):
+    """HTTP 응답 본문을 파서에 바로 넘기는 읽기 전용 파일 객체
+    
+    읽힌 본문은 임시 파일과 SHA-256에 함께 기록되어 조건부 요청과 재파싱에 사용됩니다.
+    본문을 끝까지 읽으면 on_complete에 검증자를 전달합니다.
+    """
+    
+    def __init__(self, url: str, response: "requests.Response", temp_file_path: str,
+                 on_complete: Callable[[Dict], None], source: str = ""):
+        super().__init__()
+        self._url = url
+        self._response = response
+        self._chunks = response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        self._pending = memoryview(b'')
+        self._temp_file_path = temp_file_path
+        self._part_file = open(f"{temp_file_path}.part", 'wb')
+        self._digest = hashlib.sha256()
+        self._on_complete = on_complete
+        self._source = source
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._finish()
+                return 0
+            self._part_file.write(chunk)
+            self._digest.update(chunk)
+            metrics.add("download_bytes", len(chunk), source=self._source)
+            self._pending = memoryview(chunk)
+        
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+    
+    def _finish(self) -> None:
+        """본문을 끝까지 읽었을 때 임시 파일을 확정합니다."""
+        if self._part_file.closed:
+            return
+        self._part_file.close()
+        os.replace(f"{self._temp_file_path}.part", self._temp_file_path)
+        self._on_complete(_response_validators(self._url, self._response, self._digest))
+    
+    def close(self) -> None:
+        if not self._part_file.closed:
+            # 끝까지 읽지 못한 본문은 버림
+            self._part_file.close()
+            os.remove(f"{self._temp_file_path}.part")
+        self._response.close()
+        super().close()
+
+def open_source_file(path: str) -> IO[bytes]:
+    """다운로드된 파일을 엽니다. ZIP 파일이면 안의 첫 번째 XML 항목을 스트림으로 엽니다."""
+    if zipfile.is_zipfile(path):
+        archive = zipfile.ZipFile(path)
+        names = [name for name in archive.namelist() if name.lower().endswith('.xml')]
+        if not names:
+            archive.close()
+            raise ValueError(f"ZIP 파일에 XML 항목 없음: {path}")
+        return archive.open(names[0])
+    return open(path, 'rb')
+
+def download_sanctions_data(url: str, output_file: str) -> Optional[bytes]:
+    """제재 데이터를 다운로드합니다."""
+    temp_file_path, _ = download_sanctions_file(url, output_file)
+    if temp_file_path is None:
+        return None
+    
+    # 파일 내용 반환
+    with open(temp_file_path, 'rb') as f:
+        return f.read()
+
+def xml_namespace(tag: str) -> Optional[str]:
+    """'{uri}name' 형식의 태그에서 네임스페이스 URI를 반환합니다."""
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else None
+
+def iter_xml_elements(source: Union[str, IO[bytes]], tags: Iterable[str]) -> Iterator[Tuple[str, ET.Element]]:
+    """iterparse로 XML을 스트리밍하며 지정한 태그의 완성된 요소를 하나씩 반환합니다.
+    
+    반환된 요소는 호출자가 처리한 뒤 비워지고 부모에서 제거되므로,
+    원본 크기와 관계없이 메모리 사용량이 일정하게 유지됩니다.
+    """
+    tags = set(tags)
+    parents = []
+    for event, element in ET.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            parents.append(element)
+            continue
+        
+        parents.pop()
+        local_name = element.tag.rsplit('}', 1)[-1]
+        if local_name in tags:
+            yield local_name, element
+            element.clear()
+            # 처리가 끝난 형제 요소를 부모에서 제거
+            if parents:
+                del parents[-1][:]
+
+def source_output_path(source: str, output_format: str = OUTPUT_FORMAT) -> str:
+    """소스별 출력 파일 경로를 반환합니다."""
+    extension = 'ndjson' if output_format == 'ndjson' else 'json'
+    return os.path.join(OUTPUT_DIR, f"{source.lower()}_sanctions.{extension}")
+
+def delta_output_path(source: str) -> str:
+    """소스별(또는 통합 결과) 변경분 파일 경로를 반환합니다."""
+    return os.path.join(OUTPUT_DIR, f"{source.lower()}_delta.json")
 
-def save_to_json(sanctions: List[Dict], source: str) -> bool:
-    """제재 데이터를 JSON 파일로 저장합니다."""
+def save_delta(tracker: DeltaTracker, source: str, meta: Dict) -> None:
+    """이전 결과 대비 변경분을 계산해 변경분 파일로 저장합니다. 이전 결과 파일을 교체하기 전에 호출합니다."""
     try:
-        output_file = os.path.join(OUTPUT_DIR, f"{source.lower()}_sanctions.json")
-        
-        data = {
-            "meta": {
-                "source": source,
-                "count": len(sanctions),
-                "timestamp": datetime.now().isoformat()
-            },
-            "data": sanctions
-        }
-        
-        # 메모리 사용량 확인
-        if get_memory_usage() > MAX_MEMORY_PERCENT:
-            # 청크 단위로 처리
-            logger.info(f"대량 데이터({len(sanctions)}개)를 청크 단위로 저장합니다.")
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('{\n')
-                f.write(f'"meta": {json.dumps(data["meta"], ensure_ascii=False)},\n')
-                f.write('"data": [\n')
-            
-            # 데이터를 청크 단위로 쓰기
-            for i in range(0, len(sanctions), CHUNK_SIZE):
-                chunk = sanctions[i:i+CHUNK_SIZE]
-                with open(output_file, 'a', encoding='utf-8') as f:
-                    chunk_str = json.dumps(chunk, ensure_ascii=False)[1:-1]
-                    if i > 0:
-                        chunk_str = ',' + chunk_str
-                    if i + CHUNK_SIZE < len(sanctions):
-                        chunk_str = chunk_str + ','
-                    f.write(chunk_str + '\n')
-                gc.collect()
-            
-            # 파일 마무리
-            with open(output_file, 'a', encoding='utf-8') as f:
-                f.write(']\n}')
+        delta = tracker.delta()
+        write_delta(delta_output_path(source), delta, meta)
+        if delta["full"]:
+            logger.info(f"{source} 이전 결과 없음, 전체 갱신으로 기록")
         else:
-            # 일반적인 방식으로 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            logger.info(f"{source} 변경 사항: 추가 {len(delta['added'])}개, "
+                        f"삭제 {len(delta['removed'])}개, 수정 {len(delta['modified'])}개")
+    finally:
+        tracker.close()
+
+def previous_records(path: str) -> Optional[Callable[[], Iterator[Dict]]]:
+    """이전 결과 파일이 있으면 그 항목을 읽는 함수를 반환합니다. (DeltaTracker용)"""
+    if not os.path.exists(path):
+        return None
+    return lambda: read_records(path)
+
+def write_records(f: IO[str], records: Iterable[Dict], meta: Dict, output_format: str = OUTPUT_FORMAT) -> int:
+    """항목을 하나씩 직렬화하여 파일에 기록하고 기록한 항목 수를 반환합니다.
+    
+    'json'은 {"data": [...], "meta": {...}} 형식의 압축 JSON, 'ndjson'은 한 줄에 한 항목을
+    쓰고 마지막 줄에 {"meta": {...}}를 씁니다. 항목 수는 모두 기록한 뒤 meta["count"]에 들어갑니다.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    count = 0
+    
+    if output_format == 'ndjson':
+        for record in records:
+            f.write(encode(record))
+            f.write('\n')
+            count += 1
+        f.write(encode({"meta": dict(meta, count=count)}))
+        f.write('\n')
+        return count
+    
+    f.write('{"data":[')
+    for record in records:
+        if count:
+            f.write(',')
+        f.write(encode(record))
+        count += 1
+    f.write('],"meta":')
+    f.write(encode(dict(meta, count=count)))
+    f.write('}')
+    return count
+
+def read_records(path: str) -> Iterator[Dict]:
+    """write_records로 저장한 JSON 또는 NDJSON 파일의 항목을 읽습니다."""
+    if path.endswith('.ndjson'):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if "meta" not in record:
+                        yield record
+        return
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        yield from _iter_json_data(f)
+
+_DATA_ARRAY_START = re.compile(r'"data"\s*:\s*\[')
+
+def _iter_json_data(f: IO[str]) -> Iterator[Dict]:
+    """{"data": [...]} 형식 JSON 파일의 data 배열 항목을 전체 파일을 올리지 않고 하나씩 읽습니다."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    
+    # data 배열 시작 위치 찾기
+    while True:
+        match = _DATA_ARRAY_START.search(buffer)
+        if match:
+            buffer = buffer[match.end():]
+            break
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            return
+        buffer += chunk
+    
+    position = 0
+    eof = False
+    while True:
+        # 항목 사이의 공백과 쉼표 건너뛰기
+        while position < len(buffer) and buffer[position] in ' \t\r\n,':
+            position += 1
+        
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        
+        if position < len(buffer):
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield record
+                position = end
+                continue
+        elif eof:
+            raise ValueError("JSON data 배열이 닫히지 않았습니다.")
+        
+        # 항목이 잘렸거나 버퍼가 비었음 - 다음 청크 읽기
+        buffer = buffer[position:]
+        position = 0
+        chunk = f.read(READ_CHUNK_SIZE)
+        if chunk:
+            buffer += chunk
+        else:
+            eof = True
+
+def save_to_json(sanctions: Iterable[Dict], source: str, output_format: str = OUTPUT_FORMAT,
+                 unchanged: Optional[Callable[[], bool]] = None) -> bool:
+    """제재 데이터를 JSON(또는 NDJSON) 파일로 저장합니다.
+    
+    리스트뿐 아니라 스트리밍 파서가 반환하는 이터레이터도 받을 수 있으며, 항목을 하나씩
+    버퍼링된 단일 파일 핸들로 기록하므로 메모리 사용량이 항목 수와 무관합니다.
+    임시 파일에 쓴 뒤 교체하므로 항목이 없거나 실패하면 기존 파일이 유지됩니다.
+    각 항목에 이름 정규화 결과(normalized)와 내용 해시(contentHash)를 기록하고
+    이전 결과 대비 변경분을 {source}_delta.json에 저장합니다.
+    unchanged가 주어지면 모든 항목을 읽은 뒤 호출하여, 참이면(원본 본문이 이전 저장본과 같으면)
+    새로 쓴 파일을 버리고 기존 출력과 변경분 파일을 그대로 둡니다.
+    """
+    output_file = source_output_path(source, output_format)
+    temp_file = f"{output_file}.tmp"
+    start_time = time.perf_counter()
+    tracker = None
+    try:
+        # 항목별 이름 정규화 결과와 내용 해시를 기록하며 이전 결과와 비교
+        # (스트리밍 파서의 항목 생성 시간은 파싱, 나머지는 저장 시간으로 기록)
+        parsed = TimedRecords(sanctions)
+        tracker = DeltaTracker(previous_records(output_file), TEMP_DIR)
+        with open(temp_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            meta = {"source": source, "timestamp": datetime.now().isoformat()}
+            count = write_records(f, tracker.track(map(normalize_record, parsed), meta), meta, output_format)
+        
+        if count == 0:
+            os.remove(temp_file)
+            logger.error(f"{source} 제재 데이터 없음")
+            return False
+        
+        if unchanged is not None and unchanged():
+            os.remove(temp_file)
+            logger.info(f"{source} 원본 내용 변경 없음, 기존 저장본 유지")
+            return True
+        
+        save_delta(tracker, source, meta)
+        os.replace(temp_file, output_file)
         
-        logger.info(f"{source} 제재 데이터 저장 완료: {len(sanctions)}개 항목")
+        elapsed = time.perf_counter() - start_time
+        metrics.add("stage_duration_seconds", parsed.seconds, stage="parse", source=source)
+        metrics.add("stage_duration_seconds", elapsed - parsed.seconds, stage="save", source=source)
+        metrics.record_throughput("save", source, count, elapsed)
+        logger.info(f"{source} 제재 데이터 저장 완료: {count}개 항목")
         return True
     except Exception as e:
         logger.error(f"{source} 제재 데이터 저장 실패: {str(e)}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
         return False
+    finally:
+        # 변경분 임시 파일 정리 (저장을 건너뛰거나 실패한 경우)
+        if tracker is not None:
+            tracker.close()
 
 class SanctionsCollector(ABC):
     """제재 데이터 수집기 추상 클래스"""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, display_name: Optional[str] = None):
         self._source_name = source_name
+        self._display_name = display_name or source_name
         self.logger = logger
+        self._temp_file = f"{self.source_id}_sanctions.xml"
+        self._validators = {}
+        self._unchanged = False
+        ensure_directories()
     
+    @property
     @abstractmethod
-    def collect(self) -> bool:
-        """제재 데이터를 수집합니다."""
+    def source_urls(self) -> List[str]:
+        """시도할 원본 URL 목록을 우선순위 순서로 반환합니다."""
+        pass
+    
+    @abstractmethod
+    def parse_tree(self, xml_data: bytes) -> List[Dict]:
+        """전체 XML을 fromstring으로 한 번에 파싱합니다. (스트리밍 파싱의 대체 경로)"""
+        pass
+    
+    @abstractmethod
+    def iter_records(self, source: Union[str, IO[bytes]]) -> Iterator[Dict]:
+        """XML을 iterparse로 스트리밍 파싱하며 통합 형식 항목을 하나씩 반환합니다."""
         pass
     
+    def fetch(self) -> Optional[str]:
+        """원본 제재 데이터를 임시 파일로 다운로드하고 경로를 반환합니다. 실패 시 대체 URL을 시도합니다."""
+        with metrics.timer("download", self.source_id):
+            for index, url in enumerate(self.source_urls):
+                if index > 0:
+                    logger.warning(f"{self._display_name} 제재 데이터 다운로드 실패, 대체 URL 시도: {url}")
+                source_file = self.download_file(url)
+                if source_file is not None:
+                    return source_file
+        return None
+    
+    def fetch_stream(self) -> Optional[IO[bytes]]:
+        """원본 제재 데이터를 파서에 바로 넘길 스트림으로 엽니다. 실패 시 대체 URL을 시도합니다.
+        
+        ZIP 원본은 중앙 디렉터리가 파일 끝에 있어 스트리밍할 수 없으므로 임시 파일로 받은 뒤 엽니다.
+        """
+        for index, url in enumerate(self.source_urls):
+            if index > 0:
+                logger.warning(f"{self._display_name} 제재 데이터 다운로드 실패, 대체 URL 시도: {url}")
+            if url.lower().endswith('.zip'):
+                source_file = self.download_file(url)
+                stream = open_source_file(source_file) if source_file else None
+            else:
+                stream = self.open_stream(url)
+            if stream is not None:
+                return stream
+        return None
+    
+    def choose_parse_mode(self, size: Optional[int]) -> str:
+        """설정된 파싱 방식(PARSE_MODE)과 메모리 예산으로 실제 파싱 방식을 결정합니다.
+        
+        'tree'는 원본 크기에 비례하는 메모리를 쓰므로, 메모리 한도가 있을 때 작업 메모리가 한도를 넘거나
+        원본 크기를 알 수 없으면 'stream'으로 전환합니다. 다른 작업의 예약과 무관하게 결정하므로
+        같은 입력과 한도에서는 항상 같은 방식을 사용합니다.
+        """
+        if PARSE_MODE != 'tree' or memory_budget.limit is None:
+            return PARSE_MODE
+        if size is not None and memory_budget.within_limit(parse_working_set('tree', size)):
+            return 'tree'
+        logger.warning(f"{self._display_name} 메모리 한도 부족, 스트리밍 파싱으로 전환 ({memory_budget.describe()})")
+        metrics.add("parse_mode_fallback", 1, source=self.source_id)
+        return 'stream'
+    
+    def parse_to_file(self, source_file: str, parse_mode: Optional[str] = None) -> bool:
+        """다운로드된 파일을 스트리밍 파싱하여 바로 JSON으로 저장합니다. (검증자는 확정하지 않음)
+        
+        파싱과 저장을 한 프로세스에서 처리하므로 파싱 결과를 다른 프로세스로 넘길 필요가 없습니다.
+        parse_mode를 지정하지 않으면 파일 크기와 메모리 예산으로 결정합니다.
+        """
+        if parse_mode is None:
+            parse_mode = self.choose_parse_mode(os.path.getsize(source_file))
+        if parse_mode == 'tree':
+            with metrics.timer("parse", self.source_id):
+                sanctions = self.parse(source_file)
+            return save_to_json(sanctions, self.source_id)
+        with open_source_file(source_file) as stream:
+            return save_to_json(self.iter_records(stream), self.source_id)
+    
+    def parse(self, source: Union[str, bytes, IO[bytes]]) -> List[Dict]:
+        """원본 제재 데이터를 통합 형식으로 변환합니다.
+        
+        source는 다운로드된 파일 경로(XML 또는 ZIP), XML bytes 또는 파일 객체입니다.
+        네트워크에 접근하지 않는 경로 입력은 별도 프로세스에서 실행할 수 있습니다.
+        PARSE_MODE가 'tree'이면 기존 fromstring 경로를 사용합니다.
+        """
+        if isinstance(source, str):
+            with open_source_file(source) as stream:
+                return self.parse(stream)
+        if PARSE_MODE == 'tree' or isinstance(source, bytes):
+            xml_data = source if isinstance(source, bytes) else source.read()
+            return self.parse_tree(xml_data)
+        return list(self.iter_records(source))
+    
+    def collect(self) -> bool:
+        """제재 데이터를 수집합니다. 응답 본문은 임시 파일을 거치지 않고 파서로 바로 전달됩니다."""
+        name = self._display_name
+        logger.info(f"{name} 제재 데이터 수집 시작")
+        
+        # 데이터 다운로드 스트림 열기
+        stream = self.fetch_stream()
+        if stream is None:
+            logger.error(f"{name} 제재 데이터 다운로드 실패")
+            return False
+        
+        try:
+            # 원본 변경 없음 (304) - 기존 출력 재사용
+            if self.is_unchanged():
+                logger.info(f"{name} 제재 데이터 변경 없음, 파싱 및 저장 건너뜀")
+                return True
+            
+            # 스트리밍 파서 출력을 JSON 저장으로 바로 연결 (응답 크기를 알 수 없으므로 예산이 있으면 스트리밍)
+            if self.choose_parse_mode(None) == 'tree':
+                with metrics.timer("parse", self.source_id):
+                    sanctions = self.parse(stream)
+            else:
+                sanctions = self.iter_records(stream)
+            # 본문 해시는 스트림을 다 읽어야 알 수 있으므로 저장 직전에 다시 확인 (200 응답이지만 내용이 같은 경우)
+            return self.save_data(sanctions, unchanged=lambda: self._stream_unchanged(stream))
+        except Exception as e:
+            logger.error(f"{name} 제재 데이터 파싱 실패: {str(e)}")
+            logger.error(traceback.format_exc())
+            return False
+        finally:
+            stream.close()
+    
     @property
     def source_id(self) -> str:
         """소스 ID를 반환합니다."""
         return self._source_name.lower()
     
+    def record_skipped(self) -> None:
+        """유효하지 않아 건너뛴 원본 항목을 실행 지표에 기록합니다."""
+        metrics.add("records_skipped", 1, source=self.source_id)
+    
     def download_data(self, url: str) -> Optional[bytes]:
         """데이터를 다운로드합니다."""
         return download_sanctions_data(url, f"{self.source_id}_sanctions.xml")
     
-    def save_data(self, sanctions: List[Dict]) -> bool:
-        """데이터를 저장합니다."""
-        return save_to_json(sanctions, self.source_id)
+    @property
+    def output_file(self) -> str:
+        """JSON(또는 NDJSON) 출력 파일 경로를 반환합니다."""
+        return source_output_path(self.source_id)
+    
+    def _temp_file_for(self, url: str) -> str:
+        """URL에 해당하는 임시 파일 이름을 반환합니다. (ZIP 원본은 별도 파일 사용)"""
+        extension = 'zip' if url.lower().endswith('.zip') else 'xml'
+        return f"{self.source_id}_sanctions.{extension}"
+    
+    def _set_download_result(self, temp_file: str, previous: Dict, validators: Dict) -> None:
+        """다운로드 검증자를 기록하고 이전 저장본과 같은지 판단합니다."""
+        self._temp_file = temp_file
+        self._validators = validators
+        self._unchanged = (
+            bool(previous.get('sha256'))
+            and validators.get('sha256') == previous.get('sha256')
+        )
+    
+    def download_file(self, url: str) -> Optional[str]:
+        """데이터를 임시 파일로 다운로드하고 경로를 반환합니다.
+        
+        이전에 저장에 성공한 다운로드의 검증자로 조건부 요청을 보내고,
+        원본이 바뀌지 않았는지 is_unchanged()로 확인할 수 있게 합니다.
+        """
+        temp_file = self._temp_file_for(url)
+        previous = load_validators(temp_file)
+        file_path, validators = download_sanctions_file(url, temp_file, previous, self.source_id)
+        
+        self._set_download_result(temp_file, previous, validators)
+        return file_path
+    
+    def open_stream(self, url: str) -> Optional[IO[bytes]]:
+        """공유 세션으로 원본을 요청하고 응답 본문을 파일 객체로 반환합니다.
+        
+        304 응답이면 기존 임시 파일을 열고 is_unchanged()가 참이 됩니다.
+        """
+        import requests
         
+        temp_file = self._temp_file_for(url)
+        temp_file_path = os.path.join(TEMP_DIR, temp_file)
+        previous = load_validators(temp_file)
+        self._set_download_result(temp_file, previous, {})
+        
+        try:
+            response = get_http_session().get(
+                url,
+                headers=_conditional_headers(url, previous, temp_file_path),
+                timeout=REQUEST_TIMEOUT,
+                stream=True
+            )
+            if response.status_code == 304:
+                response.close()
+                logger.info(f"제재 데이터 변경 없음 (304): {temp_file}")
+                self._set_download_result(temp_file, previous, dict(previous))
+                return open(temp_file_path, 'rb')
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"다운로드 실패: {url}, 오류: {str(e)}")
+            return None
+        
+        def on_complete(validators: Dict) -> None:
+            self._set_download_result(temp_file, previous, validators)
+            logger.info(f"제재 데이터 다운로드 완료: {temp_file}")
+        
+        return io.BufferedReader(
+            ResponseStream(url, response, temp_file_path, on_complete, self.source_id),
+            buffer_size=DOWNLOAD_CHUNK_SIZE
+        )
+    
+    def is_unchanged(self) -> bool:
+        """마지막 다운로드가 이전 저장본과 같고 기존 출력 파일을 재사용할 수 있는지 확인합니다."""
+        return self._unchanged and os.path.exists(self.output_file)
+    
+    def commit_download(self) -> None:
+        """저장에 성공한 다운로드의 검증자를 확정하여 다음 실행의 조건부 요청에 사용합니다."""
+        if self._validators:
+            save_validators(self._temp_file, self._validators)
+    
+    def _stream_unchanged(self, stream: IO[bytes]) -> bool:
+        """응답 스트림을 끝까지 읽어 본문 해시를 확정한 뒤 이전 저장본과 같은지 확인합니다."""
+        while stream.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        return self.is_unchanged()
+    
+    def save_data(self, sanctions: Iterable[Dict], unchanged: Optional[Callable[[], bool]] = None) -> bool:
+        """데이터를 저장합니다. 저장에 성공하면(내용이 같아 기존 출력을 유지한 경우 포함) 다운로드 검증자를 확정합니다."""
+        saved = save_to_json(sanctions, self.source_id, unchanged=unchanged)
+        if saved:
+            self.commit_download()
+        return saved
+    
     def log_performance_stats(self, start_time: float) -> None:
         """성능 통계를 로깅합니다."""
         elapsed_time = time.time() - start_time
-        memory_percent = get_memory_usage()
         
         self.logger.info(
             f"성능 통계 - 수행 시간: {elapsed_time:.2f}초, "
-            f"메모리 사용량: {memory_percent:.1f}%"
+            f"메모리: {memory_budget.describe()}"
         ) 
\ No newline at end of file
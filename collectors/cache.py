@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+검색 결과 캐시
+같은 이름이 반복해서 조회되는 검색/스크리닝을 위해 정규화한 질의와 필터를 키로 검색 결과를 보관합니다.
+항목마다 계산에 사용한 데이터 버전(통합 결과 meta의 dataVersion)을 기록하고, 새 통합 데이터로 버전이
+바뀌면 이전 버전 항목을 한 번에 무효화합니다.
+
+크기는 항목 수가 아닌 추정 메모리(bytes) 예산으로 제한하며, 예산을 넘으면 가장 오래 쓰지 않은 항목부터
+제거합니다(LRU). 유효 시간(TTL)이 지난 항목은 조회할 때 제거합니다.
+예산은 SANCTIONS_QUERY_CACHE_SIZE(예: 64M, 0이면 사용 안 함), 유효 시간은 SANCTIONS_QUERY_CACHE_TTL(초)로 지정합니다.
+값이 잘못되었으면 경고를 남기고 기본값을 사용합니다.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from collectors.memory import parse_size
+
+QUERY_CACHE_SIZE_ENV = 'SANCTIONS_QUERY_CACHE_SIZE'
+QUERY_CACHE_TTL_ENV = 'SANCTIONS_QUERY_CACHE_TTL'
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024  # 기본 캐시 메모리 예산
+DEFAULT_CACHE_TTL = 3600.0  # 기본 항목 유효 시간 (초, 0이면 만료 없음)
+ENTRY_OVERHEAD_BYTES = 200  # 항목당 고정 비용 (OrderedDict 노드, 버전/만료 시각 튜플)
+
+logger = logging.getLogger("sanctions_collector")
+
+def default_cache_bytes() -> int:
+    """환경 변수로 지정한 캐시 메모리 예산(bytes)을 반환합니다. 값이 잘못되었으면 기본 예산입니다."""
+    try:
+        size = parse_size(os.environ.get(QUERY_CACHE_SIZE_ENV))
+    except ValueError as e:
+        logger.warning(f"{QUERY_CACHE_SIZE_ENV} 무시, 기본 캐시 예산 사용: {str(e)}")
+        return DEFAULT_CACHE_BYTES
+    return DEFAULT_CACHE_BYTES if size is None else size
+
+def default_cache_ttl() -> float:
+    """환경 변수로 지정한 항목 유효 시간(초)을 반환합니다. 값이 잘못되었으면 기본 유효 시간입니다."""
+    value = os.environ.get(QUERY_CACHE_TTL_ENV)
+    if not value or not value.strip():
+        return DEFAULT_CACHE_TTL
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"{QUERY_CACHE_TTL_ENV} 무시, 기본 유효 시간 사용: 잘못된 시간(초): {value}")
+        return DEFAULT_CACHE_TTL
+
+def approximate_size(value: Any) -> int:
+    """값의 대략적인 메모리 크기(bytes)를 반환합니다. 튜플/목록/사전은 원소 크기를 더합니다.
+    
+    공유되는 객체(짧은 문자열, 작은 정수)도 매번 더하므로 실제보다 크게 추정합니다.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (tuple, list, set, frozenset)):
+        size += sum(map(approximate_size, value))
+    elif isinstance(value, dict):
+        size += sum(approximate_size(key) + approximate_size(item) for key, item in value.items())
+    return size
+
+class QueryCache:
+    """데이터 버전으로 무효화하는 메모리 예산 기반 LRU/TTL 검색 결과 캐시 (스레드 안전)"""
+    
+    def __init__(self, max_bytes: Optional[int] = None, ttl: Optional[float] = None,
+                 version: Optional[str] = None):
+        """max_bytes와 ttl을 주지 않으면 환경 변수 또는 기본값을 사용합니다."""
+        self.max_bytes = default_cache_bytes() if max_bytes is None else max_bytes
+        self.ttl = default_cache_ttl() if ttl is None else ttl
+        self.version = version
+        # 키 -> (데이터 버전, 만료 시각, 추정 크기, 값), 앞쪽이 가장 오래 쓰지 않은 항목
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def bytes(self) -> int:
+        """현재 항목의 추정 크기 합"""
+        return self._bytes
+    
+    def set_version(self, version: Optional[str]) -> bool:
+        """현재 데이터 버전을 바꿉니다. 버전이 바뀌면 이전 버전 항목을 모두 무효화하고 True를 반환합니다."""
+        with self._lock:
+            if version == self.version:
+                return False
+            self.version = version
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return True
+    
+    def clear(self) -> None:
+        """항목을 모두 제거합니다. (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """현재 데이터 버전의 유효한 값을 반환합니다. 없으면 None입니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                version, expires, size, value = entry
+                if version == self.version and (expires is None or expires > time.monotonic()):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                # 만료되었거나 이전 버전 항목
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+            self.misses += 1
+            return None
+    
+    def put(self, key: Hashable, value: Any, version: Optional[str] = None) -> bool:
+        """값을 저장하고 저장 여부를 반환합니다.
+        
+        version을 주면 현재 데이터 버전과 같을 때만 저장합니다. (계산 중 데이터가 바뀐 결과 제외)
+        값 하나가 예산보다 크면 저장하지 않습니다.
+        """
+        if self.max_bytes <= 0:
+            return False
+        size = ENTRY_OVERHEAD_BYTES + approximate_size(key) + approximate_size(value)
+        if size > self.max_bytes:
+            return False
+        with self._lock:
+            if version is not None and version != self.version:
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            # 예산을 넘으면 가장 오래 쓰지 않은 항목부터 제거
+            while self._entries and self._bytes + size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[2]
+                self.evictions += 1
+            expires = time.monotonic() + self.ttl if self.ttl > 0 else None
+            self._entries[key] = (self.version, expires, size, value)
+            self._bytes += size
+            return True
+    
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계(항목 수, 추정 크기, 적중률, 제거 수)를 반환합니다."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+국가명 정규화
+소스마다 다르게 기록하는 국가/국적(UN: 'Russian Federation', EU: 'RU', OFAC: 'Russia', 국적 형용사 'Russian')을
+ISO 3166-1 alpha-2 코드로 바꿔 비교할 수 있게 합니다.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Set
+
+# ISO 3166-1 alpha-2 코드 -> 영문 국가명과 흔한 이칭/국적 형용사
+COUNTRY_NAMES: Dict[str, tuple] = {
+    "AD": ("Andorra", "Andorran"),
+    "AE": ("United Arab Emirates", "UAE", "Emirati"),
+    "AF": ("Afghanistan", "Afghan", "Islamic Republic of Afghanistan"),
+    "AG": ("Antigua and Barbuda",),
+    "AL": ("Albania", "Albanian"),
+    "AM": ("Armenia", "Armenian"),
+    "AO": ("Angola", "Angolan"),
+    "AR": ("Argentina", "Argentine", "Argentinian"),
+    "AT": ("Austria", "Austrian"),
+    "AU": ("Australia", "Australian"),
+    "AZ": ("Azerbaijan", "Azerbaijani"),
+    "BA": ("Bosnia and Herzegovina", "Bosnia", "Bosnian"),
+    "BB": ("Barbados",),
+    "BD": ("Bangladesh", "Bangladeshi"),
+    "BE": ("Belgium", "Belgian"),
+    "BF": ("Burkina Faso", "Burkinabe"),
+    "BG": ("Bulgaria", "Bulgarian"),
+    "BH": ("Bahrain", "Bahraini"),
+    "BI": ("Burundi", "Burundian"),
+    "BJ": ("Benin", "Beninese"),
+    "BN": ("Brunei Darussalam", "Brunei"),
+    "BO": ("Bolivia", "Bolivia (Plurinational State of)", "Bolivian"),
+    "BR": ("Brazil", "Brazilian"),
+    "BS": ("Bahamas",),
+    "BT": ("Bhutan",),
+    "BW": ("Botswana",),
+    "BY": ("Belarus", "Belarusian", "Byelorussia"),
+    "BZ": ("Belize",),
+    "CA": ("Canada", "Canadian"),
+    "CD": ("Democratic Republic of the Congo", "Congo, Democratic Republic of the", "DR Congo", "DRC", "Zaire"),
+    "CF": ("Central African Republic", "Central African"),
+    "CG": ("Congo", "Republic of the Congo", "Congo-Brazzaville"),
+    "CH": ("Switzerland", "Swiss"),
+    "CI": ("Cote d'Ivoire", "Ivory Coast", "Ivorian"),
+    "CL": ("Chile", "Chilean"),
+    "CM": ("Cameroon", "Cameroonian"),
+    "CN": ("China", "People's Republic of China", "Chinese"),
+    "CO": ("Colombia", "Colombian"),
+    "CR": ("Costa Rica",),
+    "CU": ("Cuba", "Cuban"),
+    "CV": ("Cabo Verde", "Cape Verde"),
+    "CY": ("Cyprus", "Cypriot"),
+    "CZ": ("Czechia", "Czech Republic", "Czech"),
+    "DE": ("Germany", "German"),
+    "DJ": ("Djibouti",),
+    "DK": ("Denmark", "Danish"),
+    "DM": ("Dominica",),
+    "DO": ("Dominican Republic", "Dominican"),
+    "DZ": ("Algeria", "Algerian"),
+    "EC": ("Ecuador", "Ecuadorian"),
+    "EE": ("Estonia", "Estonian"),
+    "EG": ("Egypt", "Egyptian"),
+    "ER": ("Eritrea", "Eritrean"),
+    "ES": ("Spain", "Spanish"),
+    "ET": ("Ethiopia", "Ethiopian"),
+    "FI": ("Finland", "Finnish"),
+    "FJ": ("Fiji",),
+    "FR": ("France", "French"),
+    "GA": ("Gabon", "Gabonese"),
+    "GB": ("United Kingdom", "United Kingdom of Great Britain and Northern Ireland", "UK", "Great Britain", "British"),
+    "GE": ("Georgia", "Georgian"),
+    "GH": ("Ghana", "Ghanaian"),
+    "GM": ("Gambia", "Gambian"),
+    "GN": ("Guinea", "Guinean"),
+    "GQ": ("Equatorial Guinea",),
+    "GR": ("Greece", "Greek"),
+    "GT": ("Guatemala", "Guatemalan"),
+    "GW": ("Guinea-Bissau", "Bissau-Guinean"),
+    "GY": ("Guyana",),
+    "HK": ("Hong Kong", "China, Hong Kong Special Administrative Region"),
+    "HN": ("Honduras", "Honduran"),
+    "HR": ("Croatia", "Croatian"),
+    "HT": ("Haiti", "Haitian"),
+    "HU": ("Hungary", "Hungarian"),
+    "ID": ("Indonesia", "Indonesian"),
+    "IE": ("Ireland", "Irish"),
+    "IL": ("Israel", "Israeli"),
+    "IN": ("India", "Indian"),
+    "IQ": ("Iraq", "Iraqi"),
+    "IR": ("Iran", "Iran (Islamic Republic of)", "Islamic Republic of Iran", "Iranian"),
+    "IS": ("Iceland", "Icelandic"),
+    "IT": ("Italy", "Italian"),
+    "JM": ("Jamaica", "Jamaican"),
+    "JO": ("Jordan", "Jordanian"),
+    "JP": ("Japan", "Japanese"),
+    "KE": ("Kenya", "Kenyan"),
+    "KG": ("Kyrgyzstan", "Kyrgyz"),
+    "KH": ("Cambodia", "Cambodian"),
+    "KM": ("Comoros", "Comorian"),
+    "KN": ("Saint Kitts and Nevis",),
+    "KP": ("Democratic People's Republic of Korea", "North Korea", "Korea, North", "DPRK", "North Korean"),
+    "KR": ("Republic of Korea", "South Korea", "Korea, South", "South Korean"),
+    "KW": ("Kuwait", "Kuwaiti"),
+    "KZ": ("Kazakhstan", "Kazakh", "Kazakhstani"),
+    "LA": ("Lao People's Democratic Republic", "Laos", "Lao"),
+    "LB": ("Lebanon", "Lebanese"),
+    "LI": ("Liechtenstein",),
+    "LK": ("Sri Lanka", "Sri Lankan"),
+    "LR": ("Liberia", "Liberian"),
+    "LT": ("Lithuania", "Lithuanian"),
+    "LU": ("Luxembourg",),
+    "LV": ("Latvia", "Latvian"),
+    "LY": ("Libya", "Libyan", "Libyan Arab Jamahiriya"),
+    "MA": ("Morocco", "Moroccan"),
+    "MC": ("Monaco",),
+    "MD": ("Republic of Moldova", "Moldova", "Moldovan"),
+    "ME": ("Montenegro", "Montenegrin"),
+    "MG": ("Madagascar",),
+    "MH": ("Marshall Islands",),
+    "MK": ("North Macedonia", "Macedonia", "Macedonian"),
+    "ML": ("Mali", "Malian"),
+    "MM": ("Myanmar", "Burma", "Burmese"),
+    "MN": ("Mongolia", "Mongolian"),
+    "MR": ("Mauritania", "Mauritanian"),
+    "MT": ("Malta", "Maltese"),
+    "MU": ("Mauritius",),
+    "MV": ("Maldives", "Maldivian"),
+    "MW": ("Malawi",),
+    "MX": ("Mexico", "Mexican"),
+    "MY": ("Malaysia", "Malaysian"),
+    "MZ": ("Mozambique",),
+    "NA": ("Namibia", "Namibian"),
+    "NE": ("Niger", "Nigerien"),
+    "NG": ("Nigeria", "Nigerian"),
+    "NI": ("Nicaragua", "Nicaraguan"),
+    "NL": ("Netherlands", "Kingdom of the Netherlands", "Dutch"),
+    "NO": ("Norway", "Norwegian"),
+    "NP": ("Nepal", "Nepalese"),
+    "NZ": ("New Zealand",),
+    "OM": ("Oman", "Omani"),
+    "PA": ("Panama", "Panamanian"),
+    "PE": ("Peru", "Peruvian"),
+    "PG": ("Papua New Guinea",),
+    "PH": ("Philippines", "Filipino"),
+    "PK": ("Pakistan", "Pakistani"),
+    "PL": ("Poland", "Polish"),
+    "PS": ("State of Palestine", "Palestine", "Palestinian", "Occupied Palestinian Territory"),
+    "PT": ("Portugal", "Portuguese"),
+    "PY": ("Paraguay", "Paraguayan"),
+    "QA": ("Qatar", "Qatari"),
+    "RO": ("Romania", "Romanian"),
+    "RS": ("Serbia", "Serbian"),
+    "RU": ("Russian Federation", "Russia", "Russian"),
+    "RW": ("Rwanda", "Rwandan"),
+    "SA": ("Saudi Arabia", "Saudi"),
+    "SC": ("Seychelles",),
+    "SD": ("Sudan", "Sudanese"),
+    "SE": ("Sweden", "Swedish"),
+    "SG": ("Singapore", "Singaporean"),
+    "SI": ("Slovenia", "Slovenian"),
+    "SK": ("Slovakia", "Slovak"),
+    "SL": ("Sierra Leone", "Sierra Leonean"),
+    "SN": ("Senegal", "Senegalese"),
+    "SO": ("Somalia", "Somali"),
+    "SR": ("Suriname",),
+    "SS": ("South Sudan", "South Sudanese"),
+    "SV": ("El Salvador", "Salvadoran"),
+    "SY": ("Syrian Arab Republic", "Syria", "Syrian"),
+    "SZ": ("Eswatini", "Swaziland"),
+    "TD": ("Chad", "Chadian"),
+    "TG": ("Togo", "Togolese"),
+    "TH": ("Thailand", "Thai"),
+    "TJ": ("Tajikistan", "Tajik"),
+    "TL": ("Timor-Leste", "East Timor"),
+    "TM": ("Turkmenistan", "Turkmen"),
+    "TN": ("Tunisia", "Tunisian"),
+    "TR": ("Turkiye", "Turkey", "Turkish"),
+    "TT": ("Trinidad and Tobago",),
+    "TW": ("Taiwan", "Taiwanese"),
+    "TZ": ("United Republic of Tanzania", "Tanzania", "Tanzanian"),
+    "UA": ("Ukraine", "Ukrainian"),
+    "UG": ("Uganda", "Ugandan"),
+    "US": ("United States of America", "United States", "USA", "American"),
+    "UY": ("Uruguay", "Uruguayan"),
+    "UZ": ("Uzbekistan", "Uzbek"),
+    "VE": ("Venezuela", "Venezuela (Bolivarian Republic of)", "Venezuelan"),
+    "VG": ("British Virgin Islands", "Virgin Islands (British)"),
+    "VN": ("Viet Nam", "Vietnam", "Vietnamese"),
+    "YE": ("Yemen", "Yemeni"),
+    "ZA": ("South Africa", "South African"),
+    "ZM": ("Zambia", "Zambian"),
+    "ZW": ("Zimbabwe", "Zimbabwean"),
+}
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+def _country_key(value: str) -> str:
+    """비교용 국가명 키 (악센트/구두점 제거, 소문자, 앞의 'the' 제거)"""
+    text = unicodedata.normalize('NFKD', value)
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    key = _NON_WORD.sub(' ', text.casefold()).strip()
+    return key[4:] if key.startswith('the ') else key
+
+_COUNTRY_KEYS = {_country_key(name): code for code, names in COUNTRY_NAMES.items() for name in names}
+
+@lru_cache(maxsize=4096)
+def country_code(value: str) -> Optional[str]:
+    """국가명/국적/alpha-2 코드를 ISO 3166-1 alpha-2 코드로 반환합니다. 알 수 없으면 None입니다.
+    
+    두 글자 코드는 대문자일 때만 인정합니다. (UN 목록의 'na'(해당 없음)를 나미비아로 읽지 않도록)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if len(value) == 2 and value.isupper():
+        return value if value in COUNTRY_NAMES else None
+    return _COUNTRY_KEYS.get(_country_key(value))
+
+def country_codes(values: Iterable[str]) -> Set[str]:
+    """국가명 목록 중 코드로 바꿀 수 있는 값의 코드 집합을 반환합니다."""
+    return {code for code in map(country_code, values) if code}
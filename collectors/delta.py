@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 변경분(delta) 계산
+항목별 내용 해시로 이전 실행 결과와 비교하여 추가/삭제/수정된 항목과 필드 단위 변경 사항을 구합니다.
+추가/수정된 항목은 임시 파일(RecordStore)에 두고 메모리에는 ID만 남기므로 변경 규모와 무관하게 메모리가 일정합니다.
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, Optional, Iterable, Iterator, Callable, Any
+
+from collectors.normalize import NORMALIZED_FIELD
+from collectors.spill import RecordStore
+
+HASH_FIELD = "contentHash"  # 항목에 기록하는 내용 해시 필드
+# 원본 내용에서 계산되는 파생 필드 (내용 해시와 변경 비교에서 제외)
+DERIVED_FIELDS = frozenset([HASH_FIELD, NORMALIZED_FIELD])
+HASH_DIGEST_SIZE = 16  # 내용 해시 크기 (bytes)
+VERSION_MODULUS = 1 << (HASH_DIGEST_SIZE * 8)
+
+_canonical = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode
+_compact = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+def record_hash(record: Dict) -> str:
+    """항목의 내용 해시를 반환합니다. 키 순서와 파생 필드(내용 해시, 이름 정규화 결과)는 결과에 영향을 주지 않습니다.
+    
+    정규화 규칙이 바뀌어도 원본 내용이 같으면 같은 해시이므로 모든 항목이 수정으로 기록되지 않습니다.
+    """
+    content = {key: value for key, value in record.items() if key not in DERIVED_FIELDS}
+    return hashlib.blake2b(_canonical(content).encode('utf-8'), digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+def field_changes(old: Dict, new: Dict) -> Dict[str, Dict[str, Any]]:
+    """두 항목의 필드 단위 변경 사항을 {필드: {"old": 이전 값, "new": 새 값}} 형식으로 반환합니다.
+    
+    details는 하위 필드별로 비교하여 "details.aliases"처럼 기록합니다.
+    """
+    changes = {}
+    for key in dict.fromkeys([*old, *new]):
+        if key in DERIVED_FIELDS:
+            continue
+        old_value, new_value = old.get(key), new.get(key)
+        if old_value == new_value:
+            continue
+        if key == "details" and isinstance(old_value, dict) and isinstance(new_value, dict):
+            for sub_key, change in field_changes(old_value, new_value).items():
+                changes[f"details.{sub_key}"] = change
+        else:
+            changes[key] = {"old": old_value, "new": new_value}
+    return changes
+
+class DeltaTracker:
+    """저장되는 항목에 내용 해시를 부여하고 이전 결과와의 변경분을 계산합니다."""
+    
+    def __init__(self, previous: Optional[Callable[[], Iterable[Dict]]] = None, directory: Optional[str] = None):
+        """previous는 이전 실행 결과 항목을 읽는 함수입니다. 없으면 전체 갱신으로 취급합니다.
+        
+        directory는 추가/수정된 항목을 둘 임시 파일의 위치입니다.
+        """
+        self._previous = previous
+        self._directory = directory
+        self._previous_hashes = {}
+        self.base_version = None
+        if previous is not None:
+            total = 0
+            for record in previous():
+                content_hash = record.get(HASH_FIELD) or record_hash(record)
+                self._previous_hashes[record["id"]] = content_hash
+                total += int(content_hash, 16)
+            self.base_version = self._format_version(total)
+        
+        self.version = None
+        self._seen = set()
+        self._added: Optional[RecordStore] = None
+        self._modified: Optional[RecordStore] = None
+    
+    @staticmethod
+    def _format_version(total: int) -> str:
+        """항목 해시 합으로 데이터 버전 문자열을 만듭니다. (항목 순서와 무관)"""
+        return format(total % VERSION_MODULUS, f"0{HASH_DIGEST_SIZE * 2}x")
+    
+    def track(self, records: Iterable[Dict], meta: Optional[Dict] = None) -> Iterator[Dict]:
+        """항목에 내용 해시를 기록하며 그대로 전달합니다.
+        
+        모든 항목을 전달한 뒤 meta["dataVersion"]에 데이터 버전을 기록하므로, 항목을 모두 쓴 뒤
+        meta를 직렬화하는 write_records에 넘기면 출력 파일 meta에도 버전이 포함됩니다.
+        """
+        total = 0
+        for record in records:
+            content_hash = record_hash(record)
+            record[HASH_FIELD] = content_hash
+            total += int(content_hash, 16)
+            
+            record_id = record["id"]
+            # 같은 ID가 다시 나오면 처음 항목만 변경분에 기록
+            if self._previous is not None and record_id not in self._seen:
+                previous_hash = self._previous_hashes.get(record_id)
+                if previous_hash is None:
+                    self._added = self._spill(self._added, record)
+                elif previous_hash != content_hash:
+                    self._modified = self._spill(self._modified, record)
+            self._seen.add(record_id)
+            yield record
+        
+        self.version = self._format_version(total)
+        if meta is not None:
+            meta["dataVersion"] = self.version
+    
+    def _spill(self, store: Optional[RecordStore], record: Dict) -> RecordStore:
+        """항목을 임시 파일 목록에 추가합니다. (첫 변경 항목에서 임시 파일 생성)"""
+        if store is None:
+            store = RecordStore(spill=True, directory=self._directory)
+        store.append(record)
+        return store
+    
+    def delta(self) -> Dict:
+        """이전 결과 대비 변경분을 반환합니다. 이전 결과 파일이 교체되기 전에 호출해야 합니다.
+        
+        added는 임시 파일의 항목 목록(Sequence)이므로 write_delta로 기록한 뒤 close()를 호출해야 합니다.
+        """
+        if self._previous is None:
+            return {"full": True, "baseDataVersion": None, "added": [], "removed": [], "modified": []}
+        
+        # 수정된 항목만 이전 결과에서 다시 읽어 필드 단위로 비교
+        # (이전 해시에 파생 필드가 포함되어 있었으면 실제 변경이 없을 수 있으므로 변경 없는 항목은 제외)
+        modified = []
+        if self._modified is not None:
+            for old in self._previous():
+                index = self._modified.find(old["id"])
+                if index is not None:
+                    changes = field_changes(old, self._modified[index])
+                    if changes:
+                        modified.append({"id": old["id"], "changes": changes})
+        
+        removed = [record_id for record_id in self._previous_hashes if record_id not in self._seen]
+        return {
+            "full": False,
+            "baseDataVersion": self.base_version,
+            "added": self._added if self._added is not None else [],
+            "removed": removed,
+            "modified": modified
+        }
+    
+    def close(self) -> None:
+        """추가/수정된 항목의 임시 파일을 삭제합니다."""
+        for store in (self._added, self._modified):
+            if store is not None:
+                store.close()
+        self._added = self._modified = None
+
+def data_version(records: Iterable[Dict]) -> str:
+    """항목의 내용 해시 합으로 데이터 버전을 계산합니다. (DeltaTracker가 meta["dataVersion"]에 기록하는 값과 같음)"""
+    total = 0
+    for record in records:
+        total += int(record.get(HASH_FIELD) or record_hash(record), 16)
+    return DeltaTracker._format_version(total)
+
+def write_delta(path: str, delta: Dict, meta: Dict) -> None:
+    """변경분을 JSON 파일로 저장합니다. 임시 파일에 쓴 뒤 교체합니다.
+    
+    추가된 항목은 하나씩 직렬화하여 기록하므로 임시 파일에 둔 목록을 메모리에 올리지 않습니다.
+    """
+    document = dict(delta, meta=dict(
+        meta,
+        added=len(delta["added"]),
+        removed=len(delta["removed"]),
+        modified=len(delta["modified"])
+    ))
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        separator = '{'
+        for key, value in document.items():
+            f.write(f"{separator}{_compact(key)}:")
+            separator = ','
+            if key == "added":
+                f.write('[')
+                for index, record in enumerate(value):
+                    f.write(f",{_compact(record)}" if index else _compact(record))
+                f.write(']')
+            else:
+                f.write(_compact(value))
+        f.write('}')
+    os.replace(temp_file, path)
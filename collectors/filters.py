@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+제재 항목 필터 인덱스
+국가(국적 포함), 프로그램, 유형별로 해당 항목 번호의 비트맵(파이썬 정수, 항목 번호 i가 비트 i)을 만들어 두고,
+필터 조건을 비트맵 AND로 계산합니다. 제재 시작일은 날짜순으로 정렬한 목록에서 이진 탐색한 범위를 비트맵으로
+변환합니다. 전체 항목을 순회하지 않으므로 필터 검색은 항목 수/64 워드 연산으로 끝납니다.
+"""
+
+import re
+import bisect
+from array import array
+from itertools import chain, islice
+from typing import Dict, List, Iterable, Iterator, Optional, Set
+
+# 필터 필드 이름
+FILTER_FIELDS = ("country", "program", "type")
+DATE_BLOCKS = 128  # 제재 시작일 정렬 목록을 나눌 구간 수 (구간별 비트맵을 미리 계산, 항목당 DATE_BLOCKS/8 bytes)
+
+_NONZERO_BYTE = re.compile(b'[^\\x00]')
+
+def record_filter_keys(record: Dict) -> Dict[str, Set[str]]:
+    """항목의 필터 키(소문자)를 필드별로 반환합니다. 국가는 국적, 프로그램은 제재 상세의 프로그램을 포함합니다."""
+    details = record.get("details", {})
+    countries = {record.get("country", "")} | set(details.get("nationalities", []))
+    programs = set(record.get("programs", []))
+    for sanction in details.get("sanctions", []):
+        programs.add(sanction.get("program", ""))
+    return {
+        "country": {country.casefold() for country in countries if country},
+        "program": {program.casefold() for program in programs if program},
+        "type": {record["type"].casefold()} if record.get("type") else set()
+    }
+
+def to_bitmap(indexes: Iterable[int], size: int) -> int:
+    """항목 번호 목록을 비트맵으로 변환합니다."""
+    data = bytearray((size + 7) // 8)
+    for index in indexes:
+        data[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(data, 'little')
+
+class Selection:
+    """필터 결과 (항목 번호 비트맵)
+    
+    항목 번호는 오름차순으로 순회하며, 0이 아닌 바이트 위치는 정규식으로 C 수준에서 찾습니다.
+    """
+    
+    def __init__(self, bits: int):
+        """초기화"""
+        self.bits = bits
+        self._count = bits.bit_count()
+        self._bytes = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __contains__(self, index: int) -> bool:
+        byte_index = index >> 3
+        return 0 <= byte_index < len(self._bytes) and bool(self._bytes[byte_index] >> (index & 7) & 1)
+    
+    def __iter__(self) -> Iterator[int]:
+        data = self._bytes
+        for match in _NONZERO_BYTE.finditer(data):
+            base = match.start() << 3
+            byte = data[match.start()]
+            while byte:
+                low = byte & -byte
+                yield base + low.bit_length() - 1
+                byte ^= low
+    
+    def page(self, skip: int, limit: int) -> List[int]:
+        """skip번째부터 limit개의 항목 번호를 반환합니다."""
+        return list(islice(self, skip, skip + limit))
+
+class FilterIndex:
+    """국가/프로그램/유형 게시 목록과 제재 시작일 범위 인덱스"""
+    
+    def __init__(self, records: Iterable[Dict]):
+        """제재 항목 목록(순서가 항목 번호)으로 인덱스를 생성합니다."""
+        postings: Dict[str, Dict[str, array]] = {field: {} for field in FILTER_FIELDS}
+        dated = []
+        count = 0
+        for record_index, record in enumerate(records):
+            for field, keys in record_filter_keys(record).items():
+                field_postings = postings[field]
+                for key in keys:
+                    field_postings.setdefault(key, array('I')).append(record_index)
+            for date in {sanction["startDate"] for sanction in record.get("details", {}).get("sanctions", [])
+                         if sanction.get("startDate")}:
+                dated.append((date, record_index))
+            count += 1
+        self._count = count
+        self._bitmaps: Dict[str, Dict[str, int]] = {
+            field: {key: to_bitmap(posting, count) for key, posting in field_postings.items()}
+            for field, field_postings in postings.items()
+        }
+        
+        # 제재 시작일 순 (날짜는 YYYY-MM-DD 형식이므로 문자열 정렬)
+        dated.sort()
+        self._dates = [date for date, _ in dated]
+        self._date_records = array('I', (record_index for _, record_index in dated))
+        self._block_size = max(1, -(-len(dated) // DATE_BLOCKS))
+        self._date_blocks = [
+            to_bitmap(self._date_records[start:start + self._block_size], count)
+            for start in range(0, len(dated), self._block_size)
+        ]
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def values(self, field: str) -> List[str]:
+        """필드의 필터 값 목록을 항목 수가 많은 순으로 반환합니다."""
+        bitmaps = self._bitmaps[field]
+        return sorted(bitmaps, key=lambda key: bitmaps[key].bit_count(), reverse=True)
+    
+    def _date_bitmap(self, start_date: Optional[str], end_date: Optional[str]) -> int:
+        """제재 시작일이 [start_date, end_date]인 항목의 비트맵을 반환합니다."""
+        low = bisect.bisect_left(self._dates, start_date) if start_date else 0
+        high = bisect.bisect_right(self._dates, end_date) if end_date else len(self._dates)
+        if low >= high:
+            return 0
+        # 범위에 완전히 포함된 구간은 미리 계산한 비트맵을 OR하고 양 끝의 나머지만 변환
+        size = self._block_size
+        first, last = -(-low // size), high // size
+        if first >= last:
+            return to_bitmap(self._date_records[low:high], self._count)
+        bits = to_bitmap(chain(self._date_records[low:first * size], self._date_records[last * size:high]), self._count)
+        for block in self._date_blocks[first:last]:
+            bits |= block
+        return bits
+    
+    def select(self, country: Optional[str] = None, program: Optional[str] = None,
+               type: Optional[str] = None, start_date: Optional[str] = None,
+               end_date: Optional[str] = None) -> Optional[Selection]:
+        """조건을 모두 만족하는 항목을 반환합니다. 조건이 없으면 None입니다.
+        
+        범주 조건은 비트맵 AND로 먼저 계산하고, 결과가 비면 날짜 범위는 계산하지 않습니다.
+        """
+        bits = None
+        for field, value in (("country", country), ("program", program), ("type", type)):
+            if value:
+                bitmap = self._bitmaps[field].get(value.casefold(), 0)
+                bits = bitmap if bits is None else bits & bitmap
+                if not bits:
+                    return Selection(0)
+        if start_date or end_date:
+            date_bits = self._date_bitmap(start_date, end_date)
+            bits = date_bits if bits is None else bits & date_bits
+        return None if bits is None else Selection(bits)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 이력 저장소
+통합 실행마다 항목을 내용 해시(contentHash) 기준으로 중복 제거하여 SQLite에 기록합니다. 항목 내용은
+해시별로 한 번만 저장하고, 항목별로 "어느 실행부터 어느 실행 전까지 이 내용이었는지"를 구간으로 기록하므로
+저장 공간은 실행 횟수가 아니라 변경 횟수에 비례합니다.
+
+시점 조회는 기준 시각 이전의 마지막 실행을 찾은 뒤 그 실행을 포함하는 구간만 색인으로 조회하므로
+이전 실행을 재생하지 않습니다.
+
+    runs       실행 (번호, 통합 시각 lastUpdated, dataVersion, 항목/추가/삭제/수정 수)
+    versions   내용 해시별 항목 JSON
+    intervals  항목 ID, 내용 해시, 시작 실행, 종료 실행 (종료 실행부터 유효하지 않음, 현재 항목은 NULL)
+    names      정규화한 이름/별칭 키 → 항목 ID
+"""
+
+import os
+import json
+import sqlite3
+from datetime import date, datetime
+from typing import Dict, List, Optional, Iterable, Union
+
+from collectors.delta import HASH_FIELD, record_hash
+from collectors.normalize import sorted_token_key
+
+HISTORY_BATCH_SIZE = 5000  # executemany 한 번에 넣을 항목 수
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    data_version TEXT,
+    count INTEGER NOT NULL,
+    added INTEGER NOT NULL,
+    removed INTEGER NOT NULL,
+    modified INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp ON runs (timestamp);
+CREATE TABLE IF NOT EXISTS versions (hash TEXT PRIMARY KEY, data TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS intervals (
+    record_id TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    first_run INTEGER NOT NULL,
+    end_run INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_intervals_record ON intervals (record_id, first_run);
+CREATE INDEX IF NOT EXISTS idx_intervals_open ON intervals (record_id, hash) WHERE end_run IS NULL;
+CREATE TABLE IF NOT EXISTS names (
+    name_key TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    PRIMARY KEY (name_key, record_id)
+) WITHOUT ROWID;
+"""
+
+TimePoint = Union[str, date, datetime]
+
+def _point_in_time(when: TimePoint) -> str:
+    """조회 시점을 runs.timestamp와 비교할 수 있는 ISO 문자열로 변환합니다. 날짜만 주면 그날의 끝으로 봅니다."""
+    if isinstance(when, datetime):
+        return when.isoformat()
+    if isinstance(when, date):
+        when = when.isoformat()
+    return f"{when}T23:59:59.999999" if len(when) == 10 else when
+
+def _name_keys(record: Dict) -> List[str]:
+    """항목의 이름/별칭 색인 키(정렬된 정규화 토큰)를 반환합니다."""
+    names = [record.get("name", "")] + record.get("details", {}).get("aliases", [])
+    return [key for key in dict.fromkeys(sorted_token_key(name) for name in names) if key]
+
+class HistoryStore:
+    """통합 실행 이력을 내용 해시로 중복 제거하여 저장하고 시점 조회를 제공하는 클래스"""
+    
+    def __init__(self, path: str, readonly: bool = False):
+        """초기화 (readonly이면 기존 저장소를 읽기 전용으로 엽니다)"""
+        self.path = path
+        if readonly:
+            self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(SCHEMA)
+        self._encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    
+    def close(self) -> None:
+        """저장소를 닫습니다."""
+        self._conn.close()
+    
+    def __enter__(self) -> "HistoryStore":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def record_run(self, records: Iterable[Dict], meta: Dict) -> Dict:
+        """통합 실행 하나를 기록하고 실행 요약을 반환합니다.
+        
+        새 내용 해시만 항목 JSON과 이름 색인을 저장하고, 구간 갱신은 임시 테이블과의 집합 연산으로
+        처리하므로 이전 실행 항목을 메모리에 올리지 않습니다. 한 트랜잭션으로 기록됩니다.
+        """
+        conn = self._conn
+        timestamp = meta.get("lastUpdated") or datetime.now().isoformat()
+        with conn:
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS current (record_id TEXT PRIMARY KEY, hash TEXT NOT NULL)")
+            conn.execute("DELETE FROM current")
+            
+            count = 0
+            staged = []
+            new_versions = {}
+            for record in records:
+                content_hash = record.get(HASH_FIELD) or record_hash(record)
+                staged.append((record["id"], content_hash))
+                if content_hash not in new_versions and conn.execute(
+                    "SELECT 1 FROM versions WHERE hash = ?", (content_hash,)
+                ).fetchone() is None:
+                    new_versions[content_hash] = (self._encode(record), record["id"], _name_keys(record))
+                count += 1
+                if len(staged) >= HISTORY_BATCH_SIZE:
+                    self._flush(staged, new_versions)
+            self._flush(staged, new_versions)
+            
+            run = conn.execute(
+                "INSERT INTO runs (timestamp, data_version, count, added, removed, modified) VALUES (?, ?, ?, 0, 0, 0)",
+                (timestamp, meta.get("dataVersion"), count)
+            ).lastrowid
+            
+            # 목록에서 빠진 항목 수 (구간을 닫기 전에 계산)
+            removed = conn.execute(
+                "SELECT count(*) FROM intervals i WHERE i.end_run IS NULL "
+                "AND NOT EXISTS (SELECT 1 FROM current c WHERE c.record_id = i.record_id)"
+            ).fetchone()[0]
+            # 내용이 바뀌었거나 빠진 항목의 현재 구간 종료
+            closed = conn.execute(
+                "UPDATE intervals SET end_run = ? WHERE end_run IS NULL AND NOT EXISTS "
+                "(SELECT 1 FROM current c WHERE c.record_id = intervals.record_id AND c.hash = intervals.hash)",
+                (run,)
+            ).rowcount
+            # 새 항목과 내용이 바뀐 항목의 구간 시작
+            opened = conn.execute(
+                "INSERT INTO intervals (record_id, hash, first_run, end_run) "
+                "SELECT c.record_id, c.hash, ?, NULL FROM current c WHERE NOT EXISTS "
+                "(SELECT 1 FROM intervals i WHERE i.record_id = c.record_id AND i.end_run IS NULL)",
+                (run,)
+            ).rowcount
+            
+            modified = closed - removed
+            summary = {
+                "run": run, "timestamp": timestamp, "dataVersion": meta.get("dataVersion"), "count": count,
+                "added": opened - modified, "removed": removed, "modified": modified
+            }
+            conn.execute(
+                "UPDATE runs SET added = ?, removed = ?, modified = ? WHERE run = ?",
+                (summary["added"], removed, modified, run)
+            )
+            conn.execute("DELETE FROM current")
+        return summary
+    
+    def _flush(self, staged: List, new_versions: Dict) -> None:
+        """쌓인 현재 항목과 새 내용 버전을 씁니다."""
+        conn = self._conn
+        conn.executemany("INSERT OR REPLACE INTO current VALUES (?, ?)", staged)
+        conn.executemany("INSERT OR IGNORE INTO versions VALUES (?, ?)",
+                         [(content_hash, data) for content_hash, (data, _, _) in new_versions.items()])
+        conn.executemany("INSERT OR IGNORE INTO names VALUES (?, ?)", [
+            (key, record_id) for data, record_id, keys in new_versions.values() for key in keys
+        ])
+        staged.clear()
+        new_versions.clear()
+    
+    def run_at(self, when: TimePoint) -> Optional[int]:
+        """시점 when에 유효했던 실행(그 시점 이전의 마지막 실행) 번호를 반환합니다. 없으면 None입니다."""
+        row = self._conn.execute(
+            "SELECT run FROM runs WHERE timestamp <= ? ORDER BY timestamp DESC, run DESC LIMIT 1",
+            (_point_in_time(when),)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _record_in_run(self, record_id: str, run: int) -> Optional[Dict]:
+        """실행 run 시점의 항목을 반환합니다."""
+        row = self._conn.execute(
+            "SELECT v.data FROM intervals i JOIN versions v ON v.hash = i.hash "
+            "WHERE i.record_id = ? AND i.first_run <= ? AND (i.end_run IS NULL OR i.end_run > ?) "
+            "ORDER BY i.first_run DESC LIMIT 1",
+            (record_id, run, run)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def record_at(self, record_id: str, when: TimePoint) -> Optional[Dict]:
+        """시점 when에 목록에 있던 항목 내용을 반환합니다. 그때 목록에 없었으면 None입니다."""
+        run = self.run_at(when)
+        return None if run is None else self._record_in_run(record_id, run)
+    
+    def was_listed(self, record_id: str, when: TimePoint) -> bool:
+        """항목이 시점 when에 목록에 있었는지 확인합니다."""
+        return self.record_at(record_id, when) is not None
+    
+    def search_name_at(self, name: str, when: TimePoint) -> List[Dict]:
+        """시점 when에 이 이름(또는 별칭)으로 목록에 있던 항목들을 반환합니다. (단어 순서/표기 차이 무시)"""
+        key = sorted_token_key(name)
+        run = self.run_at(when)
+        if not key or run is None:
+            return []
+        results = []
+        for (record_id,) in self._conn.execute("SELECT record_id FROM names WHERE name_key = ?", (key,)).fetchall():
+            record = self._record_in_run(record_id, run)
+            # 이름 색인은 항목의 모든 버전 이름을 포함하므로 그 시점 내용에 이름이 있었는지 확인
+            if record is not None and key in _name_keys(record):
+                results.append(record)
+        return results
+    
+    def timeline(self, record_id: str) -> List[Dict]:
+        """항목의 등재/수정/해제 이력을 시간 순서로 반환합니다.
+        
+        각 이벤트는 {"event": "listed" | "modified" | "delisted", "run", "timestamp", "contentHash"}입니다.
+        """
+        rows = self._conn.execute(
+            "SELECT i.hash, i.first_run, i.end_run, r.timestamp, e.timestamp FROM intervals i "
+            "JOIN runs r ON r.run = i.first_run LEFT JOIN runs e ON e.run = i.end_run "
+            "WHERE i.record_id = ? ORDER BY i.first_run",
+            (record_id,)
+        ).fetchall()
+        events = []
+        previous_end = None
+        for index, (content_hash, first_run, end_run, started, ended) in enumerate(rows):
+            event = "modified" if previous_end == first_run else "listed"
+            events.append({"event": event, "run": first_run, "timestamp": started, "contentHash": content_hash})
+            next_start = rows[index + 1][1] if index + 1 < len(rows) else None
+            if end_run is not None and next_start != end_run:
+                events.append({"event": "delisted", "run": end_run, "timestamp": ended, "contentHash": content_hash})
+            previous_end = end_run
+        return events
+    
+    def runs(self, limit: Optional[int] = None) -> List[Dict]:
+        """최근 실행 요약을 최신 순으로 반환합니다."""
+        sql = "SELECT run, timestamp, data_version, count, added, removed, modified FROM runs ORDER BY run DESC"
+        rows = self._conn.execute(sql + " LIMIT ?", (limit,)) if limit else self._conn.execute(sql)
+        return [
+            {"run": run, "timestamp": timestamp, "dataVersion": version, "count": count,
+             "added": added, "removed": removed, "modified": modified}
+            for run, timestamp, version, count, added, removed, modified in rows
+        ]
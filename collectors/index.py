@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+제재 대상 이름 검색 인덱스
+통합 제재 데이터의 이름과 별칭을 단어 토큰, 음성 코드, 문자 트라이그램으로 색인하여
+전체 목록을 순회하지 않고 유사 이름 후보를 찾습니다.
+"""
+
+import os
+import math
+import heapq
+import bisect
+from array import array
+from collections import Counter
+from itertools import chain, compress
+from typing import Collection, Dict, List, Optional, Iterable, NamedTuple, Sequence, Set, Tuple, Union
+
+from collectors.base import OUTPUT_DIR, logger, read_records
+from collectors.delta import data_version
+from collectors.normalize import IDENTIFIER_SEPARATOR, identifier_key, name_tokens, phonetic_code, record_identifiers
+from collectors.scoring import MatchQuery, MIN_PHONETIC_LENGTH, TOKEN_WEIGHT, clamp_score
+from collectors.snapshot import SanctionsSnapshot, SNAPSHOT_EXTENSION
+
+DEFAULT_LIMIT = 10  # 기본 반환 후보 수
+DEFAULT_MIN_SCORE = 80.0  # 기본 최소 점수 (0~100)
+MIN_PARTIAL_QUERY_LENGTH = 3  # 부분 일치(질의 단어를 모두 포함하는 이름)를 찾는 최소 질의 글자 수 (공백 제외)
+PARTIAL_CANDIDATE_LIMIT = 100  # 부분 일치로 점수를 계산할 최대 이름 수 (단어 수와 길이가 짧은 이름부터)
+CANDIDATE_BUDGET = 5000  # 후보 계수에 사용할 게시 목록 항목 수 상한
+CANDIDATE_SIMILARITY_RATIO = 0.8  # 후보 생성 트라이그램 유사도 하한 (일치 기준 점수/100 대비 비율)
+
+def default_data_file() -> str:
+    """기본 통합 데이터 파일 경로를 반환합니다. 바이너리 스냅샷이 있으면 우선합니다."""
+    snapshot_file = os.path.join(OUTPUT_DIR, f"integrated_sanctions{SNAPSHOT_EXTENSION}")
+    if os.path.exists(snapshot_file):
+        return snapshot_file
+    return os.path.join(OUTPUT_DIR, "integrated_sanctions.json")
+
+class SearchHit(NamedTuple):
+    """검색 결과 항목"""
+    record: Dict
+    score: float
+    matched_name: str
+
+def token_trigrams(tokens: Iterable[str]) -> List[str]:
+    """토큰별로 앞뒤를 공백으로 채운 문자 트라이그램 목록을 반환합니다. (어순과 무관)"""
+    grams = []
+    for token in tokens:
+        padded = f" {token} "
+        grams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+class SanctionsIndex:
+    """이름/별칭 단어/음성 코드/n-gram 역색인 기반 제재 대상 검색 인덱스"""
+    
+    def __init__(self, records: Union[Iterable[Dict], SanctionsSnapshot]):
+        """통합 제재 항목(또는 바이너리 스냅샷)으로 인덱스를 생성합니다."""
+        self._by_id = {}
+        self._by_identifier = None
+        self._data_version = None
+        
+        entries = []
+        if isinstance(records, SanctionsSnapshot):
+            # 스냅샷은 ID/이름 필드만 디코딩하고, 항목 전체는 검색 결과로 접근할 때 디코딩
+            self._records = records
+            for record_index in range(len(records)):
+                self._add_names(record_index, records.id(record_index), records.field(record_index, "sourceIds"),
+                                records.names(record_index), entries)
+        else:
+            self._records = []
+            for record in records:
+                self._records.append(record)
+                names = [record.get("name", "")] + record.get("details", {}).get("aliases", [])
+                self._add_names(len(self._records) - 1, record["id"], record.get("sourceIds", []), names, entries)
+        
+        # 이름 항목 (이름/별칭 하나당 하나, 단어 수와 길이 오름차순으로 번호 부여)
+        entries.sort(key=lambda entry: (len(entry[2]), len(entry[1])))
+        self._entry_record = array('I')
+        self._entry_names = []
+        self._entry_tokens = []
+        self._entry_keys = []
+        self._entry_sizes = array('B')
+        # 단어 수 n 이상인 첫 항목 번호 (단어 수 필터링용)
+        self._size_starts = array('I')
+        
+        # 역색인: 토큰/음성 코드 -> 이름 항목 번호 (오름차순)
+        token_postings = {}
+        phonetic_postings = {}
+        token_codes = {}  # 단어 -> 음성 코드 (질의 단어 계산에도 재사용)
+        
+        for entry, (record_index, name, tokens) in enumerate(entries):
+            while len(self._size_starts) <= len(tokens):
+                self._size_starts.append(entry)
+            self._entry_record.append(record_index)
+            self._entry_names.append(name)
+            self._entry_tokens.append(frozenset(tokens))
+            self._entry_keys.append(' '.join(sorted(tokens)))
+            self._entry_sizes.append(min(len(tokens), 255))
+            
+            for token in tokens:
+                token_postings.setdefault(token, array('I')).append(entry)
+            # 음성 코드 게시 목록 (철자 변형 후보용, 음성 코드 일치를 인정하는 길이의 단어만)
+            entry_codes = set()
+            for token in tokens:
+                if len(token) >= MIN_PHONETIC_LENGTH:
+                    code = token_codes.get(token)
+                    if code is None:
+                        code = token_codes[token] = phonetic_code(token)
+                    entry_codes.add(code)
+            for code in entry_codes:
+                phonetic_postings.setdefault(code, array('I')).append(entry)
+        self._size_starts.append(len(entries))
+        
+        self._token_postings = token_postings
+        self._phonetic_postings = phonetic_postings
+        self._token_codes = token_codes
+        # 트라이그램 색인은 기준 점수가 낮은 검색에서 처음 필요할 때 생성
+        self._gram_ids = None
+        
+        logger.info(f"검색 인덱스 생성 완료: {len(self._records)}개 항목, {len(self._entry_names)}개 이름")
+    
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "SanctionsIndex":
+        """통합 제재 데이터 파일로 인덱스를 생성합니다.
+        
+        경로를 지정하지 않으면 바이너리 스냅샷(integrated_sanctions.snap)이 있을 때 이를 mmap으로 열고,
+        없으면 integrated_sanctions.json을 읽습니다.
+        """
+        path = path or default_data_file()
+        if path.endswith(SNAPSHOT_EXTENSION):
+            return cls(SanctionsSnapshot(path))
+        return cls(read_records(path))
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    @property
+    def records(self) -> Sequence[Dict]:
+        """색인된 제재 항목 목록을 반환합니다. (스냅샷이면 접근 시 디코딩)"""
+        return self._records
+    
+    @property
+    def data_version(self) -> str:
+        """데이터 버전(항목 내용 해시 합, 통합 결과 meta의 dataVersion과 같은 값)을 반환합니다.
+        
+        처음 조회할 때 계산합니다. (스냅샷이면 항목 전체를 디코딩)
+        """
+        if self._data_version is None:
+            self._data_version = data_version(self.scan_records())
+        return self._data_version
+    
+    def scan_records(self) -> Iterable[Dict]:
+        """항목 전체를 순서대로 반환합니다. 스냅샷이면 이름 정규화 결과(normalized)는 다시 계산하지 않고 생략합니다."""
+        if isinstance(self._records, SanctionsSnapshot):
+            return self._records.iter_records(normalized=False)
+        return self._records
+    
+    def get(self, record_id: str) -> Optional[Dict]:
+        """ID(병합된 원래 소스 ID 포함)로 제재 항목을 반환합니다."""
+        index = self._by_id.get(record_id)
+        return self._records[index] if index is not None else None
+    
+    def identifier_map(self) -> Dict[str, List[Tuple[int, str]]]:
+        """신분증 번호 -> (항목 번호, 발급국가) 목록을 반환합니다.
+        
+        이름만 검색하는 경우 로드 시간을 늘리지 않도록 처음 조회할 때 생성합니다. (스냅샷이면 항목 전체를 디코딩)
+        """
+        if self._by_identifier is None:
+            by_identifier = {}
+            for record_index, record in enumerate(self.scan_records()):
+                for key in record_identifiers(record):
+                    number, _, country = key.partition(IDENTIFIER_SEPARATOR)
+                    by_identifier.setdefault(number, []).append((record_index, country))
+            self._by_identifier = by_identifier
+            logger.info(f"신분증 번호 인덱스 생성 완료: {len(by_identifier)}개 번호")
+        return self._by_identifier
+    
+    def find_identifier(self, number: str, country: Optional[str] = None) -> List[Dict]:
+        """신분증/등록 번호로 제재 항목을 찾습니다. (공백/하이픈/대소문자 차이 무시)
+        
+        country를 주면 발급국가가 같거나 발급국가가 기록되지 않은 항목만 반환합니다.
+        """
+        key = identifier_key(number, country or "")
+        if not key:
+            return []
+        number, _, country = key.partition(IDENTIFIER_SEPARATOR)
+        matches = self.identifier_map().get(number, ())
+        record_indexes = dict.fromkeys(
+            record_index for record_index, issued in matches if not country or not issued or issued == country
+        )
+        return [self._records[record_index] for record_index in record_indexes]
+    
+    def _add_names(self, record_index: int, record_id: str, source_ids: List[str],
+                   names: List[str], entries: List[Tuple]) -> None:
+        """제재 항목 하나의 ID를 등록하고 이름/별칭 항목을 entries에 모읍니다."""
+        self._by_id[record_id] = record_index
+        for source_id in source_ids:
+            self._by_id.setdefault(source_id, record_index)
+        
+        seen = set()
+        for name in names:
+            tokens = tuple(dict.fromkeys(name_tokens(name)))
+            if not tokens or tokens in seen:
+                continue
+            seen.add(tokens)
+            entries.append((record_index, name, tokens))
+    
+    def _build_trigrams(self) -> None:
+        """트라이그램 역색인을 생성합니다.
+        
+        길이 필터링을 위해 이름 항목을 트라이그램 수 오름차순으로 다시 배열한 위치로 게시 목록을 만들고,
+        _gram_order로 위치를 항목 번호로 바꿉니다.
+        """
+        grams = [set(token_trigrams(tokens)) for tokens in self._entry_tokens]
+        self._gram_order = array('I', sorted(range(len(grams)), key=lambda entry: len(grams[entry])))
+        # 트라이그램 수 n 이상인 첫 위치 (길이 필터링용)
+        self._length_starts = array('I')
+        self._entry_grams = []
+        gram_ids = {}
+        gram_postings = []
+        for position, entry in enumerate(self._gram_order):
+            entry_grams = grams[entry]
+            while len(self._length_starts) <= len(entry_grams):
+                self._length_starts.append(position)
+            ids = []
+            for gram in entry_grams:
+                gram_id = gram_ids.get(gram)
+                if gram_id is None:
+                    gram_id = gram_ids[gram] = len(gram_postings)
+                    gram_postings.append(array('I'))
+                gram_postings[gram_id].append(position)
+                ids.append(gram_id)
+            self._entry_grams.append(tuple(ids))
+        self._length_starts.append(len(grams))
+        
+        self._gram_postings = gram_postings
+        self._gram_counts = array('I', map(len, gram_postings))
+        self._gram_ids = gram_ids
+        logger.info(f"트라이그램 인덱스 생성 완료: {len(gram_ids)}개 트라이그램")
+    
+    def _length_range(self, low: int, high: int) -> Tuple[int, int]:
+        """트라이그램 수가 [low, high]인 이름 항목 위치 범위를 반환합니다."""
+        last = len(self._length_starts) - 1
+        return self._length_starts[min(max(low, 0), last)], self._length_starts[min(max(high + 1, 0), last)]
+    
+    def _candidate_entries(self, query_grams: List[int], query_size: int,
+                           min_similarity: float) -> Tuple[List[Tuple[int, int]], bool]:
+        """길이 필터링과 접두/계수 필터링으로 후보 이름 항목을 찾습니다.
+        
+        Dice 유사도가 t 이상이려면 항목의 트라이그램 수 n은 t*|q|/(2-t) 이상 (2|q'|-t*|q|)/t 이하이고
+        (q'는 색인에 있는 질의 트라이그램), 공유 트라이그램이 m = t*|q|/(2-t)개 이상이어야 합니다.
+        가장 드문 트라이그램 p개 중에서는 최소 p - (|q'| - m)개를 공유해야 하므로, 게시 목록 합이
+        CANDIDATE_BUDGET 이내가 되도록 p를 늘려 계수 필터를 강하게 합니다.
+        
+        (항목 위치, 계수) 목록과 계수가 곧 정확한 공유 트라이그램 수인지 여부를 반환합니다.
+        """
+        required = max(1, math.ceil(min_similarity * query_size / (2 - min_similarity)))
+        slack = len(query_grams) - required
+        if slack < 0:
+            return [], True
+        low, high = self._length_range(required, int((2 * len(query_grams) - min_similarity * query_size) / min_similarity))
+        
+        # 드문 트라이그램부터 길이 범위로 잘라낸 게시 목록을 모음 (위치가 길이순이므로 이진 탐색)
+        query_grams = sorted(query_grams, key=self._gram_counts.__getitem__)
+        postings = []
+        total = 0
+        for gram_id in query_grams:
+            posting = self._gram_postings[gram_id]
+            posting = posting[bisect.bisect_left(posting, low):bisect.bisect_left(posting, high)]
+            if len(postings) > slack and total + len(posting) > CANDIDATE_BUDGET:
+                break
+            postings.append(posting)
+            total += len(posting)
+        prefix_size = len(postings)
+        min_shared = prefix_size - slack
+        
+        counts = Counter(chain.from_iterable(postings))
+        exact = prefix_size == len(query_grams)
+        if min_shared <= 1:
+            return list(counts.items()), exact
+        # 최소 공유 수 미만 항목 제거 (C 수준 반복)
+        return list(compress(counts.items(), map(min_shared.__le__, counts.values()))), exact
+    
+    def _similar_entries(self, tokens: Sequence[str], min_similarity: float) -> List[int]:
+        """트라이그램 Dice 유사도가 min_similarity 이상인 이름 항목 번호를 반환합니다.
+        
+        계수 필터를 통과한 후보 중 계수가 정확하지 않은(게시 목록 일부만 센) 항목은 공유 트라이그램을 다시 세어
+        확인하므로, 흔한 트라이그램이 많은 질의에서도 점수를 계산할 후보는 실제로 비슷한 이름뿐입니다.
+        """
+        if self._gram_ids is None:
+            self._build_trigrams()
+        # 색인에 있는 트라이그램만 사용 (없는 트라이그램은 분모에만 반영)
+        all_grams = set(token_trigrams(tokens))
+        query_grams = [self._gram_ids[g] for g in all_grams if g in self._gram_ids]
+        if not query_grams:
+            return []
+        query_size = len(all_grams)
+        candidates, exact = self._candidate_entries(query_grams, query_size, min_similarity)
+        entry_grams = self._entry_grams
+        order = self._gram_order
+        query_set = set(query_grams) if not exact else None
+        similar = []
+        for position, shared in candidates:
+            grams = entry_grams[position]
+            if query_set is not None:
+                shared = len(query_set.intersection(grams))
+            if 2 * shared >= min_similarity * (query_size + len(grams)):
+                similar.append(order[position])
+        return similar
+    
+    def _token_entries(self, tokens: Iterable[str], limit: Optional[int] = None,
+                       allowed: Optional[Collection[int]] = None) -> Set[int]:
+        """질의 토큰을 모두 포함하는 이름 항목 번호를 반환합니다.
+        
+        limit을 주면 단어 수와 길이가 짧은 이름(항목 번호 순, 단어 점수가 높은 이름)부터 최대 limit개만 반환합니다.
+        allowed를 주면 그 항목 번호에 속한 이름만 셉니다.
+        """
+        postings = sorted((self._token_postings.get(token, ()) for token in tokens), key=len)
+        if not postings or not postings[0]:
+            return set()
+        entries = set(postings[0])
+        for posting in postings[1:]:
+            entries.intersection_update(posting)
+        if allowed is not None:
+            entry_record = self._entry_record
+            entries = {entry for entry in entries if entry_record[entry] in allowed}
+        if limit is not None and len(entries) > limit:
+            entries = set(heapq.nsmallest(limit, entries))
+        return entries
+    
+    def _token_candidates(self, tokens: Sequence[str], phonetic: bool, min_token_score: float) -> List[int]:
+        """단어 Dice 유사도 상한이 min_token_score 이상인 이름 항목 번호를 반환합니다.
+        
+        질의 단어마다 같은 단어(phonetic이면 음성 코드가 같은 단어, 예: Mohamed/Muhammad)를 가진 이름을 세고,
+        일치 단어 수 m과 이름의 단어 수 n으로 계산한 상한 2m/(|q|+n)이 기준에 못 미치는 이름은 제외합니다.
+        m <= |q|이므로 n은 2|q|/t - |q| 이하여야 하고(항목 번호가 단어 수 순이므로 게시 목록을 잘라냄),
+        n >= m이므로 m은 t|q|/(2-t) 이상이어야 합니다(흔한 단어 하나만 겹치는 이름은 C 수준에서 제거).
+        """
+        query_size = len(tokens)
+        max_size = int((2 - min_token_score) * query_size / min_token_score + 1e-9)
+        required = max(1, math.ceil(min_token_score * query_size / (2 - min_token_score) - 1e-9))
+        end = self._size_starts[min(max_size + 1, len(self._size_starts) - 1)]
+        postings = []
+        for token in tokens:
+            if phonetic and len(token) >= MIN_PHONETIC_LENGTH:
+                code = self._token_codes.get(token) or phonetic_code(token)
+                posting = self._phonetic_postings.get(code, ())
+            else:
+                posting = self._token_postings.get(token, ())
+            postings.append(posting[:bisect.bisect_left(posting, end)] if posting else posting)
+        counts = Counter(chain.from_iterable(postings))
+        matches = counts.items()
+        if required > 1:
+            matches = compress(matches, map(required.__le__, counts.values()))
+        sizes = self._entry_sizes
+        return [entry for entry, matched in matches
+                if 2 * matched >= min_token_score * (query_size + sizes[entry])]
+    
+    def search(self, query: str, limit: Optional[int] = DEFAULT_LIMIT,
+               min_score: float = DEFAULT_MIN_SCORE, include_partial: bool = False,
+               birth_date: Optional[str] = None, nationality: Optional[str] = None,
+               allowed: Optional[Collection[int]] = None) -> List[SearchHit]:
+        """이름으로 검색하여 일치 점수(0~100) 순으로 상위 후보를 반환합니다. (인자는 rank와 같음)"""
+        return [
+            SearchHit(self._records[record_index], score, matched_name)
+            for score, record_index, matched_name in self.rank(query, limit, min_score, include_partial,
+                                                               birth_date, nationality, allowed)
+        ]
+    
+    def rank(self, query: str, limit: Optional[int] = DEFAULT_LIMIT,
+             min_score: float = DEFAULT_MIN_SCORE, include_partial: bool = False,
+             birth_date: Optional[str] = None, nationality: Optional[str] = None,
+             allowed: Optional[Collection[int]] = None) -> List[Tuple[float, int, str]]:
+        """이름으로 검색하여 일치 점수(0~100) 순으로 (점수, 항목 번호, 일치한 이름) 목록을 반환합니다.
+        
+        트라이그램 색인(오타, 어순 변경)과 음성 코드 색인(두 단어 이상 질의의 철자 변형, 예: Mohamed/Muhammad)으로
+        후보 이름을 찾은 뒤 collectors.scoring으로 점수를 계산합니다. 질의와 같은 단어가 있는 이름은 음성 코드로만
+        일치한 이름보다 먼저 반환합니다(같은 단계 안에서는 점수 순).
+        birth_date와 nationality를 주면 항목의 생년/국적 일치 여부를 점수에 반영합니다.
+        include_partial이면 질의 단어를 모두 포함하는 이름(예: 성만 입력한 경우)도 점수와 무관하게 포함합니다.
+        (질의가 MIN_PARTIAL_QUERY_LENGTH 글자 이상일 때, 짧은 이름부터 최대 PARTIAL_CANDIDATE_LIMIT개)
+        allowed를 주면 그 항목 번호(필터 인덱스 결과)에 속한 후보만 점수를 계산합니다.
+        """
+        tokens = tuple(dict.fromkeys(name_tokens(query)))
+        if not tokens or allowed is not None and not allowed:
+            return []
+        match_query = MatchQuery(query, birth_date, nationality)
+        # 속성 일치 가산점을 받으면 기준에 도달할 수 있는 이름 점수까지 후보로 봄
+        name_threshold = min_score - match_query.max_bonus
+        
+        # 같은 단어(또는 음성 코드)가 하나도 없는 이름은 Jaro-Winkler 몫만 받으므로, 기준이 그보다 높으면
+        # 단어 게시 목록만으로 후보를 빠짐없이 찾을 수 있음. 기준이 낮을 때만 트라이그램 색인 사용
+        min_token_score = (name_threshold / 100 - (1 - TOKEN_WEIGHT)) / TOKEN_WEIGHT
+        if min_token_score > 0:
+            candidates = self._token_candidates(tokens, match_query.phonetic, min_token_score)
+        else:
+            min_similarity = max(0.05, name_threshold / 100 * CANDIDATE_SIMILARITY_RATIO)
+            candidates = self._similar_entries(tokens, min_similarity)
+        # 짧은 질의(예: "al")는 부분 일치 목록을 만들지 않고, 흔한 단어는 짧은 이름부터 일부만 점수 계산
+        if include_partial and sum(map(len, tokens)) >= MIN_PARTIAL_QUERY_LENGTH:
+            partial = self._token_entries(tokens, PARTIAL_CANDIDATE_LIMIT, allowed)
+        else:
+            partial = set()
+        
+        best = {}
+        partial_records = set()
+        for entry in chain(candidates, partial):
+            record_index = self._entry_record[entry]
+            if allowed is not None and record_index not in allowed:
+                continue
+            current = best.get(record_index, (-1.0, 0))[0]
+            entry_tokens = self._entry_tokens[entry]
+            if entry in partial:
+                partial_records.add(record_index)
+                threshold = current
+            else:
+                threshold = max(name_threshold, current)
+            # 기준에 도달할 수 없는 이름은 점수 계산 중 조기 종료 (0.0)
+            score = match_query.score_tokens(entry_tokens, self._entry_keys[entry], threshold)
+            if score < name_threshold and entry not in partial:
+                continue
+            if score > current:
+                best[record_index] = (score, entry)
+        
+        results = []
+        for record_index, (score, entry) in best.items():
+            if match_query.birth_years or match_query.nationality:
+                score += match_query.attribute_adjustment(self._records[record_index])
+                if score < min_score and record_index not in partial_records:
+                    continue
+            results.append((clamp_score(score), record_index, entry))
+        
+        # 같은 단어가 있는 이름 우선, 그다음 점수 순
+        query_tokens = match_query.tokens
+        entry_tokens = self._entry_tokens
+        order = lambda item: (not query_tokens.isdisjoint(entry_tokens[item[2]]), item[0])
+        if limit is None or limit >= len(results):
+            top = sorted(results, key=order, reverse=True)
+        else:
+            top = heapq.nlargest(limit, results, key=order)
+        # 항목은 디코딩하지 않으므로 결과를 캐시하거나 현재 페이지만 디코딩할 수 있음
+        return [(score, record_index, self._entry_names[entry]) for score, record_index, entry in top]
@@ -5,96 +5,207 @@
 """
 
 import os
-import json
-import gc
-from typing import Dict, List
+import sys
+import time
+import shutil
+from itertools import combinations
+from typing import Dict, List, Optional, Iterable, Set, Tuple, Any, FrozenSet, NamedTuple
 from datetime import datetime
 
-from collectors.base import OUTPUT_DIR, logger, get_memory_usage, MAX_MEMORY_PERCENT
+from collectors.base import (
+    OUTPUT_DIR, TEMP_DIR, WRITE_BUFFER_SIZE, logger,
+    source_output_path, read_records, write_records, previous_records, save_delta
+)
+from collectors.delta import DeltaTracker
+from collectors.metrics import metrics
+from collectors.memory import memory_budget, format_size, JSON_RECORD_FACTOR, SPILLED_RECORD_BYTES
+from collectors.spill import RecordStore
+from collectors.snapshot import write_snapshot, SNAPSHOT_EXTENSION
+from collectors.sqlite_store import write_sqlite
+from collectors.history import HistoryStore
+from collectors.countries import country_code
+from collectors.normalize import name_tokens, birth_years, identification_key, normalize_record
+
+# 집합 기반으로 중복을 제거하며 병합하는 세부 필드
+MERGED_DETAIL_FIELDS = ["aliases", "addresses", "nationalities", "identifications"]
+
+# 교차 소스 개체 식별 설정
+MAX_BLOCK_SIZE = 50  # 이보다 큰 블록(흔한 이름 등)은 후보 생성에서 제외
+NAME_MATCH_THRESHOLD = 0.85  # 이름 토큰 집합 유사도(Jaccard) 기준
+MIN_ID_NUMBER_LENGTH = 5  # 블로킹 키로 쓸 신분증 번호 최소 길이
+MIN_EXACT_NAME_TOKENS = 3  # 출생연도 없이도 개인을 병합할 수 있는 완전 일치 이름의 최소 단어 수
+
+# SQLite 저장소(integrated_sanctions.db) 출력 여부
+SQLITE_OUTPUT = os.environ.get('SANCTIONS_SQLITE_OUTPUT', '').lower() in ('1', 'true', 'yes')
+# 실행 이력 저장소 경로 (설정하지 않으면 기록하지 않음, 예: history/sanctions_history.db)
+HISTORY_FILE = os.environ.get('SANCTIONS_HISTORY_FILE', '')
+
+# 빈 속성은 항목마다 새 집합을 만들지 않고 공유
+_EMPTY: FrozenSet = frozenset()
+
+class EntityProfile(NamedTuple):
+    """개체 식별 비교용 속성 (항목 수만큼 메모리에 두므로 튜플과 frozenset으로 작게 유지)"""
+    source: str
+    type: str
+    individual: bool
+    token_sets: Tuple[FrozenSet[str], ...]
+    years: FrozenSet[int]
+    id_numbers: FrozenSet[str]
+    nationalities: FrozenSet[str]
+
+def _merge_key(field: str, item: Any) -> Any:
+    """병합 필드 항목의 해시 가능한 키를 반환합니다."""
+    if field == "identifications" and isinstance(item, dict):
+        return identification_key(item)
+    return item
 
 class SanctionsIntegrator:
     """제재 데이터 통합기 클래스"""
     
-    def __init__(self, sources=None):
+    def __init__(self, sources=None, resolve_entities: bool = True, sqlite_output: bool = SQLITE_OUTPUT,
+                 history_file: Optional[str] = HISTORY_FILE):
         """초기화"""
         self.sources = sources or ["UN", "EU", "US"]
+        self.resolve_entities = resolve_entities
+        self.sqlite_output = sqlite_output
+        self.history_file = history_file
         self.logger = logger
     
-    def integrate(self) -> bool:
-        """모든 소스의 제재 데이터를 통합합니다."""
+    def integrate(self, changed_sources: Optional[List[str]] = None) -> bool:
+        """모든 소스의 제재 데이터를 통합합니다.
+        
+        changed_sources가 빈 목록이면(모든 소스가 이전 실행과 동일) 기존 통합 결과를 재사용합니다.
+        """
+        integrated_file = os.path.join(OUTPUT_DIR, "integrated_sanctions.json")
+        if changed_sources is not None and not changed_sources and os.path.exists(integrated_file):
+            self.logger.info("변경된 소스 없음, 기존 통합 제재 데이터 재사용")
+            return True
+        
         self.logger.info(f"제재 데이터 통합 시작: {', '.join(self.sources)}")
+        start_time = time.perf_counter()
         
-        # 각 소스의 데이터 로드
-        all_sanctions = []
+        source_files = {}
+        for source in self.sources:
+            source_file = source_output_path(source)
+            if os.path.exists(source_file):
+                source_files[source] = source_file
+            else:
+                self.logger.warning(f"{source} 제재 데이터 파일 없음: {source_file}")
+        
+        # 소스 파일 크기로 작업 메모리를 추정하고, 메모리 예산을 넘으면 항목을 임시 파일에 두고 통합
+        estimate = sum(os.path.getsize(path) for path in source_files.values()) * JSON_RECORD_FACTOR
+        spill = not memory_budget.fits(estimate, "integrate")
+        if spill:
+            self.logger.warning(
+                f"메모리 예산 부족으로 통합 항목을 디스크에 저장합니다: 예상 {format_size(estimate)}, "
+                f"{memory_budget.describe()}"
+            )
+        else:
+            memory_budget.report("integrate", estimate)
+        metrics.set("memory_spilled", int(spill), stage="integrate")
+        
+        stores = [RecordStore(spill, TEMP_DIR)]
+        try:
+            return self._integrate_sources(source_files, stores, integrated_file, start_time)
+        finally:
+            for store in stores:
+                store.close()
+            memory_budget.release("integrate")
+    
+    def _integrate_sources(self, source_files: Dict[str, str], stores: List[RecordStore],
+                           integrated_file: str, start_time: float) -> bool:
+        """소스 파일들을 읽어 병합하고 통합 결과를 저장합니다. (stores는 호출자가 정리)"""
+        # 각 소스의 데이터를 스트리밍으로 읽으며 중복 제거 (ID 기준)
+        integrated_sanctions = stores[0]
+        merge_index = {}
         source_counts = {}
         
-        for source in self.sources:
+        for source, source_file in source_files.items():
             try:
-                source_file = os.path.join(OUTPUT_DIR, f"{source.lower()}_sanctions.json")
-                if not os.path.exists(source_file):
-                    self.logger.warning(f"{source} 제재 데이터 파일 없음: {source_file}")
-                    continue
-                    
-                with open(source_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                count = 0
+                for sanction in read_records(source_file):
+                    sanction_id = sanction["id"]
+                    index = integrated_sanctions.find(sanction_id)
+                    if index is not None:
+                        # 기존 항목과 병합 (디스크에 둔 항목은 병합 후 다시 저장)
+                        existing = integrated_sanctions[index]
+                        seen = merge_index.setdefault(sanction_id, {})
+                        self._merge_sanctions(existing, sanction, seen)
+                        integrated_sanctions.replace(index, existing)
+                    else:
+                        integrated_sanctions.append(sanction)
+                    count += 1
                 
-                sanctions = data.get("data", [])
-                all_sanctions.extend(sanctions)
-                source_counts[source] = len(sanctions)
-                self.logger.info(f"{source} 제재 데이터 로드 완료: {len(sanctions)}개 항목")
-                
-                # 메모리 관리
-                if get_memory_usage() > MAX_MEMORY_PERCENT:
-                    gc.collect()
+                source_counts[source] = count
+                metrics.add("records", count, stage="load", source=source.lower())
+                self.logger.info(f"{source} 제재 데이터 로드 완료: {count}개 항목")
             except Exception as e:
                 self.logger.error(f"{source} 제재 데이터 로드 실패: {str(e)}")
         
-        if not all_sanctions:
+        # 병합용 보조 인덱스는 더 이상 필요 없음
+        merge_index.clear()
+        
+        if not integrated_sanctions:
             self.logger.error("통합할 제재 데이터가 없습니다.")
             return False
         
-        # 중복 제거 (ID 기준)
-        unique_sanctions = {}
-        for sanction in all_sanctions:
-            sanction_id = sanction["id"]
-            if sanction_id in unique_sanctions:
-                # 기존 항목과 병합
-                self._merge_sanctions(unique_sanctions[sanction_id], sanction)
-            else:
-                unique_sanctions[sanction_id] = sanction
-            
-            # 메모리 관리
-            if len(unique_sanctions) % 1000 == 0 and get_memory_usage() > MAX_MEMORY_PERCENT:
-                gc.collect()
+        if integrated_sanctions.spilled:
+            memory_budget.report("integrate", len(integrated_sanctions) * SPILLED_RECORD_BYTES)
         
-        # 중복 제거된 데이터를 리스트로 변환
-        integrated_sanctions = list(unique_sanctions.values())
+        # 소스 간 동일 개체 병합
+        if self.resolve_entities:
+            with metrics.timer("resolve", "integrated"):
+                resolved = self._resolve_entities(integrated_sanctions)
+            if resolved is not integrated_sanctions:
+                stores.append(resolved)
+                integrated_sanctions.close()
+                integrated_sanctions = resolved
         
         # 통합된 데이터 저장
-        data = {
-            "meta": {
-                "lastUpdated": datetime.now().isoformat(),
-                "sources": self.sources,
-                "totalEntries": len(integrated_sanctions)
-            },
-            "data": integrated_sanctions
+        meta = {
+            "lastUpdated": datetime.now().isoformat(),
+            "sources": self.sources,
+            "totalEntries": len(integrated_sanctions)
         }
         
         try:
             # docs/data 디렉토리 확인 및 생성
             os.makedirs(OUTPUT_DIR, exist_ok=True)
             
-            # sanctions.json 파일로 저장
+            # 병합으로 별칭/내용이 바뀐 항목이 있으므로 이름 정규화 결과와 내용 해시는 저장 전에 다시 계산
+            # (디스크에 둔 항목도 다시 저장하므로 이후 JSON/스냅샷/SQLite 출력에 모두 반영됨)
+            tracker = DeltaTracker(previous_records(integrated_file), TEMP_DIR)
+            integrated_sanctions.rewrite(tracker.track(map(normalize_record, integrated_sanctions), meta))
+            
+            # integrated_sanctions.json 파일로 저장 (항목 단위 스트리밍 기록)
+            temp_file = f"{integrated_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                write_records(f, integrated_sanctions, meta, 'json')
+            save_delta(tracker, "integrated", meta)
+            os.replace(temp_file, integrated_file)
+            
+            # sanctions.json 파일로도 저장 (동일 내용 복사)
             output_file = os.path.join(OUTPUT_DIR, "sanctions.json")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            shutil.copyfile(integrated_file, output_file)
+            
+            # 검색/스크리닝 프로세스용 바이너리 스냅샷 (mmap 지연 로딩)
+            with metrics.timer("snapshot", "integrated"):
+                write_snapshot(os.path.join(OUTPUT_DIR, f"integrated_sanctions{SNAPSHOT_EXTENSION}"), integrated_sanctions)
+            
+            # 선택적 SQLite 저장소 (정규화 테이블 + 이름 전문 검색)
+            if self.sqlite_output:
+                with metrics.timer("sqlite", "integrated"):
+                    write_sqlite(os.path.join(OUTPUT_DIR, "integrated_sanctions.db"), integrated_sanctions, meta)
             
-            # integrated_sanctions.json 파일로도 저장
-            integrated_file = os.path.join(OUTPUT_DIR, "integrated_sanctions.json")
-            with open(integrated_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 실행 이력 (내용 해시로 중복 제거, 시점 조회용)
+            if self.history_file:
+                self._record_history(integrated_sanctions, meta)
             
-            self.logger.info(f"통합 제재 데이터 저장 완료: {len(integrated_sanctions)}개 항목")
+            elapsed = time.perf_counter() - start_time
+            metrics.add("stage_duration_seconds", elapsed, stage="integrate", source="integrated")
+            metrics.record_throughput("integrate", "integrated", len(integrated_sanctions), elapsed)
+            
+            self.logger.info(f"통합 제재 데이터 저장 완료: {len(integrated_sanctions)}개 항목 ({memory_budget.describe()})")
             
             # 소스별 통계
             for source, count in source_counts.items():
@@ -114,44 +225,245 @@ class SanctionsIntegrator:
             self.logger.error(f"통합 제재 데이터 저장 실패: {str(e)}")
             return False
     
-    def _merge_sanctions(self, existing: Dict, new_sanction: Dict) -> None:
-        """두 제재 항목을 병합합니다."""
+    def _record_history(self, sanctions: Iterable[Dict], meta: Dict) -> bool:
+        """통합 결과를 실행 이력 저장소에 기록합니다. 실패해도 통합 결과에는 영향을 주지 않습니다."""
+        try:
+            with metrics.timer("history", "integrated"), HistoryStore(self.history_file) as history:
+                summary = history.record_run(sanctions, meta)
+            self.logger.info(f"실행 이력 기록 완료: 실행 {summary['run']}, 추가 {summary['added']}개, "
+                             f"삭제 {summary['removed']}개, 수정 {summary['modified']}개")
+            return True
+        except Exception as e:
+            self.logger.error(f"실행 이력 기록 실패: {str(e)}")
+            return False
+    
+    def _merge_sanctions(self, existing: Dict, new_sanction: Dict,
+                         seen: Optional[Dict[str, Set]] = None) -> None:
+        """두 제재 항목을 병합합니다.
+        
+        목록 필드는 순서를 유지하면서 해시 집합으로 중복을 확인하므로 항목 수에 대해 선형입니다.
+        seen은 같은 항목을 여러 번 병합할 때 재사용하는 필드별 키 집합입니다.
+        """
+        if seen is None:
+            seen = {}
+        
+        def merge_list(field: str, target: List, items: List) -> None:
+            keys = seen.get(field)
+            if keys is None:
+                keys = seen[field] = {_merge_key(field, item) for item in target}
+            for item in items:
+                key = _merge_key(field, item)
+                if key not in keys:
+                    keys.add(key)
+                    target.append(item)
+        
         # 소스 병합
-        existing["source"] = f"{existing['source']},{new_sanction['source']}"
+        sources = existing["source"].split(',')
+        merge_list("source", sources, new_sanction["source"].split(','))
+        existing["source"] = ','.join(sources)
         
         # 프로그램 병합
-        for program in new_sanction.get("programs", []):
-            if program not in existing["programs"]:
-                existing["programs"].append(program)
+        existing.setdefault("programs", [])
+        merge_list("programs", existing["programs"], new_sanction.get("programs", []))
         
         # 세부 정보 병합
         if "details" in new_sanction:
             if "details" not in existing:
                 existing["details"] = {}
             
-            # 별칭 병합
-            if "aliases" in new_sanction["details"]:
-                if "aliases" not in existing["details"]:
-                    existing["details"]["aliases"] = []
-                for alias in new_sanction["details"]["aliases"]:
-                    if alias not in existing["details"]["aliases"]:
-                        existing["details"]["aliases"].append(alias)
-            
             # 제재 정보 병합
             if "sanctions" in new_sanction["details"]:
                 if "sanctions" not in existing["details"]:
                     existing["details"]["sanctions"] = []
-                for sanction_item in new_sanction["details"]["sanctions"]:
-                    existing["details"]["sanctions"].append(sanction_item)
-                    
-            # 기타 필드 병합
-            for field in ["addresses", "nationalities", "identifications"]:
+                existing["details"]["sanctions"].extend(new_sanction["details"]["sanctions"])
+            
+            # 별칭 및 기타 필드 병합
+            for field in MERGED_DETAIL_FIELDS:
                 if field in new_sanction["details"]:
                     if field not in existing["details"]:
                         existing["details"][field] = []
-                    for item in new_sanction["details"][field]:
-                        if item not in existing["details"][field]:
-                            existing["details"][field].append(item)
+                    merge_list(field, existing["details"][field], new_sanction["details"][field])
+    
+    def _entity_profile(self, sanction: Dict) -> EntityProfile:
+        """개체 식별 비교에 쓰는 정규화된 속성을 계산합니다."""
+        details = sanction.get("details", {})
+        names = [sanction.get("name", "")] + details.get("aliases", [])
+        token_sets = []
+        for name in names:
+            tokens = frozenset(map(sys.intern, name_tokens(name)))
+            if tokens and tokens not in token_sets:
+                token_sets.append(tokens)
+        
+        id_numbers = set()
+        for identification in details.get("identifications", []):
+            number = identification_key(identification)[1]
+            if len(number) >= MIN_ID_NUMBER_LENGTH:
+                id_numbers.add(number)
+        
+        entity_type = sys.intern(str(sanction.get("type", "")).casefold())
+        return EntityProfile(
+            source=sys.intern(sanction.get("source", "")),
+            type=entity_type,
+            individual=entity_type == "individual",
+            token_sets=tuple(token_sets),
+            years=frozenset(birth_years(details.get("birthDate", ""))) or _EMPTY,
+            id_numbers=frozenset(id_numbers) or _EMPTY,
+            # 국가 코드로 바꿀 수 있는 국적은 코드로 저장 ('Russia'와 'Russian Federation'은 같은 나라)
+            nationalities=frozenset(
+                country_code(n.strip()) or sys.intern(n.strip().casefold())
+                for n in details.get("nationalities", []) if n and n.strip()
+            ) or _EMPTY
+        )
+    
+    def _blocking_keys(self, profile: EntityProfile) -> Set[str]:
+        """후보 쌍을 찾기 위한 블로킹 키를 생성합니다.
+        
+        정렬된 이름 토큰, 출생연도+이름 토큰, 국적+이름 토큰, 신분증 번호를 사용합니다.
+        """
+        keys = set()
+        for tokens in profile.token_sets:
+            keys.add("n:" + ' '.join(sorted(tokens)))
+            for token in tokens:
+                if len(token) < 3:
+                    continue
+                for year in profile.years:
+                    keys.add(f"y:{year}:{token}")
+                for nationality in profile.nationalities:
+                    keys.add(f"c:{nationality}:{token}")
+        for number in profile.id_numbers:
+            keys.add(f"id:{number}")
+        return keys
+    
+    def _name_similarity(self, a: EntityProfile, b: EntityProfile) -> float:
+        """두 개체의 이름/별칭 토큰 집합 간 최대 Jaccard 유사도를 반환합니다."""
+        best = 0.0
+        for tokens_a in a.token_sets:
+            for tokens_b in b.token_sets:
+                similarity = len(tokens_a & tokens_b) / len(tokens_a | tokens_b)
+                if similarity > best:
+                    best = similarity
+                    if best == 1.0:
+                        return best
+        return best
+    
+    def _is_same_entity(self, a: EntityProfile, b: EntityProfile) -> bool:
+        """후보 쌍이 같은 개체인지 확인합니다."""
+        # 개인/단체/선박 등 유형이 다르면 다른 개체
+        if a.type != b.type:
+            return False
+        
+        # 출생연도가 모두 있는데 겹치지 않으면 다른 사람
+        if a.years and b.years and not (a.years & b.years):
+            return False
+        
+        similarity = self._name_similarity(a, b)
+        
+        # 같은 신분증 번호는 강한 증거
+        if a.id_numbers & b.id_numbers:
+            return similarity >= 0.5
+        
+        if a.individual:
+            # 개인은 이름과 출생연도가 모두 일치해야 함
+            if similarity >= NAME_MATCH_THRESHOLD and a.years & b.years:
+                return True
+            # 한쪽에만 출생연도가 있으면 세 단어 이상의 이름이 완전히 같고 국적이 상충하지 않을 때만 병합
+            if similarity < 1.0 or (a.nationalities and b.nationalities and not (a.nationalities & b.nationalities)):
+                return False
+            return any(len(tokens) >= MIN_EXACT_NAME_TOKENS for tokens in a.token_sets if tokens in b.token_sets)
+        
+        # 단체/선박 등은 이름(별칭 포함) 토큰 집합이 완전히 같아야 함
+        if similarity < 1.0:
+            return False
+        longest = max((tokens for tokens in a.token_sets if tokens in b.token_sets), key=len)
+        return len(longest) >= 2 or len(next(iter(longest))) >= 5
+    
+    def _resolve_entities(self, sanctions: RecordStore) -> RecordStore:
+        """서로 다른 소스에 있는 같은 개체를 찾아 하나의 항목으로 병합합니다.
+        
+        블로킹 키를 공유하는 항목끼리만 비교하므로 후보 생성은 전체 쌍 비교보다 훨씬 작습니다.
+        병합된 항목은 sourceIds에 원래 소스별 ID를 모두 기록합니다. 병합이 있으면 입력과 같은
+        저장 방식(메모리 또는 디스크)의 새 목록을 반환합니다.
+        """
+        start_time = time.time()
+        profiles = [self._entity_profile(sanction) for sanction in sanctions]
+        
+        # 블로킹 인덱스 생성
+        blocks = {}
+        for index, profile in enumerate(profiles):
+            for key in self._blocking_keys(profile):
+                blocks.setdefault(key, []).append(index)
+        
+        # 후보 쌍 생성 (서로 다른 소스끼리만)
+        candidates = set()
+        for members in blocks.values():
+            if len(members) < 2 or len(members) > MAX_BLOCK_SIZE:
+                continue
+            for i, j in combinations(members, 2):
+                if profiles[i].source != profiles[j].source:
+                    candidates.add((i, j))
+        blocks.clear()
+        
+        # 후보 검증 및 union-find로 묶기
+        parent = list(range(len(sanctions)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        # 그룹별 소스 집합: 같은 소스의 두 항목이 연쇄(A~B~C)로 한 그룹이 되지 않도록 소스가 겹치면 병합하지 않음
+        group_sources = {}
+        matches = 0
+        for i, j in sorted(candidates):
+            if self._is_same_entity(profiles[i], profiles[j]):
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j:
+                    continue
+                sources_i = group_sources.get(root_i) or {profiles[i].source}
+                sources_j = group_sources.get(root_j) or {profiles[j].source}
+                if sources_i & sources_j:
+                    continue
+                root, child = min(root_i, root_j), max(root_i, root_j)
+                parent[child] = root
+                group_sources[root] = sources_i | sources_j
+                group_sources.pop(child, None)
+                matches += 1
+        
+        if not matches:
+            self.logger.info(f"개체 식별 완료: 후보 {len(candidates)}쌍, 병합 없음 ({time.time() - start_time:.2f}초)")
+            return sanctions
+        
+        # 그룹별 병합 (먼저 나온 항목을 기준으로 유지)
+        groups = {}
+        for index in range(len(sanctions)):
+            groups.setdefault(find(index), []).append(index)
+        
+        resolved = RecordStore(sanctions.spilled, TEMP_DIR)
+        for root in sorted(groups):
+            members = groups[root]
+            base = sanctions[members[0]]
+            if len(members) > 1:
+                base["sourceIds"] = [base["id"]]
+                seen = {}
+                for index in members[1:]:
+                    other = sanctions[index]
+                    base["sourceIds"].append(other["id"])
+                    if not base.get("details", {}).get("birthDate") and other.get("details", {}).get("birthDate"):
+                        base.setdefault("details", {})["birthDate"] = other["details"]["birthDate"]
+                    # 다른 소스의 주 이름은 별칭으로 보존
+                    other_details = dict(other.get("details", {}))
+                    other_details["aliases"] = [other["name"]] + other_details.get("aliases", [])
+                    self._merge_sanctions(base, dict(other, details=other_details), seen)
+                # 기준 이름이 별칭에 중복되지 않도록 정리
+                base["details"]["aliases"] = [a for a in base["details"]["aliases"] if a != base["name"]]
+            resolved.append(base)
+        
+        self.logger.info(
+            f"개체 식별 완료: 후보 {len(candidates)}쌍, {matches}건 병합, "
+            f"{len(sanctions)} → {len(resolved)}개 항목 ({time.time() - start_time:.2f}초)"
+        )
+        return resolved
     
     def clean_temp_files(self, temp_dir):
         """임시 파일을 정리합니다."""
@@ -166,4 +478,4 @@ class SanctionsIntegrator:
             
             self.logger.info("임시 파일 정리 완료")
         except Exception as e:
-            self.logger.warning(f"임시 파일 정리 중 오류 발생: {str(e)}") 
\ No newline at end of file
+            self.logger.warning(f"임시 파일 정리 중 오류 발생: {str(e)}")
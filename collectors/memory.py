@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+메모리 예산 관리
+수집 실행 전체가 쓸 수 있는 메모리를 절대 한도(bytes) 하나로 관리합니다. 수집기와 통합기는 작업 전에
+예상 작업 메모리(working set)를 예약하고 작업 중 실제 크기를 보고합니다. 예산이 부족하면 호출자는
+스트리밍 파싱으로 전환하거나, 항목을 디스크로 내보내거나(spill), 새 파싱 작업을 미룹니다.
+
+한도는 SANCTIONS_MEMORY_LIMIT(예: 512M, 1G, 536870912)로 지정하며, 없으면 컨테이너(cgroup) 메모리 한도의
+DEFAULT_LIMIT_RATIO를 사용합니다. 둘 다 없으면 한도 없이 동작합니다. 한도는 처음 사용할 때 결정하며,
+SANCTIONS_MEMORY_LIMIT 값이 잘못되었으면 경고를 남기고 한도 없이 동작합니다. 예산은 사용률을 주기적으로 측정하지 않고
+예약 합계로 판단하므로 결과가 같은 입력에 대해 항상 같습니다.
+"""
+
+import os
+import re
+import logging
+import threading
+from typing import Callable, Dict, Optional, Union
+
+from collectors.metrics import metrics, peak_rss_bytes
+
+MEMORY_LIMIT_ENV = 'SANCTIONS_MEMORY_LIMIT'
+DEFAULT_LIMIT_RATIO = 0.8  # cgroup 한도 중 수집 실행에 쓸 비율 (나머지는 다른 작업/페이지 캐시 몫)
+PROCESS_BASE_BYTES = 48 * 1024 * 1024  # 예약과 별개로 프로세스 자체가 쓰는 메모리 (인터프리터, 모듈)
+
+# 작업 메모리 추정 배수
+TREE_PARSE_FACTOR = 12  # fromstring 파싱: 원본 XML 크기 대비 (XML 트리 + 변환된 항목 목록)
+STREAM_PARSE_BYTES = 32 * 1024 * 1024  # 스트리밍 파싱: 원본 크기와 무관한 고정 크기
+JSON_RECORD_FACTOR = 5  # JSON 출력 파일 크기 대비 메모리에 올린 파이썬 객체 크기
+SPILLED_RECORD_BYTES = 2048  # 디스크로 내보낸 항목 하나당 메모리에 남는 크기 (개체 식별 프로필, 블로킹 인덱스)
+
+_SIZE_UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+_SIZE_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$', re.IGNORECASE)
+
+# cgroup v2 / v1 메모리 한도 파일
+CGROUP_LIMIT_FILES = ['/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes']
+# cgroup v1은 한도가 없을 때 매우 큰 값을 기록함
+_CGROUP_UNLIMITED = 1 << 60
+
+def parse_size(text: Optional[str]) -> Optional[int]:
+    """'512M', '1.5G', '1048576' 같은 크기 문자열을 bytes로 변환합니다. 비어 있으면 None입니다."""
+    if not text or not text.strip():
+        return None
+    match = _SIZE_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"잘못된 메모리 크기: {text}")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+
+def format_size(nbytes: Optional[float]) -> str:
+    """bytes를 로그용 MB 문자열로 변환합니다."""
+    return "무제한" if nbytes is None else f"{nbytes / (1024 * 1024):.0f}MB"
+
+def cgroup_memory_limit() -> Optional[int]:
+    """컨테이너(cgroup) 메모리 한도를 bytes로 반환합니다. 한도가 없거나 알 수 없으면 None입니다."""
+    for path in CGROUP_LIMIT_FILES:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value == 'max' or not value.isdigit():
+            return None
+        limit = int(value)
+        return limit if limit < _CGROUP_UNLIMITED else None
+    return None
+
+def default_memory_limit() -> Optional[int]:
+    """환경 변수 또는 cgroup 한도로 메모리 예산 한도를 결정합니다. 환경 변수 값이 잘못되었으면 한도 없음(None)입니다."""
+    try:
+        limit = parse_size(os.environ.get(MEMORY_LIMIT_ENV))
+    except ValueError as e:
+        logging.getLogger("sanctions_collector").warning(f"{MEMORY_LIMIT_ENV} 무시, 메모리 한도 없이 실행: {str(e)}")
+        return None
+    if limit is not None:
+        return limit
+    container_limit = cgroup_memory_limit()
+    return int(container_limit * DEFAULT_LIMIT_RATIO) if container_limit else None
+
+def parse_working_set(parse_mode: str, size: int) -> int:
+    """파싱 방식과 원본 파일 크기로 파싱 작업 메모리를 추정합니다."""
+    return size * TREE_PARSE_FACTOR if parse_mode == 'tree' else STREAM_PARSE_BYTES
+
+def current_rss() -> int:
+    """현재 프로세스의 RSS를 bytes로 반환합니다. (/proc를 읽을 수 없으면 최대 RSS)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return peak_rss_bytes()
+
+class MemoryBudget:
+    """절대 메모리 한도 안에서 구성 요소별 작업 메모리 예약을 관리하는 클래스 (스레드 안전)
+    
+    예약은 이름으로 구분하며 같은 이름으로 다시 예약/보고하면 크기를 갱신합니다.
+    다른 예약이 하나도 없으면 한도를 넘더라도 예약을 허용하므로 작업이 멈추지 않습니다.
+    """
+    
+    def __init__(self, limit: Union[int, None, Callable[[], Optional[int]]] = None, base: int = PROCESS_BASE_BYTES):
+        """초기화 (limit이 None이면 한도 없음, 함수이면 처음 사용할 때 호출하여 한도를 결정)"""
+        self._limit = limit
+        self.base = base
+        self._reservations: Dict[str, int] = {}
+        self._peak = 0
+        self._lock = threading.RLock()
+    
+    @property
+    def limit(self) -> Optional[int]:
+        """메모리 한도 (bytes, 한도가 없으면 None)"""
+        if callable(self._limit):
+            with self._lock:
+                if callable(self._limit):
+                    self._limit = self._limit()
+        return self._limit
+    
+    @limit.setter
+    def limit(self, value: Optional[int]) -> None:
+        self._limit = value
+    
+    @property
+    def reserved(self) -> int:
+        """현재 예약된 작업 메모리 합계 (bytes, 기본 프로세스 메모리 포함)"""
+        with self._lock:
+            return self.base + sum(self._reservations.values())
+    
+    @property
+    def peak(self) -> int:
+        """실행 중 최대 예약 합계 (bytes)"""
+        return self._peak
+    
+    def available(self, exclude: Optional[str] = None) -> Optional[int]:
+        """남은 예산을 반환합니다. 한도가 없으면 None입니다. exclude의 기존 예약은 남은 예산으로 칩니다."""
+        if self.limit is None:
+            return None
+        with self._lock:
+            used = self.base + sum(size for name, size in self._reservations.items() if name != exclude)
+        return self.limit - used
+    
+    def fits(self, nbytes: int, name: Optional[str] = None) -> bool:
+        """nbytes를 추가로 예약해도 한도 안인지 확인합니다. (name의 기존 예약은 대체되는 것으로 계산)"""
+        available = self.available(exclude=name)
+        return available is None or nbytes <= available
+    
+    def within_limit(self, nbytes: int) -> bool:
+        """다른 예약이 모두 끝나면 nbytes를 예약할 수 있는지(한도 자체를 넘지 않는지) 확인합니다."""
+        return self.limit is None or self.base + nbytes <= self.limit
+    
+    def try_reserve(self, name: str, nbytes: int) -> bool:
+        """예산 안이면 nbytes를 예약하고 True를 반환합니다. 다른 예약이 없으면 항상 예약합니다."""
+        with self._lock:
+            others = any(key != name for key in self._reservations)
+            if others and not self.fits(nbytes, name):
+                return False
+            self._set(name, nbytes)
+            return True
+    
+    def report(self, name: str, nbytes: int) -> None:
+        """구성 요소의 현재 작업 메모리 크기를 보고합니다. (한도와 관계없이 갱신)"""
+        with self._lock:
+            self._set(name, nbytes)
+    
+    def release(self, name: str) -> None:
+        """예약을 해제합니다."""
+        with self._lock:
+            self._reservations.pop(name, None)
+    
+    def _set(self, name: str, nbytes: int) -> None:
+        """예약 크기를 설정하고 최대 예약 합계와 지표를 갱신합니다. (잠금 상태에서 호출)"""
+        self._reservations[name] = max(0, int(nbytes))
+        total = self.base + sum(self._reservations.values())
+        if total > self._peak:
+            self._peak = total
+            metrics.set("memory_reserved_peak_bytes", total)
+    
+    def describe(self) -> str:
+        """로그용 예산 상태 문자열을 반환합니다."""
+        return f"예약 {format_size(self.reserved)} / 한도 {format_size(self.limit)}, RSS {format_size(current_rss())}"
+
+# 프로세스별 메모리 예산 (파싱 프로세스는 자체 예산을 갖지만 파싱 작업 예약은 메인 프로세스에서 관리)
+# (환경 변수는 import 시점이 아닌 처음 사용할 때 읽음)
+memory_budget = MemoryBudget(default_memory_limit)
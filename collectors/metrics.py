@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+수집 실행 지표
+다운로드 바이트, 소스/단계별 소요 시간, 처리 속도, 건너뛴 항목 수, 최대 RSS를 메모리 내 값으로 모으고
+Prometheus 텍스트 형식 파일과 진단 정보로 내보냅니다. 출력 파일을 다시 읽지 않습니다.
+
+파싱 프로세스의 지표는 snapshot()으로 넘겨받아 merge()로 합칩니다.
+"""
+
+import os
+import sys
+import time
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Iterable, Iterator, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+METRIC_PREFIX = "sanctions_"
+
+# 지표 정의 (이름: 설명). 파일에는 마지막 실행의 값만 기록하므로 모두 gauge 유형입니다.
+METRICS = {
+    "download_bytes": "원본 다운로드 바이트 수",
+    "stage_duration_seconds": "소스/단계별 소요 시간 (초)",
+    "records": "단계별 처리 항목 수",
+    "records_skipped": "유효하지 않아 건너뛴 원본 항목 수",
+    "records_per_second": "단계별 처리 속도 (항목/초)",
+    "peak_rss_bytes": "프로세스 최대 RSS (bytes)",
+    "memory_limit_bytes": "메모리 예산 한도 (bytes, 한도 없음은 0)",
+    "memory_reserved_peak_bytes": "메모리 예산 최대 예약 합계 (bytes)",
+    "memory_spilled": "메모리 예산 부족으로 항목을 디스크에 둔 단계 (1 또는 0)",
+    "parse_deferred": "메모리 예산 부족으로 파싱 시작을 미룬 횟수",
+    "parse_mode_fallback": "메모리 예산 부족으로 tree 대신 스트리밍 파싱을 사용한 횟수",
+    "source_success": "소스 수집 성공 여부 (1 또는 0)",
+    "source_unchanged": "원본 변경 없음으로 파싱을 건너뛴 소스 (1 또는 0)",
+    "run_duration_seconds": "전체 실행 소요 시간 (초)",
+    "run_success": "전체 실행 성공 여부 (1 또는 0)",
+    "last_run_timestamp_seconds": "마지막 실행 완료 시각 (Unix 시간)"
+}
+
+# 여러 프로세스 값을 합칠 때 합계 대신 최댓값을 쓰는 지표
+_MAX_METRICS = {"peak_rss_bytes", "memory_reserved_peak_bytes"}
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+def peak_rss_bytes(include_children: bool = False) -> int:
+    """현재 프로세스(와 종료된 자식 프로세스)의 최대 RSS를 bytes로 반환합니다. 측정할 수 없으면 0입니다."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if include_children:
+        peak = max(peak, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # Linux는 KB, macOS는 bytes 단위
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def _escape_label(value: str) -> str:
+    """Prometheus 레이블 값을 이스케이프합니다."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class TimedRecords:
+    """항목 이터레이터를 감싸 항목을 만드는 데 걸린 시간(스트리밍 파싱 시간)과 항목 수를 셉니다."""
+    
+    def __init__(self, records: Iterable[Dict]):
+        """초기화"""
+        self._records = records
+        self.seconds = 0.0
+        self.count = 0
+    
+    def __iter__(self) -> Iterator[Dict]:
+        iterator = iter(self._records)
+        clock = time.perf_counter
+        while True:
+            start = clock()
+            record = next(iterator, None)
+            self.seconds += clock() - start
+            if record is None:
+                return
+            self.count += 1
+            yield record
+
+class RunMetrics:
+    """한 번의 수집 실행 지표를 모으는 클래스 (스레드 안전)"""
+    
+    def __init__(self):
+        """초기화"""
+        self._values: Dict[Tuple[str, _LabelKey], float] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, _LabelKey]:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+    
+    def reset(self) -> None:
+        """모든 값을 지웁니다."""
+        with self._lock:
+            self._values.clear()
+    
+    def add(self, name: str, value: float, **labels) -> None:
+        """지표 값에 value를 더합니다."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+    
+    def set(self, name: str, value: float, **labels) -> None:
+        """지표 값을 설정합니다."""
+        with self._lock:
+            self._values[self._key(name, labels)] = value
+    
+    def get(self, name: str, default: Optional[float] = None, **labels) -> Optional[float]:
+        """지표 값을 반환합니다."""
+        return self._values.get(self._key(name, labels), default)
+    
+    @contextmanager
+    def timer(self, stage: str, source: str = ""):
+        """with 블록의 소요 시간을 stage_duration_seconds에 더합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add("stage_duration_seconds", time.perf_counter() - start, stage=stage, source=source)
+    
+    def record_throughput(self, stage: str, source: str, count: int, seconds: float) -> None:
+        """단계의 처리 항목 수와 처리 속도를 기록합니다."""
+        self.add("records", count, stage=stage, source=source)
+        if seconds > 0:
+            self.set("records_per_second", round(count / seconds, 1), stage=stage, source=source)
+    
+    def snapshot(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """다른 프로세스로 넘길 수 있는 (이름, 레이블, 값) 목록을 반환합니다."""
+        with self._lock:
+            return [(name, dict(labels), value) for (name, labels), value in self._values.items()]
+    
+    def merge(self, snapshot: Iterable[Tuple[str, Dict[str, str], float]]) -> None:
+        """다른 프로세스의 지표를 합칩니다. 최대 RSS는 최댓값, 나머지는 합계를 사용합니다."""
+        for name, labels, value in snapshot:
+            if name in _MAX_METRICS:
+                current = self.get(name, 0, **labels)
+                self.set(name, max(current, value), **labels)
+            elif name == "records_per_second":
+                self.set(name, value, **labels)
+            else:
+                self.add(name, value, **labels)
+    
+    def values(self, name: str) -> Dict[_LabelKey, float]:
+        """지표 하나의 레이블별 값을 반환합니다."""
+        with self._lock:
+            return {labels: value for (metric, labels), value in self._values.items() if metric == name}
+    
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 문자열을 반환합니다."""
+        lines = []
+        with self._lock:
+            names = sorted({name for name, _ in self._values})
+            for name in names:
+                metric = METRIC_PREFIX + name
+                lines.append(f"# HELP {metric} {METRICS.get(name, name)}")
+                lines.append(f"# TYPE {metric} gauge")
+                for (metric_name, labels), value in sorted(self._values.items()):
+                    if metric_name != name:
+                        continue
+                    label_text = ','.join(f'{key}="{_escape_label(label)}"' for key, label in labels)
+                    value_text = repr(float(value)) if isinstance(value, float) else str(value)
+                    lines.append(f"{metric}{{{label_text}}} {value_text}" if label_text else f"{metric} {value_text}")
+        return '\n'.join(lines) + '\n'
+    
+    def write_prometheus(self, path: str) -> None:
+        """Prometheus 텍스트 형식 파일로 저장합니다. (node_exporter textfile 수집기용, 임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_file = f"{path}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_file, path)
+    
+    def source_summary(self) -> Dict[str, Dict]:
+        """진단 정보용으로 소스별 지표를 {소스: {지표: 값}} 형식으로 정리합니다."""
+        summary = {}
+        for name in ("download_bytes", "records_skipped", "source_success", "source_unchanged"):
+            for labels, value in self.values(name).items():
+                source = dict(labels).get("source")
+                if source:
+                    summary.setdefault(source, {})[name] = value
+        for name in ("stage_duration_seconds", "records", "records_per_second"):
+            for labels, value in self.values(name).items():
+                labels = dict(labels)
+                source = labels.get("source") or labels.get("stage")
+                stage = labels.get("stage", "")
+                summary.setdefault(source, {}).setdefault(name, {})[stage] = (
+                    round(value, 3) if isinstance(value, float) else value
+                )
+        return summary
+
+# 프로세스별 실행 지표
+metrics = RunMetrics()
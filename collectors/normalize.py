@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+제재 대상 이름 정규화 유틸리티
+소스마다 다른 표기(대소문자, 악센트, 구두점, 어순, 문자 체계)를 비교 가능한 형태로 변환합니다.
+키릴/아랍 문자는 라틴 문자로 음역하고, 표기 변형(Mohammed/Muhammad 등)은 음성 코드로 묶습니다.
+같은 이름이 소스와 별칭에 반복되므로 이름별 계산 결과를 캐시합니다.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+NAME_CACHE_SIZE = 200000  # 이름별 정규화 결과 캐시 크기
+NORMALIZED_FIELD = "normalized"  # 항목에 기록하는 정규화 결과 필드
+IDENTIFIER_SEPARATOR = "|"  # 신분증 색인 키의 번호와 발급국가 구분자
+
+_NON_WORD = re.compile(r'[\W_]+')
+_YEAR = re.compile(r'(?<!\d)(1[89]\d{2}|20\d{2})(?!\d)')
+_ID_NUMBER_SEPARATORS = re.compile(r'[\s\-./]+')
+
+# 키릴 문자 음역표 (러시아어/우크라이나어/벨라루스어/세르비아어/마케도니아어, BGN/PCGN 간략형)
+_CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh', 'з': 'z',
+    'и': 'i', 'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r',
+    'с': 's', 'т': 't', 'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh',
+    'щ': 'shch', 'ъ': '', 'ы': 'y', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    'і': 'i', 'ї': 'yi', 'є': 'ye', 'ґ': 'g', 'ў': 'u',
+    'ђ': 'dj', 'ј': 'j', 'љ': 'lj', 'њ': 'nj', 'ћ': 'c', 'џ': 'dz', 'ѓ': 'g', 'ќ': 'k', 'ѕ': 'dz'
+}
+
+# 아랍 문자 음역표 (페르시아어 추가 문자 포함, 모음 부호는 정규화 단계에서 제거)
+_ARABIC = {
+    'ا': 'a', 'أ': 'a', 'إ': 'i', 'آ': 'a', 'ٱ': 'a', 'ب': 'b', 'ت': 't', 'ث': 'th', 'ج': 'j',
+    'ح': 'h', 'خ': 'kh', 'د': 'd', 'ذ': 'dh', 'ر': 'r', 'ز': 'z', 'س': 's', 'ش': 'sh', 'ص': 's',
+    'ض': 'd', 'ط': 't', 'ظ': 'z', 'ع': '', 'غ': 'gh', 'ف': 'f', 'ق': 'q', 'ك': 'k', 'ل': 'l',
+    'م': 'm', 'ن': 'n', 'ه': 'h', 'ة': 'a', 'و': 'w', 'ي': 'y', 'ى': 'a', 'ء': '', 'ئ': 'y',
+    'ؤ': 'w', 'پ': 'p', 'چ': 'ch', 'ژ': 'zh', 'گ': 'g', 'ک': 'k', 'ی': 'y', 'ـ': ''
+}
+
+_TRANSLITERATION = str.maketrans({**_CYRILLIC, **_ARABIC})
+_NON_LATIN = re.compile('[' + ''.join(sorted({*_CYRILLIC, *_ARABIC})) + ']', re.IGNORECASE)
+
+# 음성 코드용 자음 코드 (모음과 h/w/y는 코드 없음)
+_SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'), **dict.fromkeys('cgjkqsxz', '2'), **dict.fromkeys('dt', '3'),
+    'l': '4', **dict.fromkeys('mn', '5'), 'r': '6'
+}
+
+class NameForms(NamedTuple):
+    """이름 하나의 정규화 결과"""
+    normalized: str  # 음역/악센트 제거/소문자화/구두점 제거한 형태
+    tokens: Tuple[str, ...]  # normalized의 단어 토큰
+    sorted_key: str  # 어순과 무관한 정렬된 토큰 키
+    latin: str  # 원래 대소문자를 유지한 라틴 문자 음역 (키릴/아랍 문자가 없으면 원래 이름)
+    phonetic: str  # 토큰별 음성 코드를 정렬해 이은 키
+
+def transliterate(text: str) -> str:
+    """키릴/아랍 문자를 라틴 문자로 음역합니다. 대문자로 시작하는 글자는 대문자로 시작합니다."""
+    if not text or not _NON_LATIN.search(text):
+        return text or ""
+    chars = []
+    for ch in text:
+        latin = ch.lower().translate(_TRANSLITERATION)
+        chars.append(latin.capitalize() if ch.isupper() else latin)
+    return ''.join(chars)
+
+def phonetic_code(token: str) -> str:
+    """단어 토큰의 음성 코드(Soundex 변형)를 반환합니다. 라틴 문자로 시작하지 않는 토큰은 그대로 반환합니다.
+    
+    모음 표기가 생략되는 아랍어 음역(mhmd/Muhammad/Mohamed)이 같은 코드가 되도록
+    표준 Soundex와 달리 모음을 사이에 둔 같은 자음 코드도 하나로 합칩니다.
+    """
+    if not token or not 'a' <= token[0] <= 'z':
+        return token
+    code = token[0].upper()
+    previous = _SOUNDEX_CODES.get(token[0], '')
+    for ch in token[1:]:
+        digit = _SOUNDEX_CODES.get(ch)
+        if digit is None or digit == previous:
+            continue
+        code += digit
+        previous = digit
+        if len(code) == 4:
+            break
+    return code.ljust(4, '0')
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def name_forms(name: str) -> NameForms:
+    """이름의 정규화 형태, 토큰, 정렬 키, 음역, 음성 코드를 계산합니다. (이름별 캐시)"""
+    latin = transliterate(name)
+    decomposed = unicodedata.normalize('NFKD', latin.casefold())
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    normalized = _NON_WORD.sub(' ', stripped).strip()
+    tokens = tuple(normalized.split())
+    return NameForms(
+        normalized=normalized,
+        tokens=tokens,
+        sorted_key=' '.join(sorted(set(tokens))),
+        latin=latin,
+        phonetic=' '.join(sorted({phonetic_code(token) for token in tokens}))
+    )
+
+def normalize_name(name: str) -> str:
+    """이름을 음역, 악센트 제거, 대소문자 통일, 구두점 제거한 형태로 변환합니다."""
+    if not name:
+        return ""
+    return name_forms(name).normalized
+
+def name_tokens(name: str) -> List[str]:
+    """정규화된 이름의 단어 토큰 목록을 반환합니다."""
+    if not name:
+        return []
+    return list(name_forms(name).tokens)
+
+def sorted_token_key(name: str) -> str:
+    """어순과 무관하게 같은 이름을 같은 값으로 만드는 정렬된 토큰 키를 반환합니다."""
+    if not name:
+        return ""
+    return name_forms(name).sorted_key
+
+def normalize_record(record: Dict) -> Dict:
+    """항목의 이름/별칭 정규화 결과를 normalized 필드에 기록하고 항목을 반환합니다.
+    
+    수집 단계에서 항목당 한 번 계산해 저장하므로 조회 시에는 사전/집합 비교만 하면 됩니다.
+    names, sortedKeys, phonetic은 정규화 형태가 다른 이름/별칭 순서대로 같은 위치에 대응하고,
+    latin에는 키릴/아랍 문자가 있던 이름의 음역만 담습니다. identifiers는 신분증/등록 번호 색인 키입니다.
+    """
+    names = [record.get("name", "")] + record.get("details", {}).get("aliases", [])
+    forms = {}
+    latin = []
+    for name in dict.fromkeys(names):
+        form = name_forms(name) if name else None
+        if not form or not form.tokens:
+            continue
+        forms.setdefault(form.normalized, form)
+        if form.latin != name:
+            latin.append(form.latin)
+    record[NORMALIZED_FIELD] = {
+        "names": list(forms),
+        "sortedKeys": [form.sorted_key for form in forms.values()],
+        "phonetic": [form.phonetic for form in forms.values()],
+        "latin": latin,
+        "identifiers": identifier_keys(record.get("details", {}).get("identifications", []))
+    }
+    return record
+
+def birth_years(date_text: str) -> Set[int]:
+    """생년월일 문자열에서 연도(들)를 추출합니다. 형식이 소스마다 달라 연도만 비교합니다."""
+    return {int(year) for year in _YEAR.findall(date_text or "")}
+
+def birth_year(date_text: str) -> Optional[int]:
+    """생년월일 문자열의 첫 번째 연도를 반환합니다."""
+    match = _YEAR.search(date_text or "")
+    return int(match.group(1)) if match else None
+
+def identification_key(identification: Dict) -> Tuple[str, str, str]:
+    """신분증 정보의 정규화된 키 (유형, 번호, 발급국가)를 반환합니다.
+    
+    번호의 공백/하이픈/점/슬래시와 대소문자 차이는 같은 문서로 취급합니다.
+    """
+    return (
+        str(identification.get("type", "")).strip().casefold(),
+        _ID_NUMBER_SEPARATORS.sub('', str(identification.get("number", ""))).upper(),
+        str(identification.get("country", "")).strip().casefold()
+    )
+
+def identifier_key(number: str, country: str = "") -> str:
+    """신분증/등록 번호 색인 키("번호|발급국가")를 반환합니다. 번호가 비어 있으면 빈 문자열입니다."""
+    key = identification_key({"number": number, "country": country})
+    return f"{key[1]}{IDENTIFIER_SEPARATOR}{key[2]}" if key[1] else ""
+
+def identifier_keys(identifications: List[Dict]) -> List[str]:
+    """신분증 정보 목록의 색인 키를 중복 없이 반환합니다."""
+    keys = (identifier_key(item.get("number", ""), item.get("country", ""))
+            for item in identifications if isinstance(item, dict))
+    return [key for key in dict.fromkeys(keys) if key]
+
+def record_identifiers(record: Dict) -> List[str]:
+    """항목의 신분증 색인 키를 반환합니다. 통합 단계에서 기록한 값이 있으면 그대로 사용합니다."""
+    normalized = record.get(NORMALIZED_FIELD)
+    if normalized and "identifiers" in normalized:
+        return normalized["identifiers"]
+    return identifier_keys(record.get("details", {}).get("identifications", []))
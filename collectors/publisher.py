@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+정적 사이트용 제재 데이터 배포
+통합 제재 데이터를 ID 샤드와 이름 접두어 샤드로 나누어 압축 JSON과 gzip 사본으로 저장하고,
+샤드별 해시를 담은 매니페스트를 만듭니다. 브라우저는 매니페스트를 받은 뒤 검색에 필요한
+샤드만 내려받으며, 파일 이름에 해시가 들어가므로 CDN에 장기간 캐시할 수 있습니다.
+
+샤드 규칙 (클라이언트에서 동일하게 계산):
+    ID 샤드    UTF-8로 인코딩한 ID의 FNV-1a 32비트 해시 % 샤드 수 (2자리 16진수)
+    이름 샤드  정규화한 이름/별칭 단어의 앞 NAME_PREFIX_LENGTH 글자 (파일 이름은 UTF-8 바이트의 16진수)
+
+매니페스트는 샤드 키 -> 파일 이름("<파일 키>.<내용 해시>")만 기록합니다. 샤드 파일 경로는
+"<dir>/<파일 이름>.json"(gzip 사본은 .json.gz)이며, 파일 이름이 ASCII이므로 정적 서버에서 그대로 제공됩니다.
+"""
+
+import os
+import gzip
+import json
+import time
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional, Iterable, Set, Tuple
+
+from collectors.base import OUTPUT_DIR, logger, read_records
+from collectors.normalize import name_tokens
+from collectors.metrics import metrics
+
+SHARD_DIR = os.path.join(OUTPUT_DIR, 'shards')
+ID_SHARD_COUNT = 64  # ID 샤드 수
+NAME_PREFIX_LENGTH = 2  # 이름 샤드 접두어 길이 (글자 수)
+GZIP_LEVEL = 9  # 사전 압축 수준
+HASH_LENGTH = 12  # 파일 이름에 넣을 내용 해시 길이
+
+def fnv1a_32(text: str) -> int:
+    """문자열의 FNV-1a 32비트 해시를 반환합니다. (브라우저에서도 쉽게 구현 가능한 해시)"""
+    value = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        value = ((value ^ byte) * 0x01000193) & 0xffffffff
+    return value
+
+def id_shard_key(record_id: str, shard_count: int = ID_SHARD_COUNT) -> str:
+    """ID가 속한 ID 샤드 키를 반환합니다."""
+    return format(fnv1a_32(record_id) % shard_count, '02x')
+
+def shard_file_key(key: str) -> str:
+    """샤드 키의 파일 이름용 키(UTF-8 바이트의 16진수)를 반환합니다. (비ASCII 접두어도 URL 인코딩 없이 제공)"""
+    return key.encode('utf-8').hex()
+
+class StaticPublisher:
+    """통합 제재 데이터를 정적 샤드로 배포하는 클래스"""
+    
+    def __init__(self, output_dir: str = SHARD_DIR, id_shard_count: int = ID_SHARD_COUNT,
+                 prefix_length: int = NAME_PREFIX_LENGTH):
+        """초기화"""
+        self.output_dir = output_dir
+        self.id_shard_count = id_shard_count
+        self.prefix_length = prefix_length
+        self.logger = logger
+    
+    def publish_file(self, path: Optional[str] = None) -> bool:
+        """통합 제재 데이터 파일(integrated_sanctions.json)을 읽어 배포합니다."""
+        path = path or os.path.join(OUTPUT_DIR, "integrated_sanctions.json")
+        if not os.path.exists(path):
+            self.logger.error(f"배포할 통합 제재 데이터 파일 없음: {path}")
+            return False
+        return self.publish(read_records(path))
+    
+    def publish(self, records: Iterable[Dict]) -> bool:
+        """제재 항목을 샤드로 나누어 저장하고 매니페스트를 갱신합니다."""
+        start_time = time.perf_counter()
+        try:
+            id_shards = {}
+            name_shards = {}
+            count = 0
+            for record in records:
+                id_shards.setdefault(id_shard_key(record["id"], self.id_shard_count), []).append(record)
+                
+                # 이름/별칭의 각 단어 접두어 샤드에 검색 결과 목록 표시용 요약 정보만 포함
+                names = [record.get("name", "")] + record.get("details", {}).get("aliases", [])
+                summary = [record.get("name", ""), record["id"], record.get("type", ""),
+                           record.get("source", ""), record.get("country", "")]
+                for name in dict.fromkeys(names):
+                    for key in {token[:self.prefix_length] for token in name_tokens(name)}:
+                        name_shards.setdefault(key, {}).setdefault((name, record["id"]), [name] + summary)
+                count += 1
+            
+            if count == 0:
+                self.logger.error("배포할 제재 데이터가 없습니다.")
+                return False
+            
+            os.makedirs(os.path.join(self.output_dir, "id"), exist_ok=True)
+            os.makedirs(os.path.join(self.output_dir, "names"), exist_ok=True)
+            
+            # 샤드 키 -> (파일 이름, 크기, gzip 크기)
+            id_files = {
+                key: self._write_shard("id", key, {"shard": key, "data": shard})
+                for key, shard in sorted(id_shards.items())
+            }
+            name_files = {
+                key: self._write_shard("names", key, {"prefix": key, "names": list(entries.values())})
+                for key, entries in sorted(name_shards.items())
+            }
+            shard_files = [*id_files.values(), *name_files.values()]
+            total_bytes = sum(info[1] for info in shard_files)
+            gzip_bytes = sum(info[2] for info in shard_files)
+            
+            # 파일 이름에 내용 해시가 있으므로 매니페스트에는 파일 이름만 기록 (경로와 크기는 기록하지 않음)
+            version = hashlib.sha256(''.join(info[0] for info in shard_files).encode('ascii')).hexdigest()[:HASH_LENGTH]
+            manifest = {
+                "version": version,
+                "generated": datetime.now().isoformat(),
+                "count": count,
+                "bytes": total_bytes,
+                "gzipBytes": gzip_bytes,
+                "idShards": {
+                    "count": self.id_shard_count,
+                    "hash": "fnv1a32",
+                    "dir": "id",
+                    "files": {key: info[0] for key, info in id_files.items()}
+                },
+                "nameShards": {
+                    "prefixLength": self.prefix_length,
+                    "fields": ["matchedName", "name", "id", "type", "source", "country"],
+                    "dir": "names",
+                    "files": {key: info[0] for key, info in name_files.items()}
+                }
+            }
+            self._write_manifest(manifest)
+            
+            # 새 매니페스트가 참조하지 않는 이전 샤드 삭제
+            referenced = {f"id/{info[0]}.json" for info in id_files.values()}
+            referenced.update(f"names/{info[0]}.json" for info in name_files.values())
+            removed = self._remove_stale(referenced)
+            
+            metrics.add("stage_duration_seconds", time.perf_counter() - start_time, stage="publish", source="integrated")
+            self.logger.info(f"정적 데이터 배포 완료: {count}개 항목, ID 샤드 {len(id_files)}개, "
+                             f"이름 샤드 {len(name_files)}개, {total_bytes // 1024}KB (gzip {gzip_bytes // 1024}KB), "
+                             f"이전 샤드 {removed}개 삭제")
+            return True
+        except Exception as e:
+            self.logger.error(f"정적 데이터 배포 실패: {str(e)}")
+            return False
+    
+    def _write_shard(self, kind: str, key: str, document: Dict) -> Tuple[str, int, int]:
+        """샤드 하나를 압축 JSON과 gzip 사본으로 저장하고 (파일 이름, 크기, gzip 크기)를 반환합니다.
+        
+        파일 이름("<파일 키>.<내용 해시>")에 내용 해시가 들어가므로 이미 같은 파일이 있으면 다시 쓰지 않습니다.
+        """
+        data = json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        file_key = key if kind == "id" else shard_file_key(key)
+        file_name = f"{file_key}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}"
+        path = os.path.join(self.output_dir, kind, f"{file_name}.json")
+        
+        if os.path.exists(path) and os.path.exists(f"{path}.gz"):
+            gzip_bytes = os.path.getsize(f"{path}.gz")
+        else:
+            # mtime=0으로 압축해 같은 내용이면 gzip 파일도 동일하게 유지
+            compressed = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+            self._write_atomic(path, data)
+            self._write_atomic(f"{path}.gz", compressed)
+            gzip_bytes = len(compressed)
+        return file_name, len(data), gzip_bytes
+    
+    def _write_manifest(self, manifest: Dict) -> None:
+        """매니페스트를 저장합니다. 매니페스트는 이름이 고정이므로 캐시하지 않도록 배포해야 합니다."""
+        data = json.dumps(manifest, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        path = os.path.join(self.output_dir, "manifest.json")
+        self._write_atomic(path, data)
+        self._write_atomic(f"{path}.gz", gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0))
+    
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체합니다."""
+        temp_file = f"{path}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.replace(temp_file, path)
+    
+    def _remove_stale(self, referenced: Set[str]) -> int:
+        """매니페스트가 참조하지 않는 샤드 파일을 삭제하고 삭제한 샤드 수를 반환합니다."""
+        removed = 0
+        for kind in ("id", "names"):
+            directory = os.path.join(self.output_dir, kind)
+            for file_name in os.listdir(directory):
+                shard = f"{kind}/{file_name[:-3] if file_name.endswith('.gz') else file_name}"
+                if shard not in referenced:
+                    os.remove(os.path.join(directory, file_name))
+                    if not file_name.endswith('.gz'):
+                        removed += 1
+        return removed
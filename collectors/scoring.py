@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+제재 대상 이름 일치 점수
+질의 이름과 제재 항목(이름/별칭)의 일치 점수(0~100)를 계산합니다. 단어 집합 유사도(Dice, 음성 코드만 같은
+단어는 부분 일치)와 어순과 무관한 정렬 키의 Jaro-Winkler 유사도를 합치고, 생년과 국적이 주어지면
+일치/불일치를 점수에 반영합니다. 음성 코드 부분 일치는 두 단어 이상인 질의에만 적용하므로 한 단어 질의는
+음성 코드만으로(예: bank/Banias) 기준 점수를 넘지 않습니다.
+
+기준 점수가 주어지면 길이로 계산한 Jaro-Winkler 상한과 단어 점수로 도달 가능한 최고 점수를 먼저 확인하여
+기준에 못 미치는 후보는 Jaro-Winkler(긴 이름은 비교 비용이 큼)를 계산하지 않고 0점으로 처리합니다.
+"""
+
+from functools import lru_cache
+from itertools import compress
+from operator import ne
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from collectors.countries import country_code, country_codes
+from collectors.normalize import NAME_CACHE_SIZE, name_forms, phonetic_code, birth_years
+
+TOKEN_WEIGHT = 0.5  # 단어 집합 유사도 비중 (나머지는 Jaro-Winkler)
+PHONETIC_TOKEN_CREDIT = 0.8  # 철자는 다르지만 음성 코드가 같은 단어의 일치 점수
+MIN_PHONETIC_LENGTH = 4  # 음성 코드 일치를 인정하는 최소 단어 길이 (짧은 단어는 코드가 쉽게 겹침)
+WINKLER_PREFIX = 4  # Jaro-Winkler 공통 접두어 최대 길이
+WINKLER_SCALE = 0.1  # Jaro-Winkler 접두어 가중치
+
+# 속성 일치/불일치 보정 (점수)
+BIRTH_YEAR_BONUS = 5.0
+BIRTH_YEAR_PENALTY = 20.0
+NATIONALITY_BONUS = 3.0
+NATIONALITY_PENALTY = 10.0
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _token_code(token: str) -> str:
+    """단어의 음성 코드를 반환합니다. (단어별 캐시)"""
+    return phonetic_code(token)
+
+def jaro_winkler(a: str, b: str) -> float:
+    """두 문자열의 Jaro-Winkler 유사도(0~1)를 반환합니다."""
+    if a == b:
+        return 1.0
+    len_a, len_b = len(a), len(b)
+    if not len_a or not len_b:
+        return 0.0
+    if len_a > len_b:
+        a, b, len_a, len_b = b, a, len_b, len_a
+    
+    window = max(len_b // 2 - 1, 0)
+    b_matched = [False] * len_b
+    a_matches = []
+    find = b.find
+    # 창 [i - window, i + window] 안의 아직 짝지어지지 않은 같은 문자 (min/max 호출 없이 계산, 많이 호출되는 경로)
+    for i, ch in enumerate(a):
+        start = i - window if i > window else 0
+        end = i + window + 1
+        if end > len_b:
+            end = len_b
+        j = find(ch, start, end)
+        while j != -1 and b_matched[j]:
+            j = find(ch, j + 1, end)
+        if j != -1:
+            b_matched[j] = True
+            a_matches.append(ch)
+    matches = len(a_matches)
+    if not matches:
+        return 0.0
+    
+    b_matches = list(compress(b, b_matched))
+    transpositions = sum(map(ne, a_matches, b_matches)) // 2
+    jaro = (matches / len_a + matches / len_b + (matches - transpositions) / matches) / 3
+    
+    return jaro + common_prefix_length(a, b) * WINKLER_SCALE * (1 - jaro)
+
+def jaro_winkler_bound(len_a: int, len_b: int, prefix: int = WINKLER_PREFIX) -> float:
+    """길이(와 공통 접두어 길이)만으로 계산한 Jaro-Winkler 유사도 상한을 반환합니다. (일치 문자 수는 짧은 쪽 길이 이하)"""
+    if not len_a or not len_b:
+        return 0.0
+    shorter = min(len_a, len_b)
+    jaro = (shorter / len_a + shorter / len_b + 1) / 3
+    return jaro + prefix * WINKLER_SCALE * (1 - jaro)
+
+def common_prefix_length(a: str, b: str, limit: int = WINKLER_PREFIX) -> int:
+    """두 문자열의 공통 접두어 길이(최대 limit)를 반환합니다."""
+    prefix = 0
+    for x, y in zip(a[:limit], b[:limit]):
+        if x != y:
+            break
+        prefix += 1
+    return prefix
+
+def _phonetic_matches(query_tokens: Iterable[str], tokens: Iterable[str]) -> int:
+    """음성 코드가 같은 단어 쌍의 수를 반환합니다. (단어마다 한 번만 짝지음)"""
+    codes = {}
+    for token in tokens:
+        if len(token) >= MIN_PHONETIC_LENGTH:
+            code = _token_code(token)
+            codes[code] = codes.get(code, 0) + 1
+    if not codes:
+        return 0
+    matches = 0
+    for token in query_tokens:
+        if len(token) < MIN_PHONETIC_LENGTH:
+            continue
+        code = _token_code(token)
+        if codes.get(code):
+            codes[code] -= 1
+            matches += 1
+    return matches
+
+def token_similarity(query_tokens: FrozenSet[str], tokens: FrozenSet[str]) -> float:
+    """단어 집합 Dice 유사도(0~1)를 반환합니다. 같은 단어는 1, 음성 코드만 같은 단어는 PHONETIC_TOKEN_CREDIT로 셉니다.
+    
+    음성 코드 일치는 질의가 두 단어 이상일 때만 셉니다.
+    """
+    total = len(query_tokens) + len(tokens)
+    if not total:
+        return 0.0
+    common = len(query_tokens & tokens)
+    if len(query_tokens) > 1 and common < len(query_tokens) and common < len(tokens):
+        common += PHONETIC_TOKEN_CREDIT * _phonetic_matches(query_tokens - tokens, tokens - query_tokens)
+    return 2 * common / total
+
+class MatchQuery:
+    """여러 후보와 비교할 수 있도록 한 번 정규화한 질의 (이름, 선택적 생년월일/국적)"""
+    
+    def __init__(self, name: str, birth_date: Optional[str] = None, nationality: Optional[str] = None):
+        """초기화"""
+        forms = name_forms(name or "")
+        self.name = name
+        self.tokens = frozenset(forms.tokens)
+        self.key = forms.sorted_key
+        # 음성 코드 부분 일치 허용 여부 (한 단어 질의는 같은 단어만 인정)
+        self.phonetic = len(self.tokens) > 1
+        self.birth_years = birth_years(birth_date) if birth_date else set()
+        self.nationality = nationality.strip().casefold() if nationality and nationality.strip() else None
+        self.country_code = country_code(nationality.strip()) if self.nationality else None
+    
+    @property
+    def max_bonus(self) -> float:
+        """속성 일치로 더해질 수 있는 최대 점수"""
+        return (BIRTH_YEAR_BONUS if self.birth_years else 0.0) + (NATIONALITY_BONUS if self.nationality else 0.0)
+    
+    def score_tokens(self, tokens: Iterable[str], key: str, threshold: float = 0.0) -> float:
+        """미리 정규화한 후보 이름(단어, 정렬 키)의 이름 점수(0~100)를 반환합니다.
+        
+        threshold에 도달할 수 없는 후보는 Jaro-Winkler를 계산하지 않고 0.0을 반환합니다.
+        """
+        if not key or not self.key:
+            return 0.0
+        if key == self.key:
+            return 100.0
+        # 길이 상한: 단어 점수가 만점이어도 기준 미달이면 중단
+        jw_bound = jaro_winkler_bound(len(self.key), len(key))
+        if 100 * (TOKEN_WEIGHT + (1 - TOKEN_WEIGHT) * jw_bound) < threshold:
+            return 0.0
+        tokens = tokens if isinstance(tokens, frozenset) else frozenset(tokens)
+        total = len(self.tokens) + len(tokens)
+        common = len(self.tokens & tokens)
+        unmatched = min(len(self.tokens), len(tokens)) - common if self.phonetic else 0
+        # 단어 점수 상한: 남은 단어가 모두 음성 코드로 일치해도 기준 미달이면 중단
+        token_bound = 2 * (common + PHONETIC_TOKEN_CREDIT * unmatched) / total
+        if 100 * (TOKEN_WEIGHT * token_bound + (1 - TOKEN_WEIGHT) * jw_bound) < threshold:
+            return 0.0
+        if unmatched:
+            common += PHONETIC_TOKEN_CREDIT * _phonetic_matches(self.tokens - tokens, tokens - self.tokens)
+            # 점수 상한: 실제 단어 점수와 Jaro-Winkler 상한으로도 기준 미달이면 중단
+            token_bound = 2 * common / total
+            if 100 * (TOKEN_WEIGHT * token_bound + (1 - TOKEN_WEIGHT) * jw_bound) < threshold:
+                return 0.0
+        # 실제 공통 접두어 길이로 다시 계산한 상한으로도 기준 미달이면 중단
+        jw_bound = jaro_winkler_bound(len(self.key), len(key), common_prefix_length(self.key, key))
+        if 100 * (TOKEN_WEIGHT * token_bound + (1 - TOKEN_WEIGHT) * jw_bound) < threshold:
+            return 0.0
+        return 100 * (TOKEN_WEIGHT * token_bound + (1 - TOKEN_WEIGHT) * jaro_winkler(self.key, key))
+    
+    def score_name(self, name: str, threshold: float = 0.0) -> float:
+        """후보 이름 하나의 이름 점수(0~100)를 반환합니다."""
+        forms = name_forms(name) if name else None
+        if not forms:
+            return 0.0
+        return self.score_tokens(forms.tokens, forms.sorted_key, threshold)
+    
+    def attribute_adjustment(self, record: Dict) -> float:
+        """생년과 국적 일치/불일치에 따른 점수 보정을 반환합니다. (양쪽 모두 값이 있을 때만 반영)
+        
+        국적은 국가 코드로 바꿔 비교하며('Russia'와 'Russian Federation'은 같은 나라), 감점은 양쪽 모두
+        알려진 국가 코드로 바뀌고 서로 다를 때만 합니다.
+        """
+        adjustment = 0.0
+        details = record.get("details", {})
+        if self.birth_years:
+            years = birth_years(details.get("birthDate", ""))
+            if years:
+                adjustment += BIRTH_YEAR_BONUS if years & self.birth_years else -BIRTH_YEAR_PENALTY
+        if self.nationality:
+            values = _record_countries(record)
+            countries = {value.casefold() for value in values}
+            codes = country_codes(values)
+            if self.nationality in countries or self.country_code in codes:
+                adjustment += NATIONALITY_BONUS
+            elif self.country_code and values and all(map(country_code, values)):
+                # 국가 코드로 바꿀 수 없는 표기가 있으면 같은 나라일 수 있으므로 감점하지 않음
+                adjustment -= NATIONALITY_PENALTY
+        return adjustment
+    
+    def score_record(self, record: Dict, threshold: float = 0.0) -> Tuple[float, str]:
+        """제재 항목의 이름/별칭 중 가장 잘 맞는 이름으로 (점수, 일치한 이름)을 반환합니다.
+        
+        점수는 이름 점수에 속성 보정을 더해 0~100으로 제한한 값입니다.
+        """
+        adjustment = self.attribute_adjustment(record)
+        name_threshold = threshold - adjustment
+        best, matched = 0.0, ""
+        for name in [record.get("name", "")] + record.get("details", {}).get("aliases", []):
+            score = self.score_name(name, max(name_threshold, best))
+            if score > best:
+                best, matched = score, name
+                if best >= 100.0:
+                    break
+        return clamp_score(best + adjustment) if matched else 0.0, matched
+
+def _record_countries(record: Dict) -> List[str]:
+    """항목의 국가와 국적 값을 (원래 표기로) 반환합니다."""
+    values = [record.get("country", "")] + record.get("details", {}).get("nationalities", [])
+    return list(dict.fromkeys(value.strip() for value in values if value and value.strip()))
+
+def clamp_score(score: float) -> float:
+    """점수를 0~100 범위로 제한하고 소수 둘째 자리로 반올림합니다."""
+    return round(min(100.0, max(0.0, score)), 2)
+
+def match_score(query: str, record: Dict, birth_date: Optional[str] = None,
+                nationality: Optional[str] = None) -> float:
+    """질의 하나와 제재 항목 하나의 일치 점수(0~100)를 반환합니다."""
+    return MatchQuery(query, birth_date, nationality).score_record(record)[0]
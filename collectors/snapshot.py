@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 바이너리 스냅샷
+통합 제재 데이터를 고정 폭 오프셋 테이블과 문자열 풀로 구성된 바이너리 파일로 저장하고,
+mmap으로 열어 필요한 항목만 지연 디코딩합니다. 여러 프로세스가 OS 페이지 캐시를 공유합니다.
+
+파일 구조 (리틀 엔디언, 각 구역은 8바이트 정렬):
+    헤더        매직, 항목 수, 문자열 수, 목록 수, 목록 원소 수, 각 구역 시작 위치
+    문자열 풀    u32 오프셋 테이블(문자열 수 + 1) + UTF-8 데이터
+    목록 풀      u32 오프셋 테이블(목록 수 + 1) + u32 문자열 번호 배열
+    항목 테이블  항목당 RECORD_FIELDS 개수의 u32 (문자열 또는 목록 번호)
+    ID 순서      ID 문자열 오름차순으로 정렬한 항목 번호 (이진 탐색용)
+
+테이블 필드가 아닌 나머지 내용은 '"키":값' JSON 조각의 목록으로 저장하므로 같은 값(예: 제재 프로그램 정보,
+matchScore)은 문자열 풀에서 한 번만 저장됩니다. 이름 정규화 결과(normalized)는 이름/별칭/신분증에서
+계산되는 값이므로 저장하지 않고 읽을 때 다시 계산합니다.
+"""
+
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Iterable, Iterator
+
+from collectors.normalize import NORMALIZED_FIELD, normalize_record
+
+SNAPSHOT_MAGIC = b'SANCSNP2'
+SNAPSHOT_EXTENSION = '.snap'
+
+# 항목 테이블 필드 (문자열 필드와 목록 필드)
+STRING_FIELDS = ("id", "name", "type", "country", "source")
+LIST_FIELDS = ("programs", "aliases", "nationalities", "sourceIds")
+# 나머지 내용의 JSON 조각 목록 (항목 최상위, details 안)
+REST_FIELDS = ("rest", "detailsRest")
+RECORD_FIELDS = STRING_FIELDS + LIST_FIELDS + REST_FIELDS
+_FIELD_POSITIONS = {name: position for position, name in enumerate(RECORD_FIELDS)}
+_LIST_POSITIONS = frozenset(_FIELD_POSITIONS[name] for name in LIST_FIELDS + REST_FIELDS)
+# details 안에 있는 목록 필드
+DETAIL_LIST_FIELDS = ("aliases", "nationalities")
+
+_HEADER = struct.Struct('<8sIIII6Q')
+_ALIGNMENT = 8
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+def _split_record(record: Dict) -> Dict:
+    """테이블 필드로 저장하지 않는 나머지 내용을 반환합니다.
+    
+    normalized는 값 대신 null로 남겨 읽을 때 다시 계산해야 함을 표시합니다.
+    """
+    rest = {key: value for key, value in record.items() if key not in STRING_FIELDS and key not in LIST_FIELDS}
+    if NORMALIZED_FIELD in rest:
+        rest[NORMALIZED_FIELD] = None
+    details = rest.get("details")
+    if isinstance(details, dict):
+        rest["details"] = {key: value for key, value in details.items() if key not in DETAIL_LIST_FIELDS}
+    return rest
+
+def _join_fragments(rest: List[str], details: List[str]) -> List[Dict]:
+    """최상위와 details의 '"키":값' JSON 조각 목록을 한 번에 사전 두 개로 디코딩합니다."""
+    return json.loads('[{' + ','.join(rest) + '},{' + ','.join(details) + '}]')
+
+def _list_field(record: Dict, field: str) -> List[str]:
+    """항목의 목록 필드 값을 반환합니다. (details 안의 필드 포함)"""
+    if field in DETAIL_LIST_FIELDS:
+        return record.get("details", {}).get(field, [])
+    return record.get(field, [])
+
+def _u32_bytes(values: Iterable[int]) -> bytes:
+    """u32 배열을 리틀 엔디언 바이트로 변환합니다."""
+    data = array('I', values)
+    if not _NATIVE_LITTLE_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+def write_snapshot(path: str, records: Iterable[Dict]) -> int:
+    """제재 항목을 바이너리 스냅샷으로 저장하고 항목 수를 반환합니다. 임시 파일에 쓴 뒤 교체합니다.
+    
+    항목은 한 번만 순회하므로 디스크에 둔 항목 목록도 그대로 넘길 수 있습니다.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    strings = {}
+    lists = {(): 0}
+    list_items = []
+    list_offsets = [0, 0]
+    rows = []
+    ids = []
+    
+    def string_id(value) -> int:
+        value = value if isinstance(value, str) else str(value or "")
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+    
+    def list_id(values: List) -> int:
+        key = tuple(string_id(value) for value in values)
+        index = lists.get(key)
+        if index is None:
+            index = lists[key] = len(lists)
+            list_items.extend(key)
+            list_offsets.append(len(list_items))
+        return index
+    
+    def fragments(content: Dict) -> List[str]:
+        return [f"{encode(key)}:{encode(value)}" for key, value in content.items()]
+    
+    for record in records:
+        rows.extend(string_id(record.get(field, "")) for field in STRING_FIELDS)
+        rows.extend(list_id(_list_field(record, field)) for field in LIST_FIELDS)
+        rest = _split_record(record)
+        details = rest.get("details")
+        if isinstance(details, dict):
+            # details 자리에는 빈 객체만 남기고 내용은 별도 조각 목록으로 저장
+            rest["details"] = {}
+        rows.append(list_id(fragments(rest)))
+        rows.append(list_id(fragments(details) if isinstance(details, dict) else []))
+        ids.append(record["id"])
+    
+    id_order = sorted(range(len(ids)), key=ids.__getitem__)
+    
+    # 문자열 풀 (삽입 순서 = 문자열 번호)
+    string_offsets = [0]
+    string_chunks = []
+    for value in strings:
+        encoded = value.encode('utf-8')
+        string_chunks.append(encoded)
+        string_offsets.append(string_offsets[-1] + len(encoded))
+    
+    sections = [
+        _u32_bytes(string_offsets),
+        b''.join(string_chunks),
+        _u32_bytes(list_offsets),
+        _u32_bytes(list_items),
+        _u32_bytes(rows),
+        _u32_bytes(id_order)
+    ]
+    
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'wb') as f:
+        offsets = []
+        position = _HEADER.size
+        for section in sections:
+            position += -position % _ALIGNMENT
+            offsets.append(position)
+            position += len(section)
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, len(ids), len(strings), len(lists), len(list_items), *offsets))
+        for offset, section in zip(offsets, sections):
+            f.write(b'\0' * (offset - f.tell()))
+            f.write(section)
+    os.replace(temp_file, path)
+    return len(ids)
+
+class SanctionsSnapshot(Sequence):
+    """mmap으로 연 바이너리 스냅샷. 항목은 접근할 때 디코딩합니다."""
+    
+    def __init__(self, path: str):
+        """스냅샷 파일을 읽기 전용으로 매핑합니다."""
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap)
+        
+        magic, self._count, string_count, list_count, item_count, *offsets = _HEADER.unpack_from(self._data)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"스냅샷 형식이 아닙니다: {path}")
+        string_offsets, self._string_base, list_offsets, list_items, rows, id_order = offsets
+        
+        self._string_offsets = self._u32_table(string_offsets, string_count + 1)
+        self._list_offsets = self._u32_table(list_offsets, list_count + 1)
+        self._list_items = self._u32_table(list_items, item_count)
+        self._rows = self._u32_table(rows, self._count * len(RECORD_FIELDS))
+        self._id_order = self._u32_table(id_order, self._count)
+    
+    def _u32_table(self, offset: int, count: int) -> Sequence[int]:
+        """u32 테이블을 복사 없이 참조합니다. (빅 엔디언 환경에서는 변환한 복사본 사용)"""
+        view = self._data[offset:offset + count * 4]
+        if _NATIVE_LITTLE_ENDIAN:
+            return view.cast('I')
+        table = array('I', view)
+        table.byteswap()
+        return table
+    
+    def close(self) -> None:
+        """매핑을 해제합니다."""
+        for name in ("_string_offsets", "_list_offsets", "_list_items", "_rows", "_id_order"):
+            table = self.__dict__.pop(name, None)
+            if isinstance(table, memoryview):
+                table.release()
+        self._data.release()
+        self._mmap.close()
+    
+    def __enter__(self) -> "SanctionsSnapshot":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def string(self, index: int) -> str:
+        """문자열 풀의 index번 문자열을 반환합니다."""
+        start = self._string_base + self._string_offsets[index]
+        end = self._string_base + self._string_offsets[index + 1]
+        return str(self._data[start:end], 'utf-8')
+    
+    def _field(self, index: int, field: int) -> int:
+        return self._rows[index * len(RECORD_FIELDS) + field]
+    
+    def field(self, index: int, name: str):
+        """index번 항목의 필드 하나만 디코딩합니다. (문자열 또는 목록 필드)"""
+        field = _FIELD_POSITIONS[name]
+        value = self._field(index, field)
+        if field in _LIST_POSITIONS:
+            start, end = self._list_offsets[value], self._list_offsets[value + 1]
+            return [self.string(item) for item in self._list_items[start:end]]
+        return self.string(value)
+    
+    def id(self, index: int) -> str:
+        """index번 항목의 ID를 반환합니다."""
+        return self.string(self._field(index, 0))
+    
+    def names(self, index: int) -> List[str]:
+        """index번 항목의 이름과 별칭을 반환합니다. (검색 인덱스 생성용)"""
+        return [self.field(index, "name")] + self.field(index, "aliases")
+    
+    def __getitem__(self, index: int) -> Dict:
+        """index번 항목 전체를 디코딩합니다."""
+        return self.record(index)
+    
+    def record(self, index: int, normalized: bool = True) -> Dict:
+        """index번 항목 전체를 디코딩합니다. normalized가 False이면 이름 정규화 결과를 다시 계산하지 않습니다."""
+        if not isinstance(index, int):
+            raise TypeError("스냅샷 항목 번호는 정수여야 합니다")
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        
+        record = {name: self.field(index, name) for name in STRING_FIELDS + ("programs",)}
+        rest, details_rest = _join_fragments(self.field(index, "rest"), self.field(index, "detailsRest"))
+        details = rest.pop("details", None)
+        record.update(rest)
+        if details is not None:
+            details.update(details_rest)
+            for name in DETAIL_LIST_FIELDS:
+                details[name] = self.field(index, name)
+            record["details"] = details
+        source_ids = self.field(index, "sourceIds")
+        if source_ids:
+            record["sourceIds"] = source_ids
+        if NORMALIZED_FIELD in record:
+            if normalized:
+                normalize_record(record)
+            else:
+                del record[NORMALIZED_FIELD]
+        return record
+    
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(self._count):
+            yield self[index]
+    
+    def iter_records(self, normalized: bool = True) -> Iterator[Dict]:
+        """항목을 순서대로 디코딩합니다. (전체를 훑는 작업은 normalized=False로 정규화 비용을 생략)"""
+        for index in range(self._count):
+            yield self.record(index, normalized)
+    
+    def find(self, record_id: str) -> Optional[int]:
+        """ID로 항목 번호를 이진 탐색합니다."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self.id(self._id_order[middle]) < record_id:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self.id(self._id_order[low]) == record_id:
+            return self._id_order[low]
+        return None
+    
+    def get(self, record_id: str) -> Optional[Dict]:
+        """ID로 항목을 반환합니다."""
+        index = self.find(record_id)
+        return self[index] if index is not None else None
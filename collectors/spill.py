@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+디스크로 내보낼 수 있는 제재 항목 목록
+통합기가 소스 데이터를 읽고 병합하는 동안 항목을 보관합니다. 메모리 예산이 충분하면 리스트와 ID 사전으로
+메모리에 두고, 부족하면 임시 SQLite 파일에 JSON으로 두어 메모리에는 현재 처리 중인 항목만 남깁니다.
+두 방식 모두 같은 인터페이스(위치/ID 조회, 교체, 순서대로 순회)를 제공합니다.
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Iterable, Iterator
+
+SPILL_BATCH_SIZE = 2000  # 한 번에 쓰고 읽을 항목 수
+SPILL_CACHE_KB = 8 * 1024  # 임시 SQLite 페이지 캐시 크기 (KB)
+
+class RecordStore(Sequence):
+    """ID로 찾고 위치로 접근할 수 있는 제재 항목 목록
+    
+    spill이 True이면 항목을 directory의 임시 SQLite 파일에 저장합니다. 이때 조회한 항목은 사본이므로
+    변경 내용을 남기려면 replace()로 다시 저장해야 합니다.
+    """
+    
+    def __init__(self, spill: bool = False, directory: Optional[str] = None):
+        """초기화"""
+        self.spilled = spill
+        self._records: List[Dict] = []
+        self._positions: Dict[str, int] = {}
+        self._pending: List[tuple] = []
+        self._count = 0
+        self._conn = None
+        self._path = None
+        if spill:
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fd, self._path = tempfile.mkstemp(suffix='.spill.db', dir=directory)
+            os.close(fd)
+            self._conn = sqlite3.connect(self._path)
+            # 임시 파일이므로 저널/동기화 없이 사용하고 페이지 캐시 크기를 제한
+            self._conn.execute("PRAGMA journal_mode = OFF")
+            self._conn.execute("PRAGMA synchronous = OFF")
+            self._conn.execute(f"PRAGMA cache_size = -{SPILL_CACHE_KB}")
+            self._conn.execute("CREATE TABLE records (seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, data TEXT NOT NULL)")
+            self._encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> Dict:
+        if not self.spilled:
+            return self._records[index]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        self._flush()
+        row = self._conn.execute("SELECT data FROM records WHERE seq = ?", (index,)).fetchone()
+        return json.loads(row[0])
+    
+    def __iter__(self) -> Iterator[Dict]:
+        if not self.spilled:
+            yield from self._records
+            return
+        self._flush()
+        # 배치마다 질의를 끝내므로 순회 중에 replace()를 호출해도 안전
+        for start in range(0, self._count, SPILL_BATCH_SIZE):
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE seq >= ? AND seq < ? ORDER BY seq",
+                (start, start + SPILL_BATCH_SIZE)
+            ).fetchall()
+            for (data,) in rows:
+                yield json.loads(data)
+    
+    def find(self, record_id: str) -> Optional[int]:
+        """ID에 해당하는 항목의 위치를 반환합니다. 없으면 None입니다."""
+        if not self.spilled:
+            return self._positions.get(record_id)
+        self._flush()
+        row = self._conn.execute("SELECT seq FROM records WHERE id = ?", (record_id,)).fetchone()
+        return row[0] if row else None
+    
+    def append(self, record: Dict) -> int:
+        """항목을 추가하고 위치를 반환합니다."""
+        index = self._count
+        if self.spilled:
+            self._pending.append((index, record["id"], self._encode(record)))
+            if len(self._pending) >= SPILL_BATCH_SIZE:
+                self._flush()
+        else:
+            self._records.append(record)
+            self._positions[record["id"]] = index
+        self._count += 1
+        return index
+    
+    def replace(self, index: int, record: Dict) -> None:
+        """위치의 항목을 교체합니다. (ID는 바뀌지 않아야 함)"""
+        if not self.spilled:
+            self._records[index] = record
+            return
+        self._flush()
+        self._conn.execute("UPDATE records SET data = ? WHERE seq = ?", (self._encode(record), index))
+    
+    def rewrite(self, records: Iterable[Dict]) -> None:
+        """순회 결과를 변환한 항목들로 같은 위치의 항목을 차례로 교체합니다.
+        
+        records는 보통 이 목록을 순회하며 항목을 변환하는 이터레이터이며, 디스크 방식에서는 배치로 다시 저장합니다.
+        """
+        if not self.spilled:
+            for index, record in enumerate(records):
+                self._records[index] = record
+            return
+        batch = []
+        for index, record in enumerate(records):
+            batch.append((self._encode(record), index))
+            if len(batch) >= SPILL_BATCH_SIZE:
+                self._conn.executemany("UPDATE records SET data = ? WHERE seq = ?", batch)
+                batch.clear()
+        if batch:
+            self._conn.executemany("UPDATE records SET data = ? WHERE seq = ?", batch)
+    
+    def _flush(self) -> None:
+        """쌓인 추가 항목을 임시 파일에 씁니다."""
+        if self._pending:
+            self._conn.executemany("INSERT INTO records VALUES (?, ?, ?)", self._pending)
+            self._pending.clear()
+    
+    def close(self) -> None:
+        """메모리 항목을 비우고 임시 파일을 삭제합니다."""
+        self._records = []
+        self._positions = {}
+        self._pending = []
+        self._count = 0
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._path and os.path.exists(self._path):
+            os.remove(self._path)
+        self._path = None
+    
+    def __enter__(self) -> "RecordStore":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
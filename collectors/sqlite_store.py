@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 SQLite 저장소
+통합 제재 데이터를 정규화된 테이블(항목, 별칭, 프로그램, 제재, 국적, 주소, 신분증)과
+이름/별칭 FTS5 전문 검색 테이블로 저장합니다. 별도 서비스 없이 어느 프로세스에서든
+색인된 조회를 적은 메모리로 수행할 수 있습니다.
+"""
+
+import os
+import json
+import sqlite3
+from typing import Dict, List, Optional, Iterable, Tuple
+
+from collectors.base import logger
+from collectors.normalize import identification_key
+
+SQLITE_BATCH_SIZE = 5000  # executemany 한 번에 넣을 항목 수
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE records (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    type TEXT,
+    country TEXT,
+    source TEXT,
+    birth_date TEXT,
+    content_hash TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE source_ids (record_rowid INTEGER NOT NULL, source_id TEXT NOT NULL);
+CREATE TABLE aliases (record_rowid INTEGER NOT NULL, alias TEXT NOT NULL);
+CREATE TABLE programs (record_rowid INTEGER NOT NULL, program TEXT NOT NULL);
+CREATE TABLE sanctions (record_rowid INTEGER NOT NULL, program TEXT, start_date TEXT, reason TEXT);
+CREATE TABLE nationalities (record_rowid INTEGER NOT NULL, nationality TEXT NOT NULL);
+CREATE TABLE addresses (record_rowid INTEGER NOT NULL, address TEXT NOT NULL);
+CREATE TABLE identifications (
+    record_rowid INTEGER NOT NULL,
+    type TEXT,
+    number TEXT,
+    country TEXT,
+    number_key TEXT
+);
+"""
+
+# 적재 후 생성하는 인덱스 (적재 중 인덱스 갱신 비용 회피)
+INDEXES = """
+CREATE INDEX idx_records_type ON records (type);
+CREATE INDEX idx_records_country ON records (country COLLATE NOCASE);
+CREATE INDEX idx_records_source ON records (source);
+CREATE INDEX idx_source_ids ON source_ids (source_id);
+CREATE INDEX idx_aliases_record ON aliases (record_rowid);
+CREATE INDEX idx_programs_program ON programs (program COLLATE NOCASE, record_rowid);
+CREATE INDEX idx_sanctions_start_date ON sanctions (start_date, record_rowid);
+CREATE INDEX idx_nationalities ON nationalities (nationality COLLATE NOCASE, record_rowid);
+CREATE INDEX idx_addresses_record ON addresses (record_rowid);
+CREATE INDEX idx_identifications_number ON identifications (number_key, country);
+"""
+
+# 이름/별칭 전문 검색 테이블 (악센트 무시)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE names_fts USING fts5(
+    name,
+    record_rowid UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+def _record_rows(rowid: int, record: Dict, encode) -> Dict[str, List[Tuple]]:
+    """항목 하나를 테이블별 행으로 분해합니다."""
+    details = record.get("details", {})
+    name = record.get("name", "")
+    aliases = details.get("aliases", [])
+    return {
+        "records": [(
+            rowid, record["id"], name, record.get("type", ""), record.get("country", ""),
+            record.get("source", ""), details.get("birthDate", ""), record.get("contentHash"), encode(record)
+        )],
+        "source_ids": [(rowid, source_id) for source_id in record.get("sourceIds", [])],
+        "aliases": [(rowid, alias) for alias in aliases],
+        "programs": [(rowid, program) for program in record.get("programs", [])],
+        "sanctions": [
+            (rowid, sanction.get("program", ""), sanction.get("startDate", ""), sanction.get("reason", ""))
+            for sanction in details.get("sanctions", [])
+        ],
+        "nationalities": [(rowid, nationality) for nationality in details.get("nationalities", [])],
+        "addresses": [(rowid, address) for address in details.get("addresses", []) if isinstance(address, str)],
+        "identifications": [
+            (rowid, item.get("type", ""), item.get("number", ""), item.get("country", ""), identification_key(item)[1])
+            for item in details.get("identifications", []) if isinstance(item, dict)
+        ],
+        "names_fts": [(value, rowid) for value in dict.fromkeys([name, *aliases]) if value]
+    }
+
+_INSERTS = {
+    "records": "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "source_ids": "INSERT INTO source_ids VALUES (?, ?)",
+    "aliases": "INSERT INTO aliases VALUES (?, ?)",
+    "programs": "INSERT INTO programs VALUES (?, ?)",
+    "sanctions": "INSERT INTO sanctions VALUES (?, ?, ?, ?)",
+    "nationalities": "INSERT INTO nationalities VALUES (?, ?)",
+    "addresses": "INSERT INTO addresses VALUES (?, ?)",
+    "identifications": "INSERT INTO identifications VALUES (?, ?, ?, ?, ?)",
+    "names_fts": "INSERT INTO names_fts (name, record_rowid) VALUES (?, ?)"
+}
+
+def write_sqlite(path: str, records: Iterable[Dict], meta: Optional[Dict] = None) -> int:
+    """제재 항목을 SQLite 데이터베이스로 저장하고 항목 수를 반환합니다.
+    
+    임시 파일에 만든 뒤 교체하므로 읽는 프로세스는 항상 완성된 데이터베이스를 봅니다.
+    FTS5를 지원하지 않는 SQLite에서는 전문 검색 테이블 없이 저장합니다.
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    temp_file = f"{path}.tmp"
+    if os.path.exists(temp_file):
+        os.remove(temp_file)
+    
+    conn = sqlite3.connect(temp_file)
+    try:
+        # 새 파일을 한 번에 만드므로 저널/동기화 없이 적재
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.executescript(SCHEMA)
+        try:
+            conn.executescript(FTS_SCHEMA)
+            tables = list(_INSERTS)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"SQLite FTS5 사용 불가, 전문 검색 테이블 생략: {str(e)}")
+            tables = [table for table in _INSERTS if table != "names_fts"]
+        
+        count = 0
+        batch = {table: [] for table in tables}
+        
+        def flush():
+            for table in tables:
+                if batch[table]:
+                    conn.executemany(_INSERTS[table], batch[table])
+                    batch[table].clear()
+        
+        with conn:
+            for count, record in enumerate(records, 1):
+                for table, rows in _record_rows(count, record, encode).items():
+                    if table in batch:
+                        batch[table].extend(rows)
+                if count % SQLITE_BATCH_SIZE == 0:
+                    flush()
+            flush()
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                (key, value if isinstance(value, str) else encode(value))
+                for key, value in dict(meta or {}, count=count).items()
+            ])
+        
+        conn.executescript(INDEXES)
+        if "names_fts" in tables:
+            conn.execute("INSERT INTO names_fts (names_fts) VALUES ('optimize')")
+            conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    
+    os.replace(temp_file, path)
+    return count
+
+def _fts_query(query: str) -> str:
+    """검색어를 FTS5 질의로 변환합니다. 각 단어를 따옴표로 감싸 접두 일치로 검색합니다."""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return ' '.join(f'"{term}"*' for term in terms)
+
+def search_sqlite(conn: sqlite3.Connection, query: str, country: Optional[str] = None,
+                  program: Optional[str] = None, limit: int = 20) -> List[Dict]:
+    """이름/별칭 전문 검색과 국가/프로그램 필터로 제재 항목을 조회합니다. (bm25 순)"""
+    sql = [
+        "SELECT r.data FROM (SELECT record_rowid, rank FROM names_fts WHERE names_fts MATCH ?) f",
+        "JOIN records r ON r.rowid = f.record_rowid WHERE 1"
+    ]
+    params = [_fts_query(query)]
+    if country:
+        sql.append("AND (r.country = ? COLLATE NOCASE OR EXISTS (SELECT 1 FROM nationalities n "
+                   "WHERE n.record_rowid = r.rowid AND n.nationality = ? COLLATE NOCASE))")
+        params.extend([country, country])
+    if program:
+        sql.append("AND EXISTS (SELECT 1 FROM programs p WHERE p.record_rowid = r.rowid AND p.program = ? COLLATE NOCASE)")
+        params.append(program)
+    sql.append("GROUP BY r.rowid ORDER BY min(f.rank) LIMIT ?")
+    params.append(limit)
+    return [json.loads(row[0]) for row in conn.execute(' '.join(sql), params)]
+
+def open_sqlite(path: str) -> sqlite3.Connection:
+    """SQLite 저장소를 읽기 전용으로 엽니다."""
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
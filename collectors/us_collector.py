@@ -5,20 +5,25 @@ US OFAC 제재 데이터 수집기
 """
 
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Iterator
 
-from collectors.base import SanctionsCollector, logger
+from collectors.base import SanctionsCollector, logger, iter_xml_elements
 
 # US OFAC 제재 데이터 URL
 US_SANCTIONS_URL = "https://www.treasury.gov/ofac/downloads/sdn.xml"
+# US OFAC 제재 데이터 압축본 URL (XML 대비 전송량이 훨씬 작음)
+US_SANCTIONS_ZIP_URL = "https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/SDN_XML.ZIP"
+# US OFAC XML 네임스페이스
+OFAC_NAMESPACES = {'ofac': 'https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/XML'}
 
 
 class USSanctionsCollector(SanctionsCollector):
     """US OFAC 제재 데이터 수집기 클래스"""
     
     def __init__(self):
-        super().__init__("US")
+        super().__init__("US", "US OFAC")
         self._url = US_SANCTIONS_URL
+        self._zip_url = US_SANCTIONS_ZIP_URL
     
     def download_data(self, output_file=None) -> Optional[bytes]:
         """데이터를 다운로드합니다."""
@@ -31,165 +36,166 @@ class USSanctionsCollector(SanctionsCollector):
         """소스 URL을 반환합니다."""
         return self._url
     
-    def collect(self) -> bool:
-        """US OFAC 제재 데이터를 수집합니다."""
-        logger.info("US OFAC 제재 데이터 수집 시작")
+    @property
+    def source_urls(self) -> List[str]:
+        """시도할 원본 URL 목록을 반환합니다. (압축본 실패 시 XML 원본)"""
+        return [self._zip_url, self._url]
+    
+    def parse_tree(self, xml_data: bytes) -> List[Dict]:
+        """US OFAC 제재 데이터 XML을 통합 형식으로 변환합니다."""
+        # 네임스페이스 처리
+        ns = OFAC_NAMESPACES
+        
+        # XML 파싱
+        tree = ET.fromstring(xml_data)
+        
+        # 총 엔트리 수 확인
+        publish_info = tree.find('.//ofac:publshInformation', ns)
+        if publish_info is not None:
+            record_count = publish_info.find('.//ofac:Record_Count', ns)
+            if record_count is not None and record_count.text:
+                logger.info(f"총 레코드 수: {record_count.text}")
         
-        # 데이터 다운로드
-        xml_data = self.download_data("us_sanctions.xml")
-        if xml_data is None:
-            logger.error("US OFAC 제재 데이터 다운로드 실패")
-            return False
+        # 제재 데이터 추출
+        sanctions = []
         
+        # SDN 항목 처리
+        for sdn_entry in tree.findall('.//ofac:sdnEntry', ns):
+            sanction = self._parse_entry(sdn_entry, ns)
+            if sanction:
+                sanctions.append(sanction)
+            else:
+                self.record_skipped()
+        
+        return sanctions
+    
+    def iter_records(self, source) -> Iterator[Dict]:
+        """US OFAC 제재 데이터를 스트리밍 파싱하여 sdnEntry 항목을 하나씩 반환합니다."""
+        for _, sdn_entry in iter_xml_elements(source, ('sdnEntry',)):
+            sanction = self._parse_entry(sdn_entry, OFAC_NAMESPACES)
+            if sanction:
+                yield sanction
+            else:
+                self.record_skipped()
+    
+    def _parse_entry(self, sdn_entry, ns) -> Optional[Dict]:
+        """SDN 항목(sdnEntry) 하나를 파싱합니다. 유효하지 않으면 None을 반환합니다."""
         try:
-            # XML 파싱
-            # 네임스페이스 처리
-            ns = {'ofac': 'https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/XML'}
+            # 기본 정보
+            uid = sdn_entry.find('ofac:uid', ns)
+            uid_value = uid.text if uid is not None else "UNKNOWN"
             
-            # XML 파싱
-            tree = ET.fromstring(xml_data)
+            # 단체명/성
+            last_name = sdn_entry.find('ofac:lastName', ns)
+            last_name_value = last_name.text.strip() if last_name is not None and last_name.text else ""
             
-            # 총 엔트리 수 확인
-            publish_info = tree.find('.//ofac:publshInformation', ns)
-            if publish_info is not None:
-                record_count = publish_info.find('.//ofac:Record_Count', ns)
-                if record_count is not None and record_count.text:
-                    logger.info(f"총 레코드 수: {record_count.text}")
+            # 개인명/이름
+            first_name = sdn_entry.find('ofac:firstName', ns)
+            first_name_value = first_name.text.strip() if first_name is not None and first_name.text else ""
             
-            # 제재 데이터 추출
-            sanctions = []
+            # 유형 결정
+            sdn_type = sdn_entry.find('ofac:sdnType', ns)
+            sdn_type_value = sdn_type.text.strip() if sdn_type is not None and sdn_type.text else "UNKNOWN"
             
-            # SDN 항목 처리
-            for sdn_entry in tree.findall('.//ofac:sdnEntry', ns):
-                try:
-                    # 기본 정보
-                    uid = sdn_entry.find('ofac:uid', ns)
-                    uid_value = uid.text if uid is not None else "UNKNOWN"
-                    
-                    # 단체명/성
-                    last_name = sdn_entry.find('ofac:lastName', ns)
-                    last_name_value = last_name.text.strip() if last_name is not None and last_name.text else ""
-                    
-                    # 개인명/이름
-                    first_name = sdn_entry.find('ofac:firstName', ns)
-                    first_name_value = first_name.text.strip() if first_name is not None and first_name.text else ""
-                    
-                    # 유형 결정
-                    sdn_type = sdn_entry.find('ofac:sdnType', ns)
-                    sdn_type_value = sdn_type.text.strip() if sdn_type is not None and sdn_type.text else "UNKNOWN"
-                    
-                    # 최종 이름 설정
-                    if sdn_type_value == "Individual":
-                        full_name = f"{first_name_value} {last_name_value}".strip()
-                    else:
-                        full_name = last_name_value
-                    
-                    if not full_name:
-                        logger.warning(f"ID {uid_value}의 이름 정보 없음, 건너뜀")
-                        continue
-                    
-                    # 프로그램 정보
-                    programs = []
-                    program_list = sdn_entry.find('ofac:programList', ns)
-                    if program_list is not None:
-                        for program in program_list.findall('ofac:program', ns):
-                            if program is not None and program.text:
-                                programs.append(program.text.strip())
-                    
-                    # 별칭 정보
-                    aliases = []
-                    aka_list = sdn_entry.find('ofac:akaList', ns)
-                    if aka_list is not None:
-                        for aka in aka_list.findall('ofac:aka', ns):
-                            aka_name = aka.find('ofac:lastName', ns)
-                            if aka_name is not None and aka_name.text:
-                                aliases.append(aka_name.text.strip())
-                    
-                    # 주소 정보
-                    addresses = []
-                    address_list = sdn_entry.find('ofac:addressList', ns)
-                    if address_list is not None:
-                        for address in address_list.findall('ofac:address', ns):
-                            addr_parts = []
-                            
-                            for field in ['address1', 'address2', 'address3', 'city', 'stateOrProvince', 'postalCode', 'country']:
-                                value = address.find(f'ofac:{field}', ns)
-                                if value is not None and value.text:
-                                    addr_parts.append(value.text.strip())
-                            
-                            if addr_parts:
-                                addresses.append(', '.join(addr_parts))
-                    
-                    # 국적 정보
-                    nationalities = []
-                    nationality_list = sdn_entry.find('ofac:nationalityList', ns)
-                    if nationality_list is not None:
-                        for nationality in nationality_list.findall('ofac:nationality', ns):
-                            country = nationality.find('ofac:country', ns)
-                            if country is not None and country.text:
-                                nationalities.append(country.text.strip())
+            # 최종 이름 설정
+            if sdn_type_value == "Individual":
+                full_name = f"{first_name_value} {last_name_value}".strip()
+            else:
+                full_name = last_name_value
+            
+            if not full_name:
+                logger.warning(f"ID {uid_value}의 이름 정보 없음, 건너뜀")
+                return None
+            
+            # 프로그램 정보
+            programs = []
+            program_list = sdn_entry.find('ofac:programList', ns)
+            if program_list is not None:
+                for program in program_list.findall('ofac:program', ns):
+                    if program is not None and program.text:
+                        programs.append(program.text.strip())
+            
+            # 별칭 정보
+            aliases = []
+            aka_list = sdn_entry.find('ofac:akaList', ns)
+            if aka_list is not None:
+                for aka in aka_list.findall('ofac:aka', ns):
+                    aka_name = aka.find('ofac:lastName', ns)
+                    if aka_name is not None and aka_name.text:
+                        aliases.append(aka_name.text.strip())
+            
+            # 주소 정보
+            addresses = []
+            address_list = sdn_entry.find('ofac:addressList', ns)
+            if address_list is not None:
+                for address in address_list.findall('ofac:address', ns):
+                    addr_parts = []
                     
-                    # ID 문서 정보
-                    identifications = []
-                    id_list = sdn_entry.find('ofac:idList', ns)
-                    if id_list is not None:
-                        for id_doc in id_list.findall('ofac:id', ns):
-                            id_type = id_doc.find('ofac:idType', ns)
-                            id_number = id_doc.find('ofac:idNumber', ns)
-                            id_country = id_doc.find('ofac:idCountry', ns)
-                            
-                            if id_type is not None and id_type.text and id_number is not None and id_number.text:
-                                identification = {
-                                    "type": id_type.text.strip(),
-                                    "number": id_number.text.strip(),
-                                    "country": id_country.text.strip() if id_country is not None and id_country.text else ""
-                                }
-                                identifications.append(identification)
+                    for field in ['address1', 'address2', 'address3', 'city', 'stateOrProvince', 'postalCode', 'country']:
+                        value = address.find(f'ofac:{field}', ns)
+                        if value is not None and value.text:
+                            addr_parts.append(value.text.strip())
                     
-                    # 생년월일 정보
-                    birth_date = ""
-                    dob_list = sdn_entry.find('ofac:dateOfBirthList', ns)
-                    if dob_list is not None:
-                        for dob_item in dob_list.findall('ofac:dateOfBirthItem', ns):
-                            dob = dob_item.find('ofac:dateOfBirth', ns)
-                            if dob is not None and dob.text:
-                                birth_date = dob.text.strip()
-                                break
+                    if addr_parts:
+                        addresses.append(', '.join(addr_parts))
+            
+            # 국적 정보
+            nationalities = []
+            nationality_list = sdn_entry.find('ofac:nationalityList', ns)
+            if nationality_list is not None:
+                for nationality in nationality_list.findall('ofac:nationality', ns):
+                    country = nationality.find('ofac:country', ns)
+                    if country is not None and country.text:
+                        nationalities.append(country.text.strip())
+            
+            # ID 문서 정보
+            identifications = []
+            id_list = sdn_entry.find('ofac:idList', ns)
+            if id_list is not None:
+                for id_doc in id_list.findall('ofac:id', ns):
+                    id_type = id_doc.find('ofac:idType', ns)
+                    id_number = id_doc.find('ofac:idNumber', ns)
+                    id_country = id_doc.find('ofac:idCountry', ns)
                     
-                    # 통합 형식으로 변환
-                    sanction = {
-                        "id": f"OFAC-{uid_value}",
-                        "name": full_name,
-                        "type": sdn_type_value,
-                        "country": nationalities[0] if nationalities else "",
-                        "programs": programs,
-                        "source": "US-OFAC",
-                        "matchScore": 100,
-                        "details": {
-                            "aliases": aliases,
-                            "birthDate": birth_date,
-                            "sanctions": [{"program": prog, "startDate": "", "reason": ""} for prog in programs],
-                            "addresses": addresses,
-                            "nationalities": nationalities,
-                            "identifications": identifications
+                    if id_type is not None and id_type.text and id_number is not None and id_number.text:
+                        identification = {
+                            "type": id_type.text.strip(),
+                            "number": id_number.text.strip(),
+                            "country": id_country.text.strip() if id_country is not None and id_country.text else ""
                         }
-                    }
-                    
-                    sanctions.append(sanction)
-                    
-                except Exception as e:
-                    logger.warning(f"유효하지 않은 US OFAC 제재 데이터: {str(e)}")
-                    continue
+                        identifications.append(identification)
             
-            # JSON으로 저장
-            if sanctions:
-                return self.save_data(sanctions)
-            else:
-                logger.error("US OFAC 제재 데이터 없음")
-                return False
-                
+            # 생년월일 정보
+            birth_date = ""
+            dob_list = sdn_entry.find('ofac:dateOfBirthList', ns)
+            if dob_list is not None:
+                for dob_item in dob_list.findall('ofac:dateOfBirthItem', ns):
+                    dob = dob_item.find('ofac:dateOfBirth', ns)
+                    if dob is not None and dob.text:
+                        birth_date = dob.text.strip()
+                        break
+            
+            # 통합 형식으로 변환
+            sanction = {
+                "id": f"OFAC-{uid_value}",
+                "name": full_name,
+                "type": sdn_type_value,
+                "country": nationalities[0] if nationalities else "",
+                "programs": programs,
+                "source": "US-OFAC",
+                "matchScore": 100,
+                "details": {
+                    "aliases": aliases,
+                    "birthDate": birth_date,
+                    "sanctions": [{"program": prog, "startDate": "", "reason": ""} for prog in programs],
+                    "addresses": addresses,
+                    "nationalities": nationalities,
+                    "identifications": identifications
+                }
+            }
+            
+            return sanction
+        
         except Exception as e:
-            logger.error(f"US OFAC 제재 데이터 파싱 실패: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            return False 
\ No newline at end of file
+            logger.warning(f"유효하지 않은 US OFAC 제재 데이터: {str(e)}")
+            return None
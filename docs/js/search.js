@@ -4,7 +4,7 @@ const apiBaseUrl = "http://localhost:8000/api";
 /**
  * 제재 검색 함수
  * @param {string} query - 검색어
- * @param {object} options - 검색 옵션 (country, program, startDate, endDate, limit, skip)
+ * @param {object} options - 검색 옵션 (country, program, type, startDate, endDate, limit, skip)
  * @returns {Promise<object>} 검색 결과
  */
 async function searchSanctions(query, options = {}) {
@@ -22,6 +22,7 @@ async function searchSanctions(query, options = {}) {
     if (query) params.append('q', query);
     if (options.country) params.append('country', options.country);
     if (options.program) params.append('program', options.program);
+    if (options.type) params.append('type', options.type);
     if (options.startDate) params.append('start_date', options.startDate);
     if (options.endDate) params.append('end_date', options.endDate);
     if (options.limit) params.append('limit', options.limit);
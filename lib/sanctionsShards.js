@@ -0,0 +1,140 @@
+/**
+ * 정적 제재 데이터 샤드(public/data/shards) 조회 유틸리티 (서버 전용)
+ * collectors/publisher.py가 만든 manifest.json으로 필요한 샤드 파일만 읽습니다.
+ *
+ * 샤드 규칙 (publisher.py와 동일):
+ * - ID 샤드: UTF-8로 인코딩한 ID의 FNV-1a 32비트 해시 % 샤드 수 (2자리 16진수)
+ * - 이름 샤드: 정규화한 이름/별칭 단어의 앞 prefixLength 글자
+ * - 샤드 파일 경로: `${dir}/${files[key]}.json`
+ */
+import fs from 'fs';
+import path from 'path';
+
+export const SHARD_DIR = path.join(process.cwd(), 'public/data/shards');
+
+// 매니페스트와 샤드 캐시 (매니페스트 수정 시각이 바뀌면 초기화)
+let cachedManifest = null;
+let manifestMtime = 0;
+const shardCache = new Map();
+const MAX_CACHED_SHARDS = 256;
+
+/**
+ * 매니페스트를 읽습니다. 없으면 null을 반환합니다.
+ * @param {string} shardDir - 샤드 디렉토리 경로
+ * @returns {Object|null} 매니페스트
+ */
+export function loadManifest(shardDir = SHARD_DIR) {
+  const manifestPath = path.join(shardDir, 'manifest.json');
+  if (!fs.existsSync(manifestPath)) {
+    return null;
+  }
+  const mtime = fs.statSync(manifestPath).mtimeMs;
+  if (!cachedManifest || mtime !== manifestMtime) {
+    cachedManifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+    manifestMtime = mtime;
+    shardCache.clear();
+  }
+  return cachedManifest;
+}
+
+/**
+ * 샤드 파일 하나를 읽습니다. (파일 이름에 내용 해시가 있으므로 그대로 캐시)
+ * @param {string} shardDir - 샤드 디렉토리 경로
+ * @param {Object} shards - 매니페스트의 idShards 또는 nameShards
+ * @param {string} key - 샤드 키
+ * @returns {Object|null} 샤드 내용
+ */
+function readShard(shardDir, shards, key) {
+  const fileName = shards.files[key];
+  if (!fileName) {
+    return null;
+  }
+  const shardPath = path.join(shardDir, shards.dir, `${fileName}.json`);
+  if (!shardCache.has(shardPath)) {
+    if (shardCache.size >= MAX_CACHED_SHARDS) {
+      shardCache.delete(shardCache.keys().next().value);
+    }
+    shardCache.set(shardPath, JSON.parse(fs.readFileSync(shardPath, 'utf8')));
+  }
+  return shardCache.get(shardPath);
+}
+
+/**
+ * 문자열의 FNV-1a 32비트 해시
+ * @param {string} text - 문자열
+ * @returns {number} 해시
+ */
+export function fnv1a32(text) {
+  let value = 0x811c9dc5;
+  for (const byte of Buffer.from(text, 'utf8')) {
+    value = Math.imul(value ^ byte, 0x01000193) >>> 0;
+  }
+  return value;
+}
+
+/**
+ * 이름을 정규화한 단어 목록 (악센트 제거, 소문자, 구두점 제거)
+ * 키릴/아랍 문자 음역은 하지 않으므로 그런 질의는 샤드에서 찾지 못할 수 있습니다.
+ * @param {string} name - 이름
+ * @returns {string[]} 단어 목록
+ */
+export function nameTokens(name) {
+  return (name || '')
+    .normalize('NFKD')
+    .replace(/\p{M}/gu, '')
+    .toLowerCase()
+    .split(/[^\p{L}\p{N}]+/u)
+    .filter(Boolean);
+}
+
+/**
+ * ID로 제재 항목을 찾습니다.
+ * @param {string} id - 제재 항목 ID
+ * @param {string} shardDir - 샤드 디렉토리 경로
+ * @returns {Object|null|undefined} 항목, 없으면 null (샤드가 없으면 undefined)
+ */
+export function findShardEntryById(id, shardDir = SHARD_DIR) {
+  const manifest = loadManifest(shardDir);
+  if (!manifest) {
+    return undefined;
+  }
+  const { idShards } = manifest;
+  const key = (fnv1a32(id) % idShards.count).toString(16).padStart(2, '0');
+  const shard = readShard(shardDir, idShards, key);
+  return (shard && shard.data.find(entry => entry.id === id)) || null;
+}
+
+/**
+ * 이름 접두어 샤드에서 질의 단어를 모두 포함하는(앞부분 일치) 이름의 요약 정보를 찾습니다.
+ * @param {string} query - 검색어
+ * @param {string} shardDir - 샤드 디렉토리 경로
+ * @returns {Object[]|undefined} 요약 정보 목록 (샤드가 없거나 접두어 길이보다 긴 단어가 없으면 undefined)
+ */
+export function searchShardNames(query, shardDir = SHARD_DIR) {
+  const manifest = loadManifest(shardDir);
+  const tokens = nameTokens(query);
+  if (!manifest || tokens.length === 0) {
+    return undefined;
+  }
+  const { nameShards } = manifest;
+  const fields = nameShards.fields;
+
+  // 가장 긴 단어의 접두어 샤드 하나만 읽고 나머지 단어는 행에서 확인
+  const longest = tokens.reduce((a, b) => (b.length > a.length ? b : a));
+  if (longest.length < nameShards.prefixLength) {
+    return undefined;
+  }
+  const shard = readShard(shardDir, nameShards, longest.slice(0, nameShards.prefixLength));
+  if (!shard) {
+    return [];
+  }
+
+  const results = [];
+  for (const row of shard.names) {
+    const nameWords = nameTokens(row[0]);
+    if (tokens.every(token => nameWords.some(word => word.startsWith(token)))) {
+      results.push(Object.fromEntries(fields.map((field, i) => [field, row[i]])));
+    }
+  }
+  return results;
+}
@@ -1,6 +1,7 @@
 // ID로 제재 정보 조회 API
 import fs from 'fs';
 import path from 'path';
+import { findShardEntryById } from '../../../lib/sanctionsShards';
 
 export default async function handler(req, res) {
   try {
@@ -13,10 +14,9 @@ export default async function handler(req, res) {
     
     // 데이터 디렉토리 경로
     const dataDir = path.join(process.cwd(), 'public/data');
-    const chunkDir = path.join(dataDir, 'chunks');
     
     // ID로 제재 정보 찾기
-    const sanctionEntry = await findSanctionById(id, dataDir, chunkDir);
+    const sanctionEntry = await findSanctionById(id, dataDir);
     
     if (!sanctionEntry) {
       console.log(`ID '${id}'의 제재 정보를 찾을 수 없음`);
@@ -35,76 +35,24 @@ export default async function handler(req, res) {
  * ID로 제재 정보를 찾는 함수
  * @param {string} id - 찾을 제재 정보 ID
  * @param {string} dataDir - 데이터 디렉토리 경로
- * @param {string} chunkDir - 청크 파일 디렉토리 경로
  * @returns {Promise<Object|null>} 제재 정보 객체 또는 null
  */
-async function findSanctionById(id, dataDir, chunkDir) {
+async function findSanctionById(id, dataDir) {
   try {
     console.log(`ID '${id}'로 제재 정보 검색 중...`);
     
-    // 1. 인덱스 파일을 사용하여 빠르게 검색
-    const indexFilePath = path.join(chunkDir, 'index.json');
-    if (fs.existsSync(indexFilePath)) {
-      try {
-        const indexContent = fs.readFileSync(indexFilePath, 'utf8');
-        const indexData = JSON.parse(indexContent);
-        
-        // 인덱스에서 ID에 해당하는 청크 파일 찾기
-        if (indexData.chunks && indexData.chunks[id] && indexData.chunks[id].length > 0) {
-          const chunkFiles = indexData.chunks[id];
-          console.log(`인덱스에서 ID '${id}'를 포함하는 청크 파일 ${chunkFiles.length}개 찾음`);
-          
-          // 각 청크 파일에서 항목 검색
-          for (const chunkFile of chunkFiles) {
-            const chunkFilePath = path.join(chunkDir, chunkFile);
-            if (fs.existsSync(chunkFilePath)) {
-              const chunkContent = fs.readFileSync(chunkFilePath, 'utf8');
-              const chunkData = JSON.parse(chunkContent);
-              
-              if (chunkData.data && Array.isArray(chunkData.data)) {
-                const entry = chunkData.data.find(entry => entry.id === id);
-                if (entry) {
-                  console.log(`청크 파일 ${chunkFile}에서 ID '${id}' 항목 찾음`);
-                  return await enrichSanctionData(entry, dataDir, chunkDir);
-                }
-              }
-            }
-          }
-        }
-      } catch (error) {
-        console.warn(`인덱스 파일 검색 오류: ${error.message}`);
+    // 1. ID 샤드 검색 (manifest.json에서 ID 해시로 샤드 파일 하나만 읽음)
+    try {
+      const entry = findShardEntryById(id);
+      if (entry) {
+        console.log(`ID 샤드에서 ID '${id}' 항목 찾음`);
+        return await enrichSanctionData(entry, dataDir);
       }
+    } catch (error) {
+      console.warn(`ID 샤드 검색 오류: ${error.message}`);
     }
     
-    // 2. 인덱스가 없거나 검색 실패 시 모든 청크 파일 검색
-    if (fs.existsSync(chunkDir)) {
-      try {
-        const chunkFiles = fs.readdirSync(chunkDir).filter(file => file !== 'index.json');
-        console.log(`인덱스를 통한 검색 실패. ${chunkFiles.length}개 청크 파일 직접 검색...`);
-        
-        for (const chunkFile of chunkFiles) {
-          const chunkFilePath = path.join(chunkDir, chunkFile);
-          const chunkContent = fs.readFileSync(chunkFilePath, 'utf8');
-          try {
-            const chunkData = JSON.parse(chunkContent);
-            
-            if (chunkData.data && Array.isArray(chunkData.data)) {
-              const entry = chunkData.data.find(entry => entry.id === id);
-              if (entry) {
-                console.log(`청크 파일 ${chunkFile}에서 ID '${id}' 항목 찾음`);
-                return await enrichSanctionData(entry, dataDir, chunkDir);
-              }
-            }
-          } catch (error) {
-            console.warn(`청크 파일 ${chunkFile} 파싱 오류: ${error.message}`);
-          }
-        }
-      } catch (error) {
-        console.warn(`청크 디렉토리 검색 오류: ${error.message}`);
-      }
-    }
-    
-    // 3. 청크 검색 실패 시 원본 파일 검색
+    // 2. 샤드 검색 실패 시 원본 파일 검색
     // ID에서 소스 정보 추출
     const sourcePrefix = id.split('-')[0];
     let specificFile = null;
@@ -137,7 +85,7 @@ async function findSanctionById(id, dataDir, chunkDir) {
           
           if (foundEntry) {
             console.log(`원본 파일 ${specificFile}에서 ID '${id}' 항목 찾음`);
-            return await enrichSanctionData(foundEntry, dataDir, chunkDir);
+            return await enrichSanctionData(foundEntry, dataDir);
           }
         } catch (error) {
           console.warn(`원본 파일 ${specificFile} 검색 오류: ${error.message}`);
@@ -145,7 +93,7 @@ async function findSanctionById(id, dataDir, chunkDir) {
       }
     }
     
-    // 4. 통합 파일에서 마지막 검색
+    // 3. 통합 파일에서 마지막 검색
     const integratedFilePath = path.join(dataDir, 'integrated_sanctions.json');
     if (fs.existsSync(integratedFilePath)) {
       try {
@@ -179,7 +127,7 @@ async function findSanctionById(id, dataDir, chunkDir) {
         
         const foundEntry = await streamSearch;
         if (foundEntry) {
-          return await enrichSanctionData(foundEntry, dataDir, chunkDir);
+          return await enrichSanctionData(foundEntry, dataDir);
         }
       } catch (error) {
         console.warn(`통합 파일 검색 오류: ${error.message}`);
@@ -197,10 +145,9 @@ async function findSanctionById(id, dataDir, chunkDir) {
  * 제재 정보 데이터 보강
  * @param {Object} entry - 기본 제재 정보
  * @param {string} dataDir - 데이터 디렉토리 경로
- * @param {string} chunkDir - 청크 디렉토리 경로
  * @returns {Object} 보강된 제재 정보
  */
-async function enrichSanctionData(entry, dataDir, chunkDir) {
+async function enrichSanctionData(entry, dataDir) {
   if (!entry) return null;
   
   // 기존 데이터 깊은 복사
@@ -208,34 +155,9 @@ async function enrichSanctionData(entry, dataDir, chunkDir) {
   
   try {
     // 출처에 따라 추가 정보 파일 검색
-    const sourcePrefix = entry.source?.toLowerCase() || '';
     let foundSourceData = null;
     
-    // 청크 디렉토리에서 해당 소스의 청크들 검색
-    if (fs.existsSync(chunkDir)) {
-      const chunkFiles = fs.readdirSync(chunkDir)
-        .filter(file => file.startsWith(sourcePrefix.toLowerCase()) && file !== 'index.json');
-      
-      for (const chunkFile of chunkFiles) {
-        try {
-          const chunkPath = path.join(chunkDir, chunkFile);
-          const chunkContent = fs.readFileSync(chunkPath, 'utf8');
-          const chunkData = JSON.parse(chunkContent);
-          
-          if (chunkData.data && Array.isArray(chunkData.data)) {
-            const sourceEntry = chunkData.data.find(e => e.id === entry.id);
-            if (sourceEntry) {
-              foundSourceData = sourceEntry;
-              break;
-            }
-          }
-        } catch (error) {
-          console.warn(`소스 정보 청크 파일 검색 오류: ${error.message}`);
-        }
-      }
-    }
-    
-    // 청크에서 찾지 못한 경우 원본 파일 검색
+    // 원본 소스 파일 검색
     if (!foundSourceData) {
       const sourceFiles = {
         'UN': 'un_sanctions.json',
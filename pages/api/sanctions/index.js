@@ -1,6 +1,7 @@
 // 제재 정보 검색 API
 import fs from 'fs';
 import path from 'path';
+import { searchShardNames, findShardEntryById } from '../../../lib/sanctionsShards';
 
 export default async function handler(req, res) {
   try {
@@ -14,84 +15,42 @@ export default async function handler(req, res) {
     
     // 데이터 디렉토리 경로
     const dataDir = path.join(process.cwd(), 'public/data');
-    const chunkDir = path.join(dataDir, 'chunks');
     
     // 결과 배열 초기화
     let results = [];
     const seenIds = new Set(); // 중복 항목 방지용
     
-    // 1. 청크 파일 사용
-    if (fs.existsSync(chunkDir)) {
-      try {
-        console.log("청크 디렉토리에서 데이터 로드 중...");
-        const chunkFiles = fs.readdirSync(chunkDir).filter(file => file !== 'index.json');
-        
-        // 출처 필터가 있으면 해당 출처 청크만 선택
-        const filteredChunks = source
-          ? chunkFiles.filter(file => file.toLowerCase().startsWith(source.toLowerCase()))
-          : chunkFiles;
-        
-        console.log(`${filteredChunks.length}개 청크 파일에서 검색 중...`);
-        
-        // 청크 파일을 순회하며 검색
-        for (const chunkFile of filteredChunks) {
-          try {
-            const chunkPath = path.join(chunkDir, chunkFile);
-            const chunkContent = fs.readFileSync(chunkPath, 'utf8');
-            const chunkData = JSON.parse(chunkContent);
-            
-            if (chunkData.data && Array.isArray(chunkData.data)) {
-              // 검색 및 필터링
-              const chunkResults = chunkData.data.filter(entry => {
-                // 이미 결과에 포함된 ID인지 확인
-                if (seenIds.has(entry.id)) {
-                  return false;
-                }
-                
-                // 기본 텍스트 검색
-                const matchesQuery = (
-                  (entry.name && entry.name.toLowerCase().includes(q.toLowerCase())) ||
-                  (entry.details?.birthDate && entry.details.birthDate.toString().includes(q)) ||
-                  (entry.aliases && entry.aliases.some(alias => alias.toLowerCase().includes(q.toLowerCase()))) ||
-                  (entry.country && entry.country.toLowerCase().includes(q.toLowerCase())) ||
-                  (entry.id && entry.id.toLowerCase().includes(q.toLowerCase()))
-                );
-                
-                if (!matchesQuery) return false;
-                
-                // 유형 필터링
-                if (type && entry.type !== type) return false;
-                
-                // 국가 필터링
-                if (country && (!entry.country || !entry.country.toLowerCase().includes(country.toLowerCase()))) {
-                  return false;
-                }
-                
-                // 출처 필터링은 이미 파일명으로 처리했으므로 스킵
-
-                // 결과에 포함할 항목
-                seenIds.add(entry.id);
-                return true;
-              });
-              
-              results = [...results, ...chunkResults];
-              
-              // 결과 개수 제한 확인
-              if (results.length >= parseInt(limit)) {
-                console.log(`검색 결과가 한도(${limit})에 도달했습니다.`);
-                break;
-              }
-            }
-          } catch (error) {
-            console.warn(`${chunkFile} 처리 중 오류: ${error.message}`);
+    // 1. 이름 접두어 샤드 사용 (manifest.json으로 필요한 샤드만 읽음)
+    try {
+      const summaries = searchShardNames(q);
+      if (summaries) {
+        console.log(`이름 샤드에서 ${summaries.length}개 이름 일치`);
+        for (const summary of summaries) {
+          if (seenIds.has(summary.id)) continue;
+          
+          // 유형/국가/출처 필터링은 요약 정보로 먼저 처리
+          if (type && summary.type !== type) continue;
+          if (country && (!summary.country || !summary.country.toLowerCase().includes(country.toLowerCase()))) continue;
+          if (source && summary.source !== source) continue;
+          
+          // 상세 정보는 ID 샤드에서 로드
+          const entry = findShardEntryById(summary.id);
+          if (!entry) continue;
+          seenIds.add(entry.id);
+          results.push(entry);
+          
+          // 결과 개수 제한 확인
+          if (results.length >= parseInt(limit)) {
+            console.log(`검색 결과가 한도(${limit})에 도달했습니다.`);
+            break;
           }
         }
-      } catch (error) {
-        console.warn(`청크 디렉토리 검색 오류: ${error.message}`);
       }
+    } catch (error) {
+      console.warn(`샤드 검색 오류: ${error.message}`);
     }
     
-    // 2. 청크 파일로 충분한 결과를 얻지 못한 경우 통합 파일 검색
+    // 2. 샤드로 충분한 결과를 얻지 못한 경우 통합 파일 검색
     if (results.length < parseInt(limit) && fs.existsSync(path.join(dataDir, 'integrated_sanctions.json'))) {
       try {
         console.log("결과가 충분하지 않아 통합 파일에서 추가 검색 중...");
@@ -104,7 +63,7 @@ export default async function handler(req, res) {
         
         // 통합 파일이 너무 큰 경우 추가 검색 건너뛰기
         if (fileSizeMB > 50) {
-          console.log("통합 파일이 너무 커서 청크 결과만 반환합니다.");
+          console.log("통합 파일이 너무 커서 샤드 결과만 반환합니다.");
         } else {
           // 통합 파일을 읽어서 추가 검색
           const fileContent = fs.readFileSync(integratedFilePath, 'utf8');
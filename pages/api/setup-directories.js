@@ -8,7 +8,7 @@ export default function handler(req, res) {
 
   try {
     const dataDir = path.join(process.cwd(), 'public', 'data');
-    const chunkDir = path.join(dataDir, 'chunks');
+    const shardDir = path.join(dataDir, 'shards');
     
     // data 디렉토리 확인 및 생성
     if (!fs.existsSync(dataDir)) {
@@ -16,10 +16,10 @@ export default function handler(req, res) {
       fs.mkdirSync(dataDir, { recursive: true });
     }
     
-    // chunks 디렉토리 확인 및 생성
-    if (!fs.existsSync(chunkDir)) {
-      console.log('chunks 디렉토리를 생성합니다.');
-      fs.mkdirSync(chunkDir, { recursive: true });
+    // shards 디렉토리 확인 및 생성 (scripts/sync-data.js가 docs/data/shards를 복사)
+    if (!fs.existsSync(shardDir)) {
+      console.log('shards 디렉토리를 생성합니다.');
+      fs.mkdirSync(shardDir, { recursive: true });
     }
 
     return res.status(200).json({ message: '디렉토리 설정 완료' });
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 검색 API 서버
+통합 제재 데이터(integrated_sanctions.json)를 시작 시 한 번 메모리에 색인하고
+/api/sanctions/search, /api/sanctions/documents/{number}, /api/sanctions/stats, /api/sanctions/{id}
+엔드포인트를 제공합니다. 이름 검색 결과는 데이터 버전별로 캐시하며, 데이터 파일이 바뀌면 다시 색인합니다.
+"""
+
+import os
+import asyncio
+import logging
+import argparse
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from collectors.base import setup_logging
+from collectors.cache import QueryCache
+from collectors.filters import FilterIndex
+from collectors.index import SanctionsIndex, DEFAULT_MIN_SCORE, default_data_file
+from collectors.normalize import sorted_token_key
+
+# 설정
+API_HOST = os.environ.get('SANCTIONS_API_HOST', '0.0.0.0')
+API_PORT = int(os.environ.get('SANCTIONS_API_PORT', '8000'))
+CORS_ORIGINS = os.environ.get('SANCTIONS_API_CORS_ORIGINS', '*').split(',')
+DEFAULT_PAGE_SIZE = 20  # 기본 검색 결과 수
+MAX_PAGE_SIZE = 100  # 한 번에 반환할 최대 검색 결과 수
+RELOAD_INTERVAL = float(os.environ.get('SANCTIONS_API_RELOAD_INTERVAL', '60'))  # 데이터 파일 변경 확인 간격 (초, 0이면 확인 안 함)
+
+logger = logging.getLogger("sanctions_api")
+
+def file_signature(path: str) -> Tuple[int, int, int]:
+    """파일 교체 여부를 판단할 (inode, 수정 시각, 크기)를 반환합니다."""
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def _filter_key(value: Optional[str]) -> Optional[str]:
+    """캐시 키용 필터 값 (필터 인덱스와 같이 대소문자 무시, 빈 값은 필터 없음)"""
+    return value.casefold() if value else None
+
+class SanctionsStore:
+    """검색 인덱스와 필터 인덱스를 미리 만들어 둔 메모리 내 제재 데이터 저장소"""
+    
+    def __init__(self, index: SanctionsIndex, cache: Optional[QueryCache] = None):
+        """검색 인덱스의 항목으로 필터 인덱스(국가, 프로그램, 유형, 제재 시작일)를 생성합니다.
+        
+        cache를 주면 이전 저장소의 검색 결과 캐시를 이어 쓰며, 데이터 버전이 다르면 캐시 항목은 무효화됩니다.
+        """
+        self.index = index
+        self.filters = FilterIndex(index.scan_records())
+        self.version = index.data_version
+        self.cache = cache if cache is not None else QueryCache()
+        self.cache.set_version(self.version)
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None, cache: Optional[QueryCache] = None) -> "SanctionsStore":
+        """통합 제재 데이터 파일(JSON 또는 바이너리 스냅샷)을 읽어 저장소를 생성합니다."""
+        return cls(SanctionsIndex.from_file(path), cache)
+    
+    def get(self, sanction_id: str) -> Optional[Dict]:
+        """ID로 제재 항목을 반환합니다."""
+        return self.index.get(sanction_id)
+    
+    def find_identifier(self, number: str, country: Optional[str] = None) -> List[Dict]:
+        """신분증/등록 번호로 제재 항목을 반환합니다."""
+        return self.index.find_identifier(number, country)
+    
+    def search(self, query: Optional[str] = None, country: Optional[str] = None,
+               program: Optional[str] = None, start_date: Optional[str] = None,
+               end_date: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE,
+               skip: int = 0, type: Optional[str] = None) -> Tuple[int, List[Dict]]:
+        """이름과 필터로 검색하여 (전체 결과 수, 현재 페이지 항목 목록)을 반환합니다.
+        
+        필터는 필터 인덱스의 비트맵 교집합으로 먼저 계산하고, 이름 점수는 그 결과에 속한 후보만 계산합니다.
+        이름 검색의 전체 순위(항목 번호와 점수)는 정규화한 질의와 필터를 키로 캐시하므로 같은 검색의
+        다른 페이지나 반복 검색은 점수를 다시 계산하지 않고, 현재 페이지 항목만 꺼냅니다.
+        """
+        records = self.index.records
+        if query and query.strip():
+            key = (sorted_token_key(query), _filter_key(country), _filter_key(program), _filter_key(type),
+                   start_date or None, end_date or None)
+            ranked = self.cache.get(key)
+            if ranked is None:
+                selected = self.filters.select(country, program, type, start_date, end_date)
+                ranked = self.index.rank(query, limit=None, min_score=DEFAULT_MIN_SCORE, include_partial=True,
+                                         allowed=selected)
+                self.cache.put(key, ranked, self.version)
+            page = [dict(records[record_index], matchScore=score) for score, record_index, _ in ranked[skip:skip + limit]]
+            return len(ranked), page
+        
+        selected = self.filters.select(country, program, type, start_date, end_date)
+        if selected is None:
+            return len(records), [records[i] for i in range(skip, min(skip + limit, len(records)))]
+        return len(selected), [records[i] for i in selected.page(skip, limit)]
+    
+    def stats(self) -> Dict:
+        """항목 수, 데이터 버전, 검색 결과 캐시 통계를 반환합니다."""
+        return {"records": len(self.index), "dataVersion": self.version, "cache": self.cache.stats()}
+
+def create_app(data_file: Optional[str] = None, reload_interval: float = RELOAD_INTERVAL) -> FastAPI:
+    """검색 API 애플리케이션을 생성합니다.
+    
+    데이터는 시작 시 한 번 읽고, reload_interval초마다 데이터 파일이 교체되었는지 확인하여 새 통합 데이터를
+    백그라운드 스레드에서 색인한 뒤 저장소를 바꿉니다. 검색 결과 캐시는 새 데이터 버전으로 한 번에 무효화됩니다.
+    """
+    data_file = data_file or default_data_file()
+    
+    async def watch_data_file(app: FastAPI, signature: Tuple[int, int, int]):
+        while True:
+            await asyncio.sleep(reload_interval)
+            try:
+                current = file_signature(data_file)
+                if current == signature:
+                    continue
+                signature = current
+                logger.info(f"제재 데이터 파일 변경 감지: {data_file}")
+                store = await asyncio.to_thread(SanctionsStore.load, data_file, app.state.store.cache)
+                app.state.store = store
+                logger.info(f"제재 데이터 다시 로드 완료: {len(store.index)}개 항목, 데이터 버전 {store.version}")
+            except Exception as e:
+                logger.error(f"제재 데이터 다시 로드 실패: {str(e)}")
+    
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        logger.info(f"제재 데이터 로드 시작: {data_file}")
+        signature = file_signature(data_file)
+        app.state.store = SanctionsStore.load(data_file)
+        logger.info(f"제재 데이터 로드 완료: {len(app.state.store.index)}개 항목, 데이터 버전 {app.state.store.version}")
+        watcher = asyncio.create_task(watch_data_file(app, signature)) if reload_interval > 0 else None
+        yield
+        if watcher is not None:
+            watcher.cancel()
+    
+    app = FastAPI(title="Sanctions Search API", lifespan=lifespan)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=CORS_ORIGINS,
+        allow_methods=["GET"],
+        allow_headers=["*"]
+    )
+    
+    @app.get("/api/sanctions/search")
+    async def search_sanctions(
+        q: Optional[str] = None,
+        query: Optional[str] = None,
+        country: Optional[str] = None,
+        program: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        type: Optional[str] = None,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        skip: int = Query(0, ge=0)
+    ):
+        total, results = app.state.store.search(
+            q or query, country, program, start_date, end_date, limit, skip, type
+        )
+        # 저장된 항목은 이미 JSON 호환이므로 jsonable_encoder 변환을 건너뜀
+        return JSONResponse({"results": results, "total": total, "skip": skip, "limit": limit})
+    
+    @app.get("/api/sanctions/documents/{number}")
+    async def find_document(number: str, country: Optional[str] = None):
+        results = app.state.store.find_identifier(number, country)
+        return JSONResponse({"results": results, "total": len(results)})
+    
+    @app.get("/api/sanctions/stats")
+    async def sanctions_stats():
+        return JSONResponse(app.state.store.stats())
+    
+    @app.get("/api/sanctions/{sanction_id}")
+    async def get_sanction(sanction_id: str):
+        record = app.state.store.get(sanction_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail="제재 정보를 찾을 수 없습니다")
+        return JSONResponse(record)
+    
+    return app
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="제재 데이터 검색 API 서버")
+    parser.add_argument("--host", default=API_HOST, help=f"바인딩 주소 (기본값: {API_HOST})")
+    parser.add_argument("--port", type=int, default=API_PORT, help=f"포트 (기본값: {API_PORT})")
+    parser.add_argument("--data-file", help="통합 제재 데이터 파일 (기본값: 스냅샷, 없으면 integrated_sanctions.json)")
+    parser.add_argument("--reload-interval", type=float, default=RELOAD_INTERVAL,
+                        help=f"데이터 파일 변경 확인 간격(초, 0이면 다시 로드하지 않음, 기본값: {RELOAD_INTERVAL:g})")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    """검색 API 서버를 실행합니다."""
+    import uvicorn
+    
+    args = parse_args(argv)
+    setup_logging()
+    uvicorn.run(create_app(args.data_file, args.reload_interval), host=args.host, port=args.port)
+
+if __name__ == "__main__":
+    main()
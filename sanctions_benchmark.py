@@ -0,0 +1,607 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 처리 성능 벤치마크
+실제 원본과 같은 스키마의 가상 UN(consolidated.xml), EU(sanctionEntity), US OFAC(sdnEntry) XML을
+실제 크기의 배수(기본 1배, 10배, 100배)로 생성하고, 다운로드를 생성 파일로 대체한 상태에서
+수집(collect), 저장(save_to_json), 통합(integrate), 일괄 스크리닝(screen) 단계의 소요 시간과
+최대 메모리(RSS)를 측정합니다.
+네트워크 없이 실행되며, 결과는 커밋 간 비교할 수 있는 JSON 파일로 저장합니다.
+
+각 단계는 새로 시작한 별도 프로세스에서 실행하므로 단계별 최대 RSS가 서로 섞이지 않습니다.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import random
+import shutil
+import logging
+import argparse
+import platform
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from xml.sax.saxutils import escape, quoteattr
+from typing import List, Dict, Optional, Tuple, IO
+
+# 설정
+REAL_RECORD_COUNTS = {"un": 1000, "eu": 5300, "us": 17500}  # 실제 원본의 대략적인 항목 수
+SOURCE_NAMES = {"un": "UN", "eu": "EU", "us": "US"}  # 통합기에 넘기는 소스 이름
+DEFAULT_SCALES = [1, 10, 100]  # 실제 크기 대비 배수
+DEFAULT_SEED = 42
+DEFAULT_WORK_DIR = os.path.join('temp', 'benchmark')  # 가상 원본과 단계별 출력 위치
+DEFAULT_OUTPUT = 'benchmark_results.json'
+SHARED_RATIO = 0.1  # 세 소스에 함께 등재되는 대상 비율 (개체 병합 부하)
+INDIVIDUAL_RATIO = 0.7  # 개인 비율 (나머지는 단체)
+RESULT_VERSION = 1  # 결과 파일 형식 버전
+SCREEN_NAME_COUNT = 20000  # 스크리닝 단계 입력 이름 수
+SCREEN_LISTED_RATIO = 0.1  # 스크리닝 입력 중 등재 이름(철자 변형 포함) 비율
+
+logger = logging.getLogger("sanctions_benchmark")
+
+# 이름 생성용 음절 (라틴 표기, 키릴 표기, 아랍 표기)
+_CYRILLIC_SYLLABLES = [
+    ("ka", "ка"), ("ra", "ра"), ("mo", "мо"), ("vo", "во"), ("li", "ли"), ("de", "де"), ("ko", "ко"),
+    ("za", "за"), ("ne", "не"), ("bu", "бу"), ("to", "то"), ("ga", "га"), ("ser", "сер"), ("lov", "лов"),
+    ("mir", "мир"), ("pet", "пет"), ("zhu", "жу"), ("sha", "ша"), ("kov", "ков"), ("tin", "тин")
+]
+_CYRILLIC_SUFFIXES = [("ov", "ов"), ("ev", "ев"), ("in", "ин"), ("sky", "ский"), ("enko", "енко")]
+_ARABIC_SYLLABLES = [
+    ("ab", "عب"), ("mu", "مو"), ("ham", "حم"), ("mad", "مد"), ("sa", "سا"), ("lim", "ليم"), ("ra", "را"),
+    ("shid", "شيد"), ("ka", "كا"), ("rim", "ريم"), ("na", "نا"), ("sir", "صر"), ("da", "دا"),
+    ("wud", "ود"), ("ha", "ها"), ("san", "سن"), ("ja", "جا"), ("mal", "مال"), ("far", "فر"), ("id", "يد")
+]
+_LATIN_SYLLABLES = ["kim", "ri", "jong", "chol", "sung", "ho", "pak", "yong", "gar", "cia", "ro", "dri",
+                    "guez", "mar", "tin", "lo", "pez", "san", "ta", "na"]
+_COMPANY_WORDS = ["Global", "Trading", "Shipping", "Petro", "Industrial", "Maritime", "Energy",
+                  "Development", "Technology", "Mining", "Logistics", "Investment", "Chemical", "Aviation"]
+_COMPANY_SUFFIXES = ["LLC", "Co. Ltd", "JSC", "Corporation", "Group", "FZE", "Bank"]
+
+# (UN 국가명, ISO2 코드, OFAC 국가명, 이름 문자 체계)
+_COUNTRIES = [
+    ("Russian Federation", "RU", "Russia", "cyrillic"),
+    ("Belarus", "BY", "Belarus", "cyrillic"),
+    ("Iran (Islamic Republic of)", "IR", "Iran", "arabic"),
+    ("Syrian Arab Republic", "SY", "Syria", "arabic"),
+    ("Afghanistan", "AF", "Afghanistan", "arabic"),
+    ("Iraq", "IQ", "Iraq", "arabic"),
+    ("Libya", "LY", "Libya", "arabic"),
+    ("Yemen", "YE", "Yemen", "arabic"),
+    ("Democratic People's Republic of Korea", "KP", "Korea, North", "latin"),
+    ("Venezuela (Bolivarian Republic of)", "VE", "Venezuela", "latin")
+]
+_CITIES = ["Moscow", "Minsk", "Tehran", "Damascus", "Kabul", "Baghdad", "Tripoli", "Sanaa", "Pyongyang", "Caracas"]
+
+# 소스별 제재 프로그램
+_UN_LIST_TYPES = ["Al-Qaida", "DPRK", "Taliban", "Libya", "Somalia", "Iraq", "DRC", "Yemen", "South Sudan", "Mali"]
+_EU_PROGRAMMES = ["RUS", "BLR", "IRN", "SYR", "AFG", "IRQ", "LBY", "YEM", "PRK", "VEN"]
+_OFAC_PROGRAMS = ["RUSSIA-EO14024", "BELARUS-EO14038", "IRAN", "SYRIA", "SDGT", "IRAQ2", "LIBYA3",
+                  "YEMEN", "DPRK3", "VENEZUELA-EO13850"]
+_NAME_LANGUAGES = {"cyrillic": "RU", "arabic": "AR"}  # EU nameAlias 원래 문자 표기 언어
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+EU_NAMESPACE = "http://eu.europa.ec/fpi/fsd/export"
+OFAC_NAMESPACE = "https://sanctionslistservice.ofac.treas.gov/api/PublicationPreview/exports/XML"
+
+def _syllable_name(rng: random.Random, syllables: List[Tuple[str, str]], count: int,
+                   suffixes: Optional[List[Tuple[str, str]]] = None) -> Tuple[str, str]:
+    """음절을 이어 (라틴 표기, 원래 문자 표기) 이름 하나를 만듭니다."""
+    parts = [rng.choice(syllables) for _ in range(count)]
+    if suffixes:
+        parts.append(rng.choice(suffixes))
+    return ''.join(p[0] for p in parts).capitalize(), ''.join(p[1] for p in parts).capitalize()
+
+def make_profile(rng: random.Random) -> Dict:
+    """가상 제재 대상 하나의 속성을 만듭니다. 소스별 XML은 같은 속성을 각 소스 형식으로 표현합니다."""
+    country_index = rng.randrange(len(_COUNTRIES))
+    script = _COUNTRIES[country_index][3]
+    profile = {
+        "individual": rng.random() < INDIVIDUAL_RATIO,
+        "country": country_index,
+        "program": country_index,
+        "listed": (rng.randint(2001, 2024), rng.randint(1, 12), rng.randint(1, 28)),
+        "city": _CITIES[country_index],
+        "street": f"{rng.randint(1, 200)} {rng.choice(_COMPANY_WORDS)} Street",
+        "native": []
+    }
+    
+    if not profile["individual"]:
+        words = rng.sample(_COMPANY_WORDS, 2)
+        base, _ = _syllable_name(rng, _CYRILLIC_SYLLABLES, 2)
+        name = f"{base} {' '.join(words)} {rng.choice(_COMPANY_SUFFIXES)}"
+        profile.update(first="", last=name, aliases=[''.join(word[0] for word in name.split()).upper()])
+        return profile
+    
+    if script == "cyrillic":
+        given, given_native = _syllable_name(rng, _CYRILLIC_SYLLABLES, 2)
+        family, family_native = _syllable_name(rng, _CYRILLIC_SYLLABLES, rng.randint(1, 2), _CYRILLIC_SUFFIXES)
+        profile["native"] = [f"{family_native} {given_native}"]
+        variant = family.replace("ov", "off").replace("ev", "eff")
+    elif script == "arabic":
+        given, given_native = _syllable_name(rng, _ARABIC_SYLLABLES, 2)
+        family, family_native = _syllable_name(rng, _ARABIC_SYLLABLES, rng.randint(2, 3))
+        profile["native"] = [f"{given_native} {family_native}"]
+        variant = family.replace("u", "o", 1).replace("a", "e", 1)
+    else:
+        given = ' '.join(rng.choice(_LATIN_SYLLABLES).capitalize() for _ in range(2))
+        family = rng.choice(_LATIN_SYLLABLES).capitalize() + rng.choice(_LATIN_SYLLABLES)
+        variant = family.replace("o", "u", 1)
+    
+    profile.update(
+        first=given,
+        last=family,
+        aliases=[f"{given} {variant}"] if variant != family else [],
+        birth=(rng.randint(1940, 2000), rng.randint(1, 12), rng.randint(1, 28)),
+        passport=''.join(rng.choice("0123456789") for _ in range(9))
+    )
+    return profile
+
+class SyntheticProfiles:
+    """소스별 가상 제재 대상을 결정적으로 만듭니다.
+    
+    각 소스의 앞쪽 shared_count개 항목은 세 소스에 공통으로 등재된 대상이므로
+    통합 단계의 소스 간 개체 병합이 실제처럼 동작합니다.
+    """
+    
+    def __init__(self, seed: int, shared_count: int):
+        """초기화"""
+        self.seed = seed
+        self.shared_count = shared_count
+    
+    def profile(self, source: str, index: int) -> Dict:
+        """source의 index번 가상 제재 대상을 반환합니다."""
+        if index < self.shared_count:
+            return make_profile(random.Random(f"shared:{self.seed}:{index}"))
+        return make_profile(random.Random(f"{source}:{self.seed}:{index}"))
+
+def _full_name(profile: Dict) -> str:
+    """가상 제재 대상의 전체 이름을 반환합니다."""
+    return f"{profile['first']} {profile['last']}".strip()
+
+def _write_un(f: IO[str], profiles: SyntheticProfiles, count: int) -> None:
+    """UN consolidated.xml 형식으로 기록합니다."""
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    f.write('<CONSOLIDATED_LIST xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xsi:noNamespaceSchemaLocation="https://scsanctions.un.org/resources/xml/sc-sanctions.xsd" '
+            f'dateGenerated="{datetime.now().replace(microsecond=0).isoformat()}">\n')
+    entities = []
+    f.write('<INDIVIDUALS>\n')
+    for index in range(count):
+        profile = profiles.profile("un", index)
+        if not profile["individual"]:
+            entities.append(index)
+            continue
+        country = _COUNTRIES[profile["country"]]
+        list_type = _UN_LIST_TYPES[profile["program"]]
+        parts = [
+            f'<INDIVIDUAL><DATAID>{100000 + index}</DATAID><VERSIONNUM>1</VERSIONNUM>',
+            f'<FIRST_NAME>{escape(profile["first"].upper())}</FIRST_NAME>',
+            f'<SECOND_NAME>{escape(profile["last"].upper())}</SECOND_NAME>',
+            f'<UN_LIST_TYPE>{escape(list_type)}</UN_LIST_TYPE>',
+            f'<REFERENCE_NUMBER>{list_type[:2].upper()}i.{index:03d}</REFERENCE_NUMBER>',
+            '<LISTED_ON>{:04d}-{:02d}-{:02d}</LISTED_ON>'.format(*profile["listed"]),
+            f'<COMMENTS1>Synthetic benchmark record {index}.</COMMENTS1>',
+            f'<NATIONALITY><VALUE>{escape(country[0])}</VALUE></NATIONALITY>',
+            '<LIST_TYPE><VALUE>UN List</VALUE></LIST_TYPE>',
+            *(f'<INDIVIDUAL_ALIAS><QUALITY>Good</QUALITY><ALIAS_NAME>{escape(alias)}</ALIAS_NAME></INDIVIDUAL_ALIAS>'
+              for alias in profile["aliases"] + profile["native"]),
+            f'<INDIVIDUAL_ADDRESS><CITY>{escape(profile["city"])}</CITY><COUNTRY>{escape(country[0])}</COUNTRY></INDIVIDUAL_ADDRESS>',
+            '<INDIVIDUAL_DATE_OF_BIRTH><TYPE_OF_DATE>EXACT</TYPE_OF_DATE>'
+            '<DATE>{:04d}-{:02d}-{:02d}</DATE></INDIVIDUAL_DATE_OF_BIRTH>'.format(*profile["birth"]),
+            f'<INDIVIDUAL_DOCUMENT><TYPE_OF_DOCUMENT>Passport</TYPE_OF_DOCUMENT><NUMBER>{profile["passport"]}</NUMBER>'
+            f'<ISSUING_COUNTRY>{escape(country[0])}</ISSUING_COUNTRY></INDIVIDUAL_DOCUMENT>',
+            '</INDIVIDUAL>\n'
+        ]
+        f.write(''.join(parts))
+    f.write('</INDIVIDUALS>\n<ENTITIES>\n')
+    for index in entities:
+        profile = profiles.profile("un", index)
+        country = _COUNTRIES[profile["country"]]
+        list_type = _UN_LIST_TYPES[profile["program"]]
+        parts = [
+            f'<ENTITY><DATAID>{100000 + index}</DATAID><VERSIONNUM>1</VERSIONNUM>',
+            f'<FIRST_NAME>{escape(profile["last"].upper())}</FIRST_NAME>',
+            f'<UN_LIST_TYPE>{escape(list_type)}</UN_LIST_TYPE>',
+            f'<REFERENCE_NUMBER>{list_type[:2].upper()}e.{index:03d}</REFERENCE_NUMBER>',
+            '<LISTED_ON>{:04d}-{:02d}-{:02d}</LISTED_ON>'.format(*profile["listed"]),
+            '<LIST_TYPE><VALUE>UN List</VALUE></LIST_TYPE>',
+            *(f'<ENTITY_ALIAS><QUALITY>a.k.a.</QUALITY><ALIAS_NAME>{escape(alias)}</ALIAS_NAME></ENTITY_ALIAS>'
+              for alias in profile["aliases"]),
+            f'<ENTITY_ADDRESS><STREET>{escape(profile["street"])}</STREET><CITY>{escape(profile["city"])}</CITY>'
+            f'<COUNTRY>{escape(country[0])}</COUNTRY></ENTITY_ADDRESS>',
+            '</ENTITY>\n'
+        ]
+        f.write(''.join(parts))
+    f.write('</ENTITIES>\n</CONSOLIDATED_LIST>\n')
+
+def _eu_summary(profile: Dict) -> str:
+    """EU 항목의 regulationSummary 요소를 반환합니다."""
+    year, month, day = profile["listed"]
+    return (f'<regulationSummary regulationType="regulation" publicationDate="{year:04d}-{month:02d}-{day:02d}" '
+            f'numberTitle="{profile["program"] + 1}/{year} (OJ L{month}{day})" '
+            f'publicationUrl="https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=OJ:L:{year}:{month}{day}:TOC"/>')
+
+def _write_eu(f: IO[str], profiles: SyntheticProfiles, count: int) -> None:
+    """EU 금융 제재 전체 목록(export/sanctionEntity) 형식으로 기록합니다."""
+    f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+    f.write(f'<export generationDate="{datetime.now().replace(microsecond=0).isoformat()}" '
+            f'globalFileId="{count}" xmlns="{EU_NAMESPACE}">\n')
+    for index in range(count):
+        profile = profiles.profile("eu", index)
+        country = _COUNTRIES[profile["country"]]
+        summary = _eu_summary(profile)
+        year, month, day = profile["listed"]
+        logical_id = index + 1
+        country_attrs = f'countryIso2Code="{country[1]}" countryDescription={quoteattr(country[0].upper())}'
+        
+        parts = [
+            f'<sanctionEntity designationDetails="" unitedNationId="" euReferenceNumber="EU.{logical_id}.{index % 97}" '
+            f'logicalId="{logical_id}">',
+            f'<regulation regulationType="regulation" organisationType="council" '
+            f'publicationDate="{year:04d}-{month:02d}-{day:02d}" entryIntoForceDate="{year:04d}-{month:02d}-{day:02d}" '
+            f'numberTitle="{profile["program"] + 1}/{year}" programme="{_EU_PROGRAMMES[profile["program"]]}" '
+            f'logicalId="{profile["program"] + 1}">'
+            f'<publicationUrl>https://eur-lex.europa.eu/legal-content/EN/TXT/?uri=OJ:L:{year}</publicationUrl></regulation>'
+        ]
+        if profile["individual"]:
+            parts.append('<subjectType code="person" classificationCode="P"/>')
+            parts.append(
+                f'<nameAlias firstName={quoteattr(profile["first"])} middleName="" lastName={quoteattr(profile["last"])} '
+                f'wholeName={quoteattr(_full_name(profile))} function="" gender="M" title="" nameLanguage="" '
+                f'strong="true" regulationLanguage="en" logicalId="{logical_id * 10}">{summary}</nameAlias>'
+            )
+        else:
+            parts.append('<subjectType code="enterprise" classificationCode="E"/>')
+            parts.append(
+                f'<nameAlias firstName="" middleName="" lastName="" wholeName={quoteattr(profile["last"])} function="" '
+                f'gender="" title="" nameLanguage="" strong="true" regulationLanguage="en" '
+                f'logicalId="{logical_id * 10}">{summary}</nameAlias>'
+            )
+        for offset, alias in enumerate(profile["aliases"] + profile["native"], 1):
+            language = _NAME_LANGUAGES.get(country[3], "") if alias in profile["native"] else ""
+            parts.append(
+                f'<nameAlias firstName="" middleName="" lastName="" wholeName={quoteattr(alias)} function="" gender="" '
+                f'title="" nameLanguage="{language}" strong="false" regulationLanguage="en" '
+                f'logicalId="{logical_id * 10 + offset}">{summary}</nameAlias>'
+            )
+        if profile["individual"]:
+            birth_year, birth_month, birth_day = profile["birth"]
+            parts.append(
+                f'<citizenship region="" {country_attrs} regulationLanguage="en" logicalId="{logical_id * 10}">'
+                f'{summary}</citizenship>'
+            )
+            parts.append(
+                f'<birthdate circa="false" calendarType="GREGORIAN" city={quoteattr(profile["city"])} zipCode="" '
+                f'birthdate="{birth_year:04d}-{birth_month:02d}-{birth_day:02d}" dayOfMonth="{birth_day}" '
+                f'monthOfYear="{birth_month}" year="{birth_year}" region="" place="" {country_attrs} '
+                f'regulationLanguage="en" logicalId="{logical_id * 10}">{summary}</birthdate>'
+            )
+            parts.append(
+                f'<identification diplomatic="false" knownExpired="false" knownFalse="false" reportedLost="false" '
+                f'revokedByIssuer="false" issuedBy="" issuedDate="" validFrom="" validTo="" latinNumber="" '
+                f'nameOnDocument="" documentNumber="{profile["passport"]}" identificationTypeCode="passport" '
+                f'identificationTypeDescription="National passport" {country_attrs} regulationLanguage="en" '
+                f'logicalId="{logical_id * 10}">{summary}</identification>'
+            )
+        parts.append(
+            f'<address city={quoteattr(profile["city"])} street={quoteattr(profile["street"])} poBox="" zipCode="" '
+            f'region="" place="" asAtListingTime="false" contactInfo="" {country_attrs} regulationLanguage="en" '
+            f'logicalId="{logical_id * 10}">{summary}</address>'
+        )
+        parts.append('</sanctionEntity>\n')
+        f.write(''.join(parts))
+    f.write('</export>\n')
+
+def _write_us(f: IO[str], profiles: SyntheticProfiles, count: int) -> None:
+    """US OFAC SDN 목록(sdnList/sdnEntry) 형식으로 기록합니다."""
+    f.write('<?xml version="1.0" standalone="yes"?>\n')
+    f.write(f'<sdnList xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="{OFAC_NAMESPACE}">\n')
+    f.write(f'<publshInformation><Publish_Date>{datetime.now().strftime("%m/%d/%Y")}</Publish_Date>'
+            f'<Record_Count>{count}</Record_Count></publshInformation>\n')
+    sub_uid = 0
+    for index in range(count):
+        profile = profiles.profile("us", index)
+        country = _COUNTRIES[profile["country"]]
+        uid = 10000 + index
+        sub_uid += 10
+        parts = [f'<sdnEntry><uid>{uid}</uid>']
+        if profile["individual"]:
+            parts.append(f'<firstName>{escape(profile["first"])}</firstName><lastName>{escape(profile["last"].upper())}</lastName>'
+                         '<sdnType>Individual</sdnType>')
+        else:
+            parts.append(f'<lastName>{escape(profile["last"].upper())}</lastName><sdnType>Entity</sdnType>')
+        parts.append(f'<programList><program>{_OFAC_PROGRAMS[profile["program"]]}</program></programList>')
+        if profile["individual"]:
+            # 같은 여권 번호라도 소스마다 구분 기호가 다름 (식별 번호 정규화 부하)
+            number = profile["passport"]
+            parts.append(f'<idList><id><uid>{sub_uid}</uid><idType>Passport</idType>'
+                         f'<idNumber>{number[:3]}-{number[3:6]} {number[6:]}</idNumber>'
+                         f'<idCountry>{escape(country[2])}</idCountry></id></idList>')
+        if profile["aliases"] or profile["native"]:
+            parts.append('<akaList>')
+            for offset, alias in enumerate(profile["aliases"] + profile["native"], 1):
+                parts.append(f'<aka><uid>{sub_uid + offset}</uid><type>a.k.a.</type><category>strong</category>'
+                             f'<lastName>{escape(alias)}</lastName></aka>')
+            parts.append('</akaList>')
+        parts.append(f'<addressList><address><uid>{sub_uid + 5}</uid><address1>{escape(profile["street"])}</address1>'
+                     f'<city>{escape(profile["city"])}</city><country>{escape(country[2])}</country></address></addressList>')
+        if profile["individual"]:
+            year, month, day = profile["birth"]
+            parts.append(f'<nationalityList><nationality><uid>{sub_uid + 6}</uid><country>{escape(country[2])}</country>'
+                         '<mainEntry>true</mainEntry></nationality></nationalityList>')
+            parts.append(f'<dateOfBirthList><dateOfBirthItem><uid>{sub_uid + 7}</uid>'
+                         f'<dateOfBirth>{day:02d} {_MONTHS[month - 1]} {year}</dateOfBirth>'
+                         '<mainEntry>true</mainEntry></dateOfBirthItem></dateOfBirthList>')
+            parts.append(f'<placeOfBirthList><placeOfBirthItem><uid>{sub_uid + 8}</uid>'
+                         f'<placeOfBirth>{escape(profile["city"])}, {escape(country[2])}</placeOfBirth>'
+                         '<mainEntry>true</mainEntry></placeOfBirthItem></placeOfBirthList>')
+        parts.append('</sdnEntry>\n')
+        f.write(''.join(parts))
+    f.write('</sdnList>\n')
+
+FIXTURE_WRITERS = {"un": _write_un, "eu": _write_eu, "us": _write_us}
+
+def fixture_counts(scale: float) -> Dict[str, int]:
+    """배수에 해당하는 소스별 항목 수를 반환합니다."""
+    return {source: max(1, round(count * scale)) for source, count in REAL_RECORD_COUNTS.items()}
+
+def generate_fixture(source: str, path: str, count: int, seed: int, shared_count: int) -> int:
+    """가상 원본 XML 파일을 생성하고 파일 크기를 반환합니다. 임시 파일에 쓴 뒤 교체합니다."""
+    profiles = SyntheticProfiles(seed, shared_count)
+    temp_file = f"{path}.tmp"
+    with open(temp_file, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+        FIXTURE_WRITERS[source](f, profiles, count)
+    os.replace(temp_file, path)
+    return os.path.getsize(path)
+
+def generate_screening_input(records: List[Dict], path: str, count: int, seed: int) -> int:
+    """스크리닝 단계 입력 CSV(id,name)를 결정적으로 만들고 이름 수를 반환합니다.
+    
+    SCREEN_LISTED_RATIO만큼은 통합 데이터의 이름/별칭에 대소문자, 어순, 한 글자 오타 변형을 준 이름이고,
+    나머지는 같은 생성기로 만든(등재되지 않은) 가상 이름입니다.
+    """
+    rng = random.Random(f"screen:{seed}")
+    names = [name for record in records
+             for name in [record.get("name", "")] + record.get("details", {}).get("aliases", []) if name]
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "name"])
+        for row_id in range(count):
+            if names and rng.random() < SCREEN_LISTED_RATIO:
+                name = rng.choice(names)
+                variant = rng.randrange(3)
+                if variant == 0:
+                    name = name.upper()
+                elif variant == 1:
+                    name = ' '.join(reversed(name.split()))
+                elif len(name) > 4:
+                    position = rng.randrange(1, len(name) - 1)
+                    name = name[:position] + name[position + 1:]
+            else:
+                name = _full_name(make_profile(random.Random(f"customer:{seed}:{row_id}")))
+            writer.writerow([row_id, name])
+    return count
+
+def _collector(source: str):
+    """소스 수집기 인스턴스를 만듭니다. (작업 디렉터리 변경 후 임포트)"""
+    if source == "un":
+        from collectors.un_collector import UNSanctionsCollector
+        return UNSanctionsCollector()
+    if source == "eu":
+        from collectors.eu_collector import EUSanctionsCollector
+        return EUSanctionsCollector()
+    from collectors.us_collector import USSanctionsCollector
+    return USSanctionsCollector()
+
+def _run_stage(run_dir: str, stage: str, source: Optional[str], fixture: Optional[str],
+               sources: List[str], seed: int = DEFAULT_SEED) -> Dict:
+    """별도 프로세스에서 단계 하나를 실행하고 소요 시간과 최대 RSS를 반환합니다.
+    
+    수집기와 통합기는 현재 디렉터리 기준으로 출력/임시 디렉터리를 쓰므로 run_dir로 이동한 뒤 실행합니다.
+    """
+    os.chdir(run_dir)
+    logging.getLogger("sanctions_collector").setLevel(logging.WARNING)
+    logging.getLogger("sanctions_screening").setLevel(logging.WARNING)
+    from collectors.metrics import peak_rss_bytes
+    
+    if stage == "collect":
+        from collectors.base import open_source_file
+        collector = _collector(source)
+        # 다운로드 대신 가상 원본 파일을 스트림으로 제공
+        collector.fetch_stream = lambda: open_source_file(fixture)
+        start_time = time.perf_counter()
+        success = collector.collect()
+    elif stage == "screen":
+        # 중복 이름 캐시 효과를 빼고 작업 프로세스 하나의 검색 처리량을 측정 (인덱스 생성은 측정에서 제외)
+        os.environ['SANCTIONS_QUERY_CACHE_SIZE'] = '0'
+        from collectors.base import read_records
+        from collectors.index import SanctionsIndex
+        from sanctions_screening import screen_file
+        data_file = os.path.join('docs', 'data', 'integrated_sanctions.json')
+        records = list(read_records(data_file))
+        input_path = os.path.join('temp', 'screen_input.csv')
+        os.makedirs('temp', exist_ok=True)
+        count = generate_screening_input(records, input_path, SCREEN_NAME_COUNT, seed)
+        index = SanctionsIndex(records)
+        start_time = time.perf_counter()
+        success = screen_file(input_path, os.path.join('temp', 'screen_matches.ndjson'), data_file,
+                              workers=1, index=index)
+        seconds = time.perf_counter() - start_time
+        return {
+            "seconds": round(seconds, 3),
+            "peakRssMB": round(peak_rss_bytes() / (1024 * 1024), 1) or None,
+            "namesPerSecond": round(count / seconds) if seconds > 0 else None,
+            "success": bool(success)
+        }
+    elif stage == "save_to_json":
+        from collectors.base import save_to_json
+        # 파싱은 측정에서 제외하고, 이전 결과가 없는 별도 출력으로 저장
+        records = _collector(source).parse(fixture)
+        start_time = time.perf_counter()
+        success = save_to_json(records, f"benchmark_{source}")
+    else:
+        from collectors.integrator import SanctionsIntegrator
+        integrator = SanctionsIntegrator(sources=[SOURCE_NAMES[name] for name in sources])
+        start_time = time.perf_counter()
+        success = integrator.integrate()
+    
+    return {
+        "seconds": round(time.perf_counter() - start_time, 3),
+        "peakRssMB": round(peak_rss_bytes() / (1024 * 1024), 1) or None,
+        "success": bool(success)
+    }
+
+def run_scale(scale: float, sources: List[str], work_dir: str, seed: int) -> Dict:
+    """한 배수의 가상 원본을 준비하고 모든 단계를 측정합니다."""
+    counts = {source: count for source, count in fixture_counts(scale).items() if source in sources}
+    shared_count = int(min(counts.values()) * SHARED_RATIO)
+    fixture_dir = os.path.join(work_dir, 'fixtures')
+    run_dir = os.path.join(work_dir, f"run_x{scale:g}")
+    os.makedirs(fixture_dir, exist_ok=True)
+    
+    # 가상 원본 생성 (같은 배수/시드 파일이 있으면 재사용)
+    fixtures = {}
+    fixture_bytes = {}
+    generate_seconds = 0.0
+    for source, count in counts.items():
+        path = os.path.join(fixture_dir, f"{source}_x{scale:g}_s{seed}.xml")
+        if not os.path.exists(path):
+            start_time = time.perf_counter()
+            generate_fixture(source, path, count, seed, shared_count)
+            generate_seconds += time.perf_counter() - start_time
+        fixtures[source] = os.path.abspath(path)
+        fixture_bytes[source] = os.path.getsize(path)
+    logger.info(f"{scale:g}배 가상 원본 준비 완료: {counts} ({sum(fixture_bytes.values()) // 1024 // 1024}MB, "
+                f"생성 {generate_seconds:.1f}초)")
+    
+    # 이전 실행 결과가 변경분 계산에 쓰이지 않도록 빈 디렉터리에서 시작
+    shutil.rmtree(run_dir, ignore_errors=True)
+    os.makedirs(run_dir)
+    
+    stages = [("collect", source) for source in sources]
+    stages += [("save_to_json", source) for source in sources]
+    stages.append(("integrate", None))
+    stages.append(("screen", None))
+    
+    results = {}
+    context = multiprocessing.get_context('spawn')
+    for stage, source in stages:
+        name = f"{stage}.{source}" if source else stage
+        # 단계마다 새 프로세스를 사용하여 최대 RSS를 단계별로 측정
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(_run_stage, os.path.abspath(run_dir), stage, source,
+                                 fixtures.get(source), sources, seed).result()
+        results[name] = result
+        rate = f", {result['namesPerSecond']}개/초" if result.get("namesPerSecond") else ""
+        logger.info(f"{scale:g}배 {name}: {result['seconds']:.3f}초{rate}, 최대 RSS {result['peakRssMB']}MB"
+                    f"{'' if result['success'] else ' (실패)'}")
+    
+    return {
+        "scale": scale,
+        "records": counts,
+        "sharedRecords": shared_count,
+        "fixtureBytes": fixture_bytes,
+        "stages": results
+    }
+
+def git_commit() -> str:
+    """벤치마크 대상 소스의 git 커밋 해시를 반환합니다. 알 수 없으면 빈 문자열을 반환합니다."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=10
+        )
+        return output.stdout.strip() if output.returncode == 0 else ""
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+def compare_results(baseline: Dict, current: Dict) -> List[str]:
+    """두 결과 파일의 같은 배수/단계 소요 시간과 최대 RSS를 비교한 줄 목록을 반환합니다."""
+    lines = []
+    baseline_runs = {run["scale"]: run for run in baseline.get("results", [])}
+    for run in current.get("results", []):
+        previous = baseline_runs.get(run["scale"])
+        if previous is None:
+            continue
+        for name, result in run["stages"].items():
+            old = previous["stages"].get(name)
+            if not old or not old.get("seconds"):
+                continue
+            change = (result["seconds"] - old["seconds"]) / old["seconds"] * 100
+            line = f"{run['scale']:g}배 {name}: {old['seconds']:.3f}초 -> {result['seconds']:.3f}초 ({change:+.1f}%)"
+            if old.get("peakRssMB") and result.get("peakRssMB"):
+                line += f", 최대 RSS {old['peakRssMB']}MB -> {result['peakRssMB']}MB"
+            lines.append(line)
+    return lines
+
+def run_benchmark(scales: List[float], sources: List[str], work_dir: str = DEFAULT_WORK_DIR,
+                  output_path: str = DEFAULT_OUTPUT, seed: int = DEFAULT_SEED,
+                  baseline_path: Optional[str] = None) -> bool:
+    """배수별 벤치마크를 실행하고 결과를 JSON 파일로 저장합니다."""
+    try:
+        document = {
+            "version": RESULT_VERSION,
+            "meta": {
+                "timestamp": datetime.now().isoformat(),
+                "commit": git_commit(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpuCount": os.cpu_count(),
+                "seed": seed,
+                "realRecordCounts": REAL_RECORD_COUNTS
+            },
+            "results": [run_scale(scale, sources, work_dir, seed) for scale in scales]
+        }
+        
+        temp_file = f"{output_path}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, output_path)
+        logger.info(f"벤치마크 결과 저장 완료: {output_path}")
+        
+        if baseline_path:
+            with open(baseline_path, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+            logger.info(f"기준 결과 비교 ({baseline.get('meta', {}).get('commit', '')[:12] or baseline_path})")
+            for line in compare_results(baseline, document):
+                logger.info(line)
+        
+        return all(result["success"] for run in document["results"] for result in run["stages"].values())
+    except Exception as e:
+        logger.error(f"벤치마크 실패: {str(e)}")
+        return False
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="제재 데이터 처리 성능 벤치마크 (오프라인)")
+    parser.add_argument("--scales", default=','.join(str(scale) for scale in DEFAULT_SCALES),
+                        help="실제 크기 대비 배수 목록 (기본값: 1,10,100)")
+    parser.add_argument("--sources", default=','.join(REAL_RECORD_COUNTS),
+                        help="측정할 소스 목록 (기본값: un,eu,us)")
+    parser.add_argument("--work-dir", default=DEFAULT_WORK_DIR,
+                        help=f"가상 원본과 단계별 출력 디렉터리 (기본값: {DEFAULT_WORK_DIR})")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help=f"결과 파일 (기본값: {DEFAULT_OUTPUT})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help=f"가상 데이터 시드 (기본값: {DEFAULT_SEED})")
+    parser.add_argument("--baseline", help="비교할 이전 결과 파일")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    """벤치마크를 실행합니다."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
+    sources = [source.strip().lower() for source in args.sources.split(',') if source.strip()]
+    unknown = [source for source in sources if source not in REAL_RECORD_COUNTS]
+    if unknown or not sources:
+        logger.error(f"알 수 없는 소스: {', '.join(unknown) or '(없음)'}")
+        return 1
+    scales = [float(scale) for scale in args.scales.split(',') if scale.strip()]
+    
+    success = run_benchmark(scales, sources, args.work_dir, args.output, args.seed, args.baseline)
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
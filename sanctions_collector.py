@@ -2,6 +2,14 @@
 """
 제재 데이터 수집 메인 모듈
 UN, EU, US 제재 데이터를 수집하고 JSON 파일로 저장합니다.
+
+    collect [--source un,us]     지정한 소스 수집 후 통합 (지정하지 않은 소스는 기존 출력을 그대로 통합)
+    integrate [--source ...]     수집 없이 기존 소스 출력만 다시 통합
+    diagnose                     출력 파일과 실행 환경 상태를 JSON으로 출력
+    daemon [--interval ...]      상주하며 소스별 주기로 수집
+
+명령 없이 실행하면 collect(모든 소스), --daemon은 daemon과 같습니다. 수집기/통합기 모듈은 명령에 필요한
+것만 임포트하고 로깅과 디렉토리 설정은 명령을 실행할 때 하므로, 명령행 시작 시간은 실행할 작업과 무관합니다.
 """
 
 import os
@@ -9,87 +17,445 @@ import sys
 import time
 import logging
 import json
-from typing import List, Dict
+import signal
+import argparse
+import importlib
+import threading
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
-# 수집기 패키지 임포트
-from collectors.un_collector import UNSanctionsCollector
-from collectors.eu_collector import EUSanctionsCollector
-from collectors.us_collector import USSanctionsCollector
-from collectors.integrator import SanctionsIntegrator
+from collectors.metrics import metrics, peak_rss_bytes
+from collectors.memory import memory_budget, parse_working_set, format_size
 
 # 설정
 OUTPUT_DIR = 'docs/data'
 LOG_DIR = 'logs'
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-os.makedirs(LOG_DIR, exist_ok=True)
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(LOG_DIR, "sanctions_collector.log")),
-        logging.StreamHandler()
-    ]
-)
+DEFAULT_WORKERS = 3  # 동시에 다운로드/파싱할 소스 수
+# 데몬 모드의 소스별 갱신 확인 주기 (분). OFAC(US)는 UN/EU보다 훨씬 자주 갱신됨
+DEFAULT_INTERVALS = {"un": 360, "eu": 360, "us": 60}
+DAEMON_MAX_SLEEP = 60  # 데몬 대기 최대 시간 (초)
+# Prometheus 텍스트 형식 실행 지표 파일 (node_exporter textfile 수집기 디렉터리를 지정할 수 있음)
+METRICS_FILE = os.environ.get('SANCTIONS_METRICS_FILE', os.path.join(LOG_DIR, 'sanctions_collector.prom'))
+
+# 소스 ID별 수집기 (모듈, 클래스) (수집 순서 = 통합 순서, 실행하는 소스의 모듈만 임포트)
+COLLECTOR_MODULES = {
+    "un": ("collectors.un_collector", "UNSanctionsCollector"),
+    "eu": ("collectors.eu_collector", "EUSanctionsCollector"),
+    "us": ("collectors.us_collector", "USSanctionsCollector")
+}
+COMMANDS = ("collect", "integrate", "diagnose", "daemon")
+
 logger = logging.getLogger("sanctions_collector")
 
-def main():
-    """모든 제재 데이터를 수집하고 통합합니다."""
-    start_time = time.time()
-    logger.info("제재 데이터 수집 시작")
+def collector_class(source: str):
+    """소스 ID의 수집기 클래스를 임포트하여 반환합니다."""
+    module_name, class_name = COLLECTOR_MODULES[source]
+    return getattr(importlib.import_module(module_name), class_name)
+
+def _parse_source(collector_class, source_file: str, parse_mode: Optional[str] = None) -> Tuple[bool, List]:
+    """프로세스 풀에서 다운로드된 소스 파일을 파싱하여 바로 JSON으로 저장합니다.
     
-    # 수집기 인스턴스 생성
-    collectors = [
-        UNSanctionsCollector(),
-        EUSanctionsCollector(),
-        USSanctionsCollector()
-    ]
+    파싱 프로세스에서 모은 실행 지표를 성공 여부와 함께 반환합니다. (작업마다 초기화)
+    """
+    metrics.reset()
+    success = collector_class().parse_to_file(source_file, parse_mode)
+    metrics.set("peak_rss_bytes", peak_rss_bytes(), process="parser")
+    return success, metrics.snapshot()
+
+def run_collectors(collectors: List, workers: int = DEFAULT_WORKERS) -> Tuple[List[str], List[str]]:
+    """수집기들을 파이프라인 방식으로 병렬 실행하고 (성공한 소스, 변경된 소스) 목록을 반환합니다.
     
-    # 데이터 수집 실행
-    success_count = 0
-    sources = []
+    다운로드는 스레드 풀에서 동시에 실행되고, 다운로드가 끝난 소스 파일 경로는 즉시
+    프로세스 풀로 넘겨져 스트리밍 파싱과 저장이 함께 실행됩니다. 원본이 바뀌지 않은 소스는 파싱과 저장을 건너뛰고
+    기존 출력을 재사용합니다. 한 소스의 실패는 다른 소스에 영향을 주지 않습니다.
     
-    for collector in collectors:
-        source_name = collector._source_name
-        logger.info(f"{source_name} 제재 데이터 수집 시작")
+    파싱 작업은 시작 전에 메모리 예산에서 작업 메모리를 예약하며, 예산이 부족하면 앞선 파싱이
+    끝날 때까지 시작을 미룹니다. (다운로드는 고정 크기 청크 스트리밍이므로 예약하지 않음)
+    """
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+    
+    succeeded = set()
+    changed = set()
+    deferred = []  # 파싱 대기열: (수집기, 소스 파일, 파싱 방식, 예상 작업 메모리)
+    
+    with ThreadPoolExecutor(max_workers=workers) as io_pool, \
+            ProcessPoolExecutor(max_workers=workers) as parse_pool:
+        # 모든 소스 다운로드 동시 시작
+        pending = {}
+        for collector in collectors:
+            logger.info(f"{collector._source_name} 제재 데이터 수집 시작")
+            pending[io_pool.submit(collector.fetch)] = ("fetch", collector)
         
-        try:
-            if collector.collect():
-                logger.info(f"{source_name} 제재 데이터 수집 성공")
-                success_count += 1
-                sources.append(source_name.lower())
-            else:
-                logger.error(f"{source_name} 제재 데이터 수집 실패")
-        except Exception as e:
-            logger.error(f"{source_name} 제재 데이터 수집 중 오류 발생: {str(e)}")
-    
-    # 통합 데이터 생성
-    if success_count > 0:
-        try:
-            # 통합기 인스턴스 생성
-            integrator = SanctionsIntegrator(sources)
+        def start_parses() -> None:
+            """예산이 허용하는 만큼 대기 중인 파싱을 순서대로 시작합니다."""
+            while deferred:
+                collector, source_file, parse_mode, working_set = deferred[0]
+                if not memory_budget.try_reserve(f"parse:{collector.source_id}", working_set):
+                    break
+                deferred.pop(0)
+                pending[parse_pool.submit(_parse_source, type(collector), source_file, parse_mode)] = ("parse", collector)
+            for collector, _, _, working_set in deferred:
+                if not metrics.get("parse_deferred", source=collector.source_id):
+                    logger.info(f"{collector._source_name} 메모리 예산 부족, 파싱 대기 "
+                                f"(예상 {format_size(working_set)}, {memory_budget.describe()})")
+                    metrics.set("parse_deferred", 1, source=collector.source_id)
+        
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, collector = pending.pop(future)
+                source_name = collector._source_name
+                if stage == "parse":
+                    memory_budget.release(f"parse:{collector.source_id}")
+                
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"{source_name} 제재 데이터 수집 중 오류 발생 ({stage}): {str(e)}")
+                    metrics.set("source_success", 0, source=collector.source_id)
+                    continue
+                
+                if stage == "fetch":
+                    if result is None:
+                        logger.error(f"{source_name} 제재 데이터 다운로드 실패")
+                        metrics.set("source_success", 0, source=collector.source_id)
+                        continue
+                    unchanged = collector.is_unchanged()
+                    metrics.set("source_unchanged", int(unchanged), source=collector.source_id)
+                    if unchanged:
+                        logger.info(f"{source_name} 제재 데이터 변경 없음, 파싱 및 저장 건너뜀")
+                        metrics.set("source_success", 1, source=collector.source_id)
+                        succeeded.add(source_name)
+                        continue
+                    # 다운로드 완료 즉시 파싱 대기열에 추가 (파일 크기와 메모리 예산으로 파싱 방식 결정)
+                    size = os.path.getsize(result)
+                    parse_mode = collector.choose_parse_mode(size)
+                    deferred.append((collector, result, parse_mode, parse_working_set(parse_mode, size)))
+                elif stage == "parse":
+                    result, parse_metrics = result
+                    metrics.merge(parse_metrics)
+                    metrics.set("source_success", int(bool(result)), source=collector.source_id)
+                    if result:
+                        collector.commit_download()
+                        logger.info(f"{source_name} 제재 데이터 수집 성공")
+                        succeeded.add(source_name)
+                        changed.add(source_name)
+                    else:
+                        logger.error(f"{source_name} 제재 데이터 수집 실패")
+            start_parses()
+    
+    # 통합 순서를 수집기 순서와 동일하게 유지
+    sources = [c._source_name.lower() for c in collectors if c._source_name in succeeded]
+    changed_sources = [c._source_name.lower() for c in collectors if c._source_name in changed]
+    return sources, changed_sources
+
+def integrate_and_publish(sources: List[str], changed_sources: Optional[List[str]],
+                          sqlite_output: Optional[bool] = None, history_file: Optional[str] = None) -> bool:
+    """수집된 소스를 통합하고 정적 사이트용 샤드를 배포합니다.
+    
+    변경된 소스가 없으면(빈 목록) 기존 통합 결과를 재사용하고, None이면 항상 다시 통합합니다.
+    sqlite_output이 None이면 환경 변수 SANCTIONS_SQLITE_OUTPUT을, history_file이 None이면 SANCTIONS_HISTORY_FILE을 따릅니다.
+    """
+    from collectors.integrator import SanctionsIntegrator, SQLITE_OUTPUT, HISTORY_FILE
+    from collectors.publisher import StaticPublisher
+    
+    try:
+        # 통합기 인스턴스 생성
+        integrator = SanctionsIntegrator(
+            sources,
+            sqlite_output=SQLITE_OUTPUT if sqlite_output is None else sqlite_output,
+            history_file=HISTORY_FILE if history_file is None else history_file
+        )
+        
+        # 통합 데이터 생성
+        if integrator.integrate(changed_sources):
+            logger.info("제재 데이터 통합 성공")
             
-            # 통합 데이터 생성
-            if integrator.integrate():
-                logger.info("제재 데이터 통합 성공")
-            else:
-                logger.error("제재 데이터 통합 실패")
-        except Exception as e:
-            logger.error(f"제재 데이터 통합 중 오류 발생: {str(e)}")
+            # 정적 사이트용 샤드 배포 (docs/data/shards)
+            StaticPublisher().publish_file()
+            return True
+        logger.error("제재 데이터 통합 실패")
+    except Exception as e:
+        logger.error(f"제재 데이터 통합 중 오류 발생: {str(e)}")
+    return False
+
+class CollectorDaemon:
+    """소스별 주기로 제재 데이터를 수집하는 상주 프로세스
+    
+    수집기 인스턴스(다운로드 검증자 상태)와 공유 HTTP 세션 연결 풀은 실행 사이에 유지됩니다.
+    주기가 된 소스들을 한 번에 파이프라인으로 수집하고, 원본이 실제로 바뀐 소스가 있을 때만 다시 통합합니다.
+    파싱 프로세스 풀은 수집할 때마다 만듭니다. (fork 비용이 작고, 대기 중인 파싱 프로세스가 메모리를 점유하지 않도록)
+    """
+    
+    def __init__(self, intervals: Dict[str, int], workers: int = DEFAULT_WORKERS, sqlite_output: Optional[bool] = None,
+                 history_file: Optional[str] = None):
+        """초기화 (intervals는 {소스 ID: 주기(분)})"""
+        self.intervals = intervals
+        self.workers = workers
+        self.sqlite_output = sqlite_output
+        self.history_file = history_file
+        self.collectors = {source: collector_class(source)() for source in COLLECTOR_MODULES if source in intervals}
+        self.available = set()  # 한 번이라도 수집에 성공해 통합 대상이 된 소스
+        self.due = set(self.collectors)  # 시작 시 모든 소스 수집
+        import schedule  # 데몬 모드에서만 필요
+        self.scheduler = schedule.Scheduler()
+        self._stop = threading.Event()
+    
+    def stop(self, *_) -> None:
+        """현재 수집이 끝나면 데몬을 종료하도록 요청합니다. (시그널 처리기로도 사용)"""
+        logger.info("제재 데이터 수집 데몬 종료 요청")
+        self._stop.set()
+    
+    def run(self) -> None:
+        """종료 요청이 올 때까지 주기가 된 소스를 수집합니다."""
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self.stop)
+        for source, minutes in self.intervals.items():
+            self.scheduler.every(minutes).minutes.do(self.due.add, source)
+        logger.info("제재 데이터 수집 데몬 시작: " + ', '.join(
+            f"{source} {minutes}분" for source, minutes in self.intervals.items()
+        ))
+        
+        while not self._stop.is_set():
+            self.scheduler.run_pending()
+            if self.due:
+                self.run_cycle()
+                continue
+            idle = self.scheduler.idle_seconds
+            self._stop.wait(min(max(idle if idle is not None else DAEMON_MAX_SLEEP, 1), DAEMON_MAX_SLEEP))
+        logger.info("제재 데이터 수집 데몬 종료")
+    
+    def run_cycle(self) -> bool:
+        """주기가 된 소스를 수집하고 변경이 있으면 통합합니다. 모든 소스가 성공하면 True를 반환합니다."""
+        due = [collector for source, collector in self.collectors.items() if source in self.due]
+        self.due.clear()
+        metrics.reset()
+        start_time = time.time()
+        
+        sources, changed_sources = run_collectors(due, self.workers)
+        self.available.update(sources)
+        if changed_sources:
+            # 이번에 수집하지 않은 소스는 마지막으로 성공한 출력을 그대로 통합
+            integrate_and_publish([source for source in self.collectors if source in self.available],
+                                  changed_sources, self.sqlite_output, self.history_file)
+        else:
+            logger.info("변경된 소스 없음, 통합 건너뜀")
+        
+        elapsed_time = time.time() - start_time
+        success = len(sources) == len(due)
+        logger.info(f"제재 데이터 수집 완료: {len(sources)}/{len(due)} 성공, 소요 시간: {elapsed_time:.2f}초")
+        write_metrics(elapsed_time, success)
+        create_diagnostic_info(sources, elapsed_time)
+        return success
+
+def parse_intervals(text: str) -> Dict[str, int]:
+    """'us=30,un=720' 형식의 소스별 주기(분)를 기본 주기와 합쳐 반환합니다."""
+    intervals = dict(DEFAULT_INTERVALS)
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        source, _, minutes = item.partition('=')
+        source = source.strip().lower()
+        if source not in COLLECTOR_MODULES or not minutes.strip().isdigit() or int(minutes) <= 0:
+            raise argparse.ArgumentTypeError(f"잘못된 수집 주기: {item} (예: us=30,un=720)")
+        intervals[source] = int(minutes)
+    return intervals
+
+def parse_sources(text: str) -> List[str]:
+    """'un,us' 형식의 소스 목록을 수집 순서대로 반환합니다."""
+    sources = {part.strip().lower() for part in text.split(',') if part.strip()}
+    unknown = sources - set(COLLECTOR_MODULES)
+    if unknown or not sources:
+        raise argparse.ArgumentTypeError(
+            f"잘못된 소스: {text} (사용 가능: {','.join(COLLECTOR_MODULES)})"
+        )
+    return [source for source in COLLECTOR_MODULES if source in sources]
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다. 명령이 없으면 collect, --daemon은 daemon 명령으로 처리합니다."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if "--daemon" in argv:
+        argv.remove("--daemon")
+        argv.insert(0, "daemon")
+    elif not argv or argv[0] not in COMMANDS and argv[0] not in ("-h", "--help"):
+        argv.insert(0, "collect")
+    
+    workers = argparse.ArgumentParser(add_help=False)
+    workers.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("COLLECTOR_WORKERS", DEFAULT_WORKERS)),
+        help=f"동시에 다운로드/파싱할 작업 수 (기본값: {DEFAULT_WORKERS}, 환경 변수 COLLECTOR_WORKERS)"
+    )
+    sqlite = argparse.ArgumentParser(add_help=False)
+    sqlite.add_argument(
+        "--sqlite",
+        action="store_true",
+        default=None,
+        help="통합 결과를 SQLite(docs/data/integrated_sanctions.db)로도 저장 (환경 변수 SANCTIONS_SQLITE_OUTPUT)"
+    )
+    history = argparse.ArgumentParser(add_help=False)
+    history.add_argument(
+        "--history-file",
+        default=None,
+        help="통합할 때마다 실행 이력을 이 파일에 기록, 예: history/sanctions_history.db "
+             "(기본값: 기록 안 함, 환경 변수 SANCTIONS_HISTORY_FILE)"
+    )
+    source = argparse.ArgumentParser(add_help=False)
+    source.add_argument(
+        "--source",
+        type=parse_sources,
+        default=list(COLLECTOR_MODULES),
+        help=f"대상 소스, 예: un,us (기본값: {','.join(COLLECTOR_MODULES)})"
+    )
+    
+    parser = argparse.ArgumentParser(description="UN, EU, US 제재 데이터 수집기")
+    commands = parser.add_subparsers(dest="command", required=True)
+    collect = commands.add_parser(
+        "collect", parents=[source, workers, sqlite, history],
+        help="소스를 수집하고 통합 (지정하지 않은 소스는 기존 출력을 통합)"
+    )
+    collect.add_argument("--no-integrate", action="store_true", help="수집만 하고 통합하지 않음")
+    commands.add_parser("integrate", parents=[source, sqlite, history], help="수집 없이 기존 소스 출력을 다시 통합")
+    commands.add_parser("diagnose", help="출력 파일과 실행 환경 상태를 JSON으로 출력")
+    daemon = commands.add_parser("daemon", parents=[workers, sqlite, history], help="상주하며 소스별 주기로 수집")
+    daemon.add_argument(
+        "--interval",
+        type=parse_intervals,
+        default=os.environ.get("SANCTIONS_INTERVALS", ""),
+        help="소스별 주기(분), 예: us=30,un=720 (기본값: "
+             + ','.join(f"{source}={minutes}" for source, minutes in DEFAULT_INTERVALS.items())
+             + ", 환경 변수 SANCTIONS_INTERVALS)"
+    )
+    return parser.parse_args(argv)
+
+def collect(sources: List[str], workers: int = DEFAULT_WORKERS, sqlite_output: Optional[bool] = None,
+            run_integration: bool = True, history_file: Optional[str] = None) -> bool:
+    """지정한 소스를 수집하고 통합합니다. 모든 소스가 성공하면 True를 반환합니다.
+    
+    지정하지 않은 소스는 마지막으로 저장된 출력을 그대로 통합하므로 실패한 소스만 다시 수집할 수 있습니다.
+    """
+    start_time = time.time()
+    logger.info(f"제재 데이터 수집 시작: {', '.join(sources)} "
+                f"(workers={workers}, 메모리 한도={format_size(memory_budget.limit)})")
+    
+    # 수집기 인스턴스 생성 (지정한 소스의 모듈만 임포트)
+    collectors = [collector_class(source)() for source in sources]
+    
+    # 데이터 수집 실행
+    succeeded, changed_sources = run_collectors(collectors, workers)
+    
+    # 통합 데이터 생성 (이번에 실패한 소스는 제외)
+    if succeeded and run_integration:
+        integrate_and_publish(
+            [source for source in COLLECTOR_MODULES if source in succeeded or source not in sources],
+            changed_sources, sqlite_output, history_file
+        )
     
     # 결과 요약
     elapsed_time = time.time() - start_time
-    logger.info(f"제재 데이터 수집 완료: {success_count}/{len(collectors)} 성공, 소요 시간: {elapsed_time:.2f}초")
+    logger.info(f"제재 데이터 수집 완료: {len(succeeded)}/{len(collectors)} 성공, 소요 시간: {elapsed_time:.2f}초")
+    
+    # 실행 지표 및 진단 정보 생성
+    success = len(succeeded) == len(collectors)
+    write_metrics(elapsed_time, success)
+    create_diagnostic_info(succeeded, elapsed_time)
+    return success
+
+def integrate(sources: List[str], sqlite_output: Optional[bool] = None, history_file: Optional[str] = None) -> bool:
+    """수집 없이 기존 소스 출력을 다시 통합합니다."""
+    start_time = time.time()
+    success = integrate_and_publish(sources, None, sqlite_output, history_file)
+    elapsed_time = time.time() - start_time
+    write_metrics(elapsed_time, success)
+    create_diagnostic_info(sources if success else [], elapsed_time)
+    return success
+
+def diagnose() -> Dict:
+    """소스/통합 출력 파일과 실행 환경 상태를 반환합니다. (파일을 만들거나 수집기 모듈을 임포트하지 않음)"""
+    from collectors.base import OUTPUT_FORMAT, PARSE_MODE, TEMP_DIR, source_output_path
     
-    # 진단 정보 생성
-    create_diagnostic_info(sources, elapsed_time)
+    def file_status(path: str) -> Dict:
+        if not os.path.exists(path):
+            return {"path": path, "exists": False}
+        stat = os.stat(path)
+        return {
+            "path": path, "exists": True, "size": stat.st_size,
+            "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
+        }
     
-    return success_count == len(collectors)
+    sources = {source: file_status(source_output_path(source)) for source in COLLECTOR_MODULES}
+    integrated = {
+        name: file_status(os.path.join(OUTPUT_DIR, f"integrated_sanctions.{extension}"))
+        for name, extension in (("json", "json"), ("snapshot", "snap"), ("sqlite", "db"))
+    }
+    last_run = None
+    diagnostic_file = os.path.join(OUTPUT_DIR, "diagnostic_info.json")
+    if os.path.exists(diagnostic_file):
+        try:
+            with open(diagnostic_file, 'r', encoding='utf-8') as f:
+                last_run = json.load(f)
+        except (OSError, ValueError) as e:
+            last_run = {"error": str(e)}
+    
+    return {
+        "ok": all(status["exists"] for status in sources.values()) and integrated["json"]["exists"],
+        "sources": sources,
+        "integrated": integrated,
+        "lastRun": last_run,
+        "directories": {
+            directory: {"exists": os.path.isdir(directory), "writable": os.access(directory, os.W_OK)}
+            for directory in (OUTPUT_DIR, TEMP_DIR, LOG_DIR)
+        },
+        "settings": {
+            "outputFormat": OUTPUT_FORMAT,
+            "parseMode": PARSE_MODE,
+            "memoryLimit": memory_budget.limit,
+            "metricsFile": METRICS_FILE
+        }
+    }
+
+def main(argv: Optional[List[str]] = None):
+    """명령을 실행합니다."""
+    args = parse_args(argv)
+    if args.command == "diagnose":
+        report = diagnose()
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')
+        return report["ok"]
+    
+    # 로깅과 디렉토리는 명령을 실행할 때 설정
+    from collectors.base import ensure_directories, setup_logging
+    ensure_directories()
+    setup_logging()
+    
+    if args.command == "daemon":
+        CollectorDaemon(args.interval, max(1, args.workers), args.sqlite, args.history_file).run()
+        return True
+    if args.command == "integrate":
+        return integrate(args.source, args.sqlite, args.history_file)
+    return collect(args.source, max(1, args.workers), args.sqlite, not args.no_integrate, args.history_file)
+
+def write_metrics(elapsed_time: float, success: bool) -> None:
+    """실행 전체 지표를 기록하고 Prometheus 텍스트 형식 파일로 저장합니다."""
+    try:
+        metrics.set("run_duration_seconds", round(elapsed_time, 3))
+        metrics.set("run_success", int(success))
+        metrics.set("last_run_timestamp_seconds", int(time.time()))
+        metrics.set("peak_rss_bytes", peak_rss_bytes(), process="main")
+        metrics.set("memory_limit_bytes", memory_budget.limit or 0)
+        metrics.write_prometheus(METRICS_FILE)
+        logger.info(f"실행 지표 저장 완료: {METRICS_FILE}")
+    except Exception as e:
+        logger.error(f"실행 지표 저장 중 오류 발생: {str(e)}")
+
+def _record_count(source: str):
+    """실행 중 기록된 소스 항목 수를 반환합니다. (저장 단계, 없으면 통합 단계에서 읽은 수)"""
+    count = metrics.get("records", stage="save", source=source)
+    if count is None:
+        count = metrics.get("records", stage="load", source=source)
+    return int(count) if count is not None else "unknown"
 
 def create_diagnostic_info(sources: List[str], elapsed_time: float):
-    """진단 정보를 생성하여 저장합니다."""
+    """진단 정보를 생성하여 저장합니다. 출력 파일을 다시 읽지 않고 실행 지표를 사용합니다."""
     try:
         info = {
             "last_update": datetime.now().isoformat(),
@@ -100,25 +466,22 @@ def create_diagnostic_info(sources: List[str], elapsed_time: float):
         
         # 각 소스별 항목 수 추가
         for source in sources:
-            try:
-                with open(os.path.join(OUTPUT_DIR, f"{source}_sanctions.json"), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    info[f"{source}_count"] = data.get("meta", {}).get("count", 0)
-            except:
-                info[f"{source}_count"] = "unknown"
+            info[f"{source}_count"] = _record_count(source)
         
         # 통합 데이터 항목 수 추가
-        try:
-            with open(os.path.join(OUTPUT_DIR, "integrated_sanctions.json"), 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                info["integrated_count"] = data.get("meta", {}).get("count", 0)
-        except:
-            info["integrated_count"] = "unknown"
+        integrated_count = metrics.get("records", stage="integrate", source="integrated")
+        info["integrated_count"] = int(integrated_count) if integrated_count is not None else "unknown"
+        
+        # 소스/단계별 지표와 최대 메모리
+        info["metrics"] = metrics.source_summary()
+        info["peak_rss_bytes"] = {
+            dict(labels).get("process", ""): value for labels, value in metrics.values("peak_rss_bytes").items()
+        }
         
         # 파일로 저장
         with open(os.path.join(OUTPUT_DIR, "diagnostic_info.json"), 'w', encoding='utf-8') as f:
             json.dump(info, f, ensure_ascii=False, indent=2)
-            
+        
         logger.info("진단 정보 저장 완료")
     except Exception as e:
         logger.error(f"진단 정보 생성 중 오류 발생: {str(e)}")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+제재 데이터 이력 조회 모듈
+통합 실행 이력 저장소에서 특정 시점의 등재 여부(ID 또는 이름)와 항목별 등재/해제 이력을 조회합니다.
+결과는 JSON으로 출력합니다.
+"""
+
+import sys
+import json
+import argparse
+from typing import List, Optional
+
+from collectors.history import HistoryStore
+from collectors.integrator import HISTORY_FILE
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="제재 데이터 이력 조회")
+    parser.add_argument("--history-file", default=HISTORY_FILE,
+                        help="이력 저장소 파일 (기본값: 환경 변수 SANCTIONS_HISTORY_FILE)")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--id", help="항목 ID (--at과 함께 쓰면 그 시점의 항목, 아니면 등재/해제 이력)")
+    query.add_argument("--name", help="이름 또는 별칭 (--at 필요)")
+    query.add_argument("--runs", type=int, nargs='?', const=20, metavar="N", help="최근 실행 요약 N개 (기본값: 20)")
+    parser.add_argument("--at", help="조회 시점 (YYYY-MM-DD 또는 ISO 시각, 날짜만 주면 그날 끝 기준)")
+    args = parser.parse_args(argv)
+    if args.name and not args.at:
+        parser.error("--name에는 --at이 필요합니다.")
+    if not args.history_file:
+        parser.error("--history-file 또는 환경 변수 SANCTIONS_HISTORY_FILE이 필요합니다.")
+    return args
+
+def main(argv: Optional[List[str]] = None):
+    """이력을 조회하여 JSON으로 출력합니다."""
+    args = parse_args(argv)
+    try:
+        with HistoryStore(args.history_file, readonly=True) as history:
+            if args.runs is not None:
+                result = history.runs(args.runs)
+            elif args.name:
+                result = history.search_name_at(args.name, args.at)
+            elif args.at:
+                result = history.record_at(args.id, args.at)
+            else:
+                result = history.timeline(args.id)
+    except Exception as e:
+        print(f"이력 조회 실패: {str(e)}", file=sys.stderr)
+        return 1
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write('\n')
+    return 0 if result not in (None, []) else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+제재 대상 일괄 스크리닝 모듈
+고객/거래 상대방 이름 파일(CSV 또는 NDJSON)을 스트리밍으로 읽어 통합 제재 데이터와 대조하고
+기준 점수 이상인 일치 항목을 NDJSON 파일로 저장합니다. 신분증/등록 번호 열을 지정하면 번호로도 정확히 대조합니다.
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import List, Dict, Optional, Iterator, Tuple
+
+from collectors.base import WRITE_BUFFER_SIZE, setup_logging
+from collectors.cache import QueryCache
+from collectors.index import SanctionsIndex, SearchHit, DEFAULT_LIMIT, default_data_file
+from collectors.normalize import sorted_token_key
+
+# 설정
+DEFAULT_WORKERS = os.cpu_count() or 1  # 스크리닝 프로세스 수
+DEFAULT_MIN_SCORE = 85.0  # 일치로 보고할 최소 점수
+BATCH_SIZE = 2000  # 작업 단위(이름 수)
+MAX_PENDING_BATCHES = 4  # 프로세스당 대기 배치 수 (입력 읽기 역압)
+PROGRESS_INTERVAL = 100000  # 진행 상황 로그 간격 (이름 수)
+
+logger = logging.getLogger("sanctions_screening")
+
+# 작업 프로세스에서 공유하는 인덱스 (fork 시 부모 프로세스의 인덱스를 그대로 사용)
+_index: Optional[SanctionsIndex] = None
+# 프로세스별 중복 이름 검색 결과 캐시 (메모리 예산: SANCTIONS_QUERY_CACHE_SIZE, 처음 검색할 때 생성)
+_cache: Optional[QueryCache] = None
+
+def _init_worker(data_file: str, with_identifiers: bool = False):
+    """작업 프로세스를 초기화합니다. fork로 인덱스를 물려받지 못한 경우에만 새로 생성합니다."""
+    global _index, _cache
+    if _index is None:
+        _index = SanctionsIndex.from_file(data_file)
+        if with_identifiers:
+            _index.identifier_map()
+    # 부모 프로세스의 캐시를 물려받지 않고 작업 프로세스마다 새로 생성
+    _cache = None
+
+def _query_cache() -> QueryCache:
+    """프로세스의 검색 결과 캐시를 반환합니다. (환경 변수는 import 시점이 아닌 처음 사용할 때 읽음)"""
+    global _cache
+    if _cache is None:
+        _cache = QueryCache()
+    return _cache
+
+def _search_cached(name: str, min_score: float, limit: int) -> List[SearchHit]:
+    """같은 이름이 반복되는 입력을 위해 검색 결과를 캐시합니다. (어순/대소문자/구두점만 다른 이름은 같은 키)
+    
+    캐시에는 (점수, 항목 번호, 일치한 이름)만 보관하므로 항목 크기를 계산하지 않고 메모리도 적게 씁니다.
+    """
+    cache = _query_cache()
+    key = (sorted_token_key(name), min_score, limit)
+    ranked = cache.get(key)
+    if ranked is None:
+        ranked = _index.rank(name, limit=limit, min_score=min_score)
+        cache.put(key, ranked)
+    records = _index.records
+    return [SearchHit(records[record_index], score, matched) for score, record_index, matched in ranked]
+
+def _screen_batch(rows: List[Tuple[str, str, str, str]], min_score: float,
+                  limit: int) -> Tuple[List[Dict], int, int]:
+    """(입력 ID, 이름, 신분증 번호, 발급국가) 목록을 검색하여 (일치 항목 목록, 캐시 적중 수, 캐시 실패 수)를 반환합니다.
+    
+    신분증 번호가 있으면 번호 인덱스로 정확히 일치하는 항목을 점수 100으로 먼저 보고합니다.
+    """
+    cache = _query_cache()
+    hits, misses = cache.hits, cache.misses
+    matches = []
+    for row_id, name, document, country in rows:
+        found = set()
+        if document:
+            for record in _index.find_identifier(document, country):
+                found.add(record["id"])
+                matches.append(_match(row_id, name, record, "document", record.get("name", ""), 100.0))
+        if name:
+            for hit in _search_cached(name, min_score, limit):
+                if hit.record["id"] not in found:
+                    matches.append(_match(row_id, name, hit.record, "name", hit.matched_name, hit.score))
+    return matches, cache.hits - hits, cache.misses - misses
+
+def _match(row_id: str, name: str, record: Dict, match_type: str, matched: str, score: float) -> Dict:
+    """일치 항목 출력 레코드를 생성합니다."""
+    return {
+        "inputId": row_id,
+        "inputName": name,
+        "matchId": record["id"],
+        "matchName": record.get("name", ""),
+        "matchType": match_type,
+        "matchedName": matched,
+        "source": record.get("source", ""),
+        "type": record.get("type", ""),
+        "score": score
+    }
+
+def detect_format(path: str) -> str:
+    """파일 확장자로 입력 형식(csv 또는 ndjson)을 판단합니다."""
+    return 'ndjson' if path.endswith(('.ndjson', '.jsonl')) else 'csv'
+
+def iter_names(path: str, input_format: str, name_field: str, id_field: str,
+               document_field: Optional[str] = None,
+               country_field: Optional[str] = None) -> Iterator[Tuple[str, str, str, str]]:
+    """입력 파일에서 (입력 ID, 이름, 신분증 번호, 발급국가)를 스트리밍으로 읽습니다. ID가 없으면 행 번호를 사용합니다."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if input_format == 'ndjson':
+            rows = (json.loads(line) for line in f if line.strip())
+        else:
+            rows = csv.DictReader(f)
+        for line_no, row in enumerate(rows, 1):
+            name = row.get(name_field) or ""
+            document = str(row.get(document_field) or "") if document_field else ""
+            if name or document:
+                country = str(row.get(country_field) or "") if country_field else ""
+                yield str(row.get(id_field) or line_no), name, document, country
+
+def screen_file(input_path: str, output_path: str, data_file: Optional[str] = None,
+                input_format: Optional[str] = None, name_field: str = 'name', id_field: str = 'id',
+                min_score: float = DEFAULT_MIN_SCORE, limit: int = DEFAULT_LIMIT,
+                workers: int = DEFAULT_WORKERS, document_field: Optional[str] = None,
+                country_field: Optional[str] = None, index: Optional[SanctionsIndex] = None) -> bool:
+    """입력 파일을 일괄 스크리닝하여 일치 항목을 NDJSON으로 저장합니다.
+    
+    document_field를 주면 그 열의 신분증/등록 번호를 번호 인덱스로 정확히 대조합니다.
+    index를 주면 data_file을 다시 읽지 않고 그 인덱스를 사용합니다. (벤치마크, 반복 실행)
+    """
+    global _index
+    start_time = time.time()
+    input_format = input_format or detect_format(input_path)
+    data_file = data_file or default_data_file()
+    temp_path = output_path + '.tmp'
+    
+    try:
+        # 인덱스를 한 번만 생성하고 fork로 작업 프로세스와 공유 (copy-on-write, 스냅샷은 OS 페이지 캐시 공유)
+        _index = index or SanctionsIndex.from_file(data_file)
+        if document_field:
+            # 번호 인덱스도 fork 전에 만들어 작업 프로세스와 공유
+            _index.identifier_map()
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        
+        names = iter_names(input_path, input_format, name_field, id_field, document_field, country_field)
+        batches = iter(lambda: list(islice(names, BATCH_SIZE)), [])
+        
+        total_names = 0
+        total_matches = 0
+        cache_hits = cache_misses = 0
+        next_report = PROGRESS_INTERVAL
+        screen_start = time.time()
+        with open(temp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as out, \
+                ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                    initializer=_init_worker, initargs=(data_file, bool(document_field))) as pool:
+            pending = {}
+            exhausted = False
+            while pending or not exhausted:
+                # 대기 배치 수를 제한하여 입력 전체가 메모리에 쌓이지 않도록 함
+                while not exhausted and len(pending) < workers * MAX_PENDING_BATCHES:
+                    batch = next(batches, None)
+                    if batch is None:
+                        exhausted = True
+                        break
+                    pending[pool.submit(_screen_batch, batch, min_score, limit)] = len(batch)
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total_names += pending.pop(future)
+                    matches, hits, misses = future.result()
+                    cache_hits += hits
+                    cache_misses += misses
+                    total_matches += len(matches)
+                    out.writelines(json.dumps(match, ensure_ascii=False) + '\n' for match in matches)
+                
+                if total_names >= next_report:
+                    elapsed = time.time() - screen_start
+                    logger.info(f"스크리닝 진행: {total_names}개 이름, {total_names / elapsed:.0f}개/초")
+                    next_report += PROGRESS_INTERVAL
+        os.replace(temp_path, output_path)
+        
+        # 처리 속도는 인덱스 준비 시간을 제외하고 계산
+        elapsed = time.time() - screen_start
+        rate = total_names / elapsed if elapsed > 0 else 0
+        lookups = cache_hits + cache_misses
+        hit_rate = cache_hits / lookups if lookups else 0.0
+        logger.info(f"스크리닝 완료: {total_names}개 이름, {total_matches}개 일치, "
+                    f"{elapsed:.2f}초 ({rate:.0f}개/초, 작업 프로세스 {workers}개, 인덱스 준비 "
+                    f"{screen_start - start_time:.2f}초), 검색 캐시 적중률 {hit_rate:.1%} -> {output_path}")
+        return True
+    except Exception as e:
+        logger.error(f"스크리닝 실패: {str(e)}")
+        # 중단된 출력의 임시 파일 정리
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="제재 대상 일괄 스크리닝")
+    parser.add_argument("input", help="입력 파일 (CSV 또는 NDJSON)")
+    parser.add_argument("output", help="일치 항목 출력 파일 (NDJSON)")
+    parser.add_argument("--data-file", help="통합 제재 데이터 파일 (기본값: 스냅샷, 없으면 integrated_sanctions.json)")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--name-field", default="name", help="이름 열/필드 (기본값: name)")
+    parser.add_argument("--id-field", default="id", help="ID 열/필드 (기본값: id, 없으면 행 번호)")
+    parser.add_argument("--document-field", help="신분증/등록 번호 열/필드 (지정하면 번호로 정확히 대조)")
+    parser.add_argument("--document-country-field", help="신분증 발급국가 열/필드 (지정하면 발급국가가 다른 번호 제외)")
+    parser.add_argument("--min-score", type=float, default=DEFAULT_MIN_SCORE,
+                        help=f"일치로 보고할 최소 점수 (기본값: {DEFAULT_MIN_SCORE})")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"이름당 최대 일치 항목 수 (기본값: {DEFAULT_LIMIT})")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"스크리닝 프로세스 수 (기본값: {DEFAULT_WORKERS})")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    """일괄 스크리닝을 실행합니다."""
+    args = parse_args(argv)
+    setup_logging()
+    success = screen_file(
+        args.input, args.output, args.data_file, args.format, args.name_field, args.id_field,
+        args.min_score, args.limit, max(1, args.workers), args.document_field, args.document_country_field
+    )
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -75,6 +75,56 @@ function createDefaultDataFiles() {
   return true;
 }
 
+/**
+ * 정적 데이터 샤드(docs/data/shards)를 동기화합니다.
+ * 샤드 파일을 먼저 복사하고 manifest.json을 마지막에 교체한 뒤, 매니페스트가 참조하지 않는 이전 샤드를 삭제합니다.
+ * @returns {number} 복사한 샤드 파일 수 (샤드가 없으면 -1)
+ */
+function syncShards() {
+  const sourceShardDir = path.join(sourceDir, 'shards');
+  const targetShardDir = path.join(targetDir, 'shards');
+  const manifestPath = path.join(sourceShardDir, 'manifest.json');
+  if (!fs.existsSync(manifestPath)) {
+    console.log('샤드 매니페스트가 없습니다. 샤드 동기화를 건너뜁니다.');
+    return -1;
+  }
+  
+  let copied = 0;
+  const sourceFilesByKind = {};
+  for (const kind of ['id', 'names']) {
+    const sourceKindDir = path.join(sourceShardDir, kind);
+    const targetKindDir = path.join(targetShardDir, kind);
+    fs.mkdirSync(targetKindDir, { recursive: true });
+    
+    const sourceFiles = new Set(fs.existsSync(sourceKindDir) ? fs.readdirSync(sourceKindDir) : []);
+    for (const file of sourceFiles) {
+      // 파일 이름에 내용 해시가 있으므로 이미 있는 파일은 복사하지 않음
+      const targetPath = path.join(targetKindDir, file);
+      if (!fs.existsSync(targetPath)) {
+        fs.copyFileSync(path.join(sourceKindDir, file), targetPath);
+        copied++;
+      }
+    }
+    sourceFilesByKind[kind] = sourceFiles;
+  }
+  
+  for (const file of ['manifest.json', 'manifest.json.gz']) {
+    if (fs.existsSync(path.join(sourceShardDir, file))) {
+      fs.copyFileSync(path.join(sourceShardDir, file), path.join(targetShardDir, file));
+    }
+  }
+  
+  // 새 매니페스트로 교체한 뒤 이전 샤드 삭제
+  for (const [kind, sourceFiles] of Object.entries(sourceFilesByKind)) {
+    const targetKindDir = path.join(targetShardDir, kind);
+    fs.readdirSync(targetKindDir)
+      .filter(file => !sourceFiles.has(file))
+      .forEach(file => fs.unlinkSync(path.join(targetKindDir, file)));
+  }
+  console.log(`샤드 동기화 완료: ${copied}개 파일 복사`);
+  return copied;
+}
+
 // 메인 함수
 try {
   console.log("데이터 파일 동기화 시작...");
@@ -113,6 +163,14 @@ try {
     }
   });
   
+  // 정적 데이터 샤드 동기화 (pages/api/sanctions가 사용)
+  try {
+    syncShards();
+  } catch (error) {
+    console.error(`샤드 동기화 실패: ${error.message}`);
+    failCount++;
+  }
+  
   console.log("\n데이터 동기화 결과:");
   console.log(`- 성공: ${successCount}개 파일`);
   console.log(`- 실패: ${failCount}개 파일`);
@@ -0,0 +1,84 @@
+"""검색 결과 캐시 테스트"""
+
+import pytest
+
+import collectors.cache as cache_module
+from collectors.cache import DEFAULT_CACHE_BYTES, DEFAULT_CACHE_TTL, ENTRY_OVERHEAD_BYTES, QueryCache, approximate_size
+
+def _entry_size(key, value):
+    return ENTRY_OVERHEAD_BYTES + approximate_size(key) + approximate_size(value)
+
+def test_lru_eviction_under_byte_budget():
+    """예산을 넘으면 가장 오래 쓰지 않은 항목부터 제거하는지 확인합니다."""
+    value = (1.0, 2, "name")
+    cache = QueryCache(max_bytes=_entry_size("k0", value) * 3, ttl=0)
+    for key in ("k0", "k1", "k2"):
+        assert cache.put(key, value)
+    assert cache.get("k0") == value  # k0을 최근 사용으로 이동
+    
+    assert cache.put("k3", value)
+    assert len(cache) == 3
+    assert cache.get("k1") is None
+    assert [cache.get(key) for key in ("k0", "k2", "k3")] == [value] * 3
+    assert cache.evictions == 1
+    assert cache.bytes <= cache.max_bytes
+
+def test_oversized_value_and_disabled_cache():
+    """예산보다 큰 값과 예산 0인 캐시는 저장하지 않는지 확인합니다."""
+    assert not QueryCache(max_bytes=ENTRY_OVERHEAD_BYTES, ttl=0).put("key", "x" * 1000)
+    disabled = QueryCache(max_bytes=0, ttl=0)
+    assert not disabled.put("key", 1)
+    assert len(disabled) == 0
+
+def test_ttl_expiry(monkeypatch):
+    """유효 시간이 지난 항목은 조회할 때 제거되는지 확인합니다."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = QueryCache(max_bytes=1 << 20, ttl=10)
+    cache.put("key", "value")
+    
+    now[0] += 9.9
+    assert cache.get("key") == "value"
+    now[0] += 0.2
+    assert cache.get("key") is None
+    assert (len(cache), cache.bytes, cache.expirations) == (0, 0, 1)
+
+def test_version_change_invalidates():
+    """데이터 버전이 바뀌면 이전 버전 항목을 무효화하고 이전 버전 결과는 저장하지 않는지 확인합니다."""
+    cache = QueryCache(max_bytes=1 << 20, ttl=0, version="v1")
+    cache.put("a", 1)
+    cache.put("b", 2, version="v1")
+    
+    assert not cache.set_version("v1")
+    assert cache.set_version("v2")
+    assert (len(cache), cache.invalidations) == (0, 2)
+    assert cache.get("a") is None
+    assert not cache.put("c", 3, version="v1")
+    assert cache.put("c", 3, version="v2")
+    assert cache.get("c") == 3
+
+def test_hit_rate_counters():
+    """적중/실패 수와 적중률 통계를 확인합니다."""
+    cache = QueryCache(max_bytes=1 << 20, ttl=0)
+    assert cache.stats()["hitRate"] == 0.0
+    cache.put("a", 1)
+    for key in ("a", "a", "a", "b"):
+        cache.get(key)
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hitRate"]) == (3, 1, 0.75)
+    assert stats["entries"] == 1 and stats["bytes"] == cache.bytes
+
+@pytest.mark.parametrize("size, ttl", [("abc", "x"), ("-1", ""), ("12 parsecs", "soon")])
+def test_malformed_settings_fall_back(monkeypatch, size, ttl):
+    """잘못된 환경 변수 값은 기본값으로 대체되는지 확인합니다."""
+    monkeypatch.setenv("SANCTIONS_QUERY_CACHE_SIZE", size)
+    monkeypatch.setenv("SANCTIONS_QUERY_CACHE_TTL", ttl)
+    cache = QueryCache()
+    assert (cache.max_bytes, cache.ttl) == (DEFAULT_CACHE_BYTES, DEFAULT_CACHE_TTL)
+
+def test_settings_from_environment(monkeypatch):
+    """환경 변수로 예산과 유효 시간을 지정할 수 있는지 확인합니다."""
+    monkeypatch.setenv("SANCTIONS_QUERY_CACHE_SIZE", "2M")
+    monkeypatch.setenv("SANCTIONS_QUERY_CACHE_TTL", "30")
+    cache = QueryCache()
+    assert (cache.max_bytes, cache.ttl) == (2 * 1024 * 1024, 30.0)
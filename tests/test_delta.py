@@ -0,0 +1,61 @@
+"""변경분(delta) 계산 테스트"""
+
+import copy
+
+from collectors.delta import HASH_FIELD, DeltaTracker, record_hash
+from collectors.normalize import normalize_record
+
+PREVIOUS = [
+    {"id": "UN-1", "name": "Mohamed Ali", "type": "INDIVIDUAL", "details": {"aliases": ["Muhammad Ali"]}},
+    {"id": "UN-2", "name": "Bank Melli", "type": "ENTITY", "details": {"aliases": []}},
+    {"id": "UN-3", "name": "Korea Daesong Bank", "type": "ENTITY", "details": {"aliases": []}}
+]
+
+def _previous_run():
+    """이전 실행이 저장한 항목 (normalized와 contentHash 포함)"""
+    return list(DeltaTracker().track(normalize_record(copy.deepcopy(record)) for record in PREVIOUS))
+
+def test_delta_added_removed_modified(tmp_path):
+    """추가/삭제/수정된 항목과 필드 단위 변경 사항을 확인합니다."""
+    previous = _previous_run()
+    current = copy.deepcopy(PREVIOUS[:2]) + [{"id": "EU-9", "name": "Sepah Bank", "type": "ENTITY", "details": {}}]
+    current[0]["details"]["aliases"].append("Mohamed Aly")
+    
+    tracker = DeltaTracker(lambda: iter(previous), str(tmp_path))
+    written = list(tracker.track(normalize_record(record) for record in current))
+    try:
+        delta = tracker.delta()
+        assert delta["full"] is False
+        assert [record["id"] for record in delta["added"]] == ["EU-9"]
+        assert delta["removed"] == ["UN-3"]
+        assert delta["modified"] == [{
+            "id": "UN-1",
+            "changes": {"details.aliases": {"old": ["Muhammad Ali"], "new": ["Muhammad Ali", "Mohamed Aly"]}}
+        }]
+    finally:
+        tracker.close()
+    assert all(HASH_FIELD in record for record in written)
+    assert list(tmp_path.iterdir()) == []
+
+def test_hash_ignores_derived_fields():
+    """내용 해시가 normalized와 contentHash에 영향을 받지 않는지 확인합니다."""
+    record = copy.deepcopy(PREVIOUS[0])
+    content_hash = record_hash(record)
+    normalize_record(record)
+    record[HASH_FIELD] = "0" * 32
+    assert record_hash(record) == content_hash
+    
+    record["normalized"]["names"] = ["changed rule"]
+    assert record_hash(record) == content_hash
+
+def test_normalization_change_is_not_modified(tmp_path):
+    """정규화 결과만 달라진 항목은 수정으로 기록하지 않는지 확인합니다."""
+    previous = _previous_run()
+    for record in previous:
+        record["normalized"] = {"names": ["old rule"]}
+    
+    tracker = DeltaTracker(lambda: iter(previous), str(tmp_path))
+    list(tracker.track(normalize_record(copy.deepcopy(record)) for record in PREVIOUS))
+    delta = tracker.delta()
+    tracker.close()
+    assert (len(delta["added"]), delta["removed"], delta["modified"]) == (0, [], [])
@@ -0,0 +1,110 @@
+"""조건부 다운로드와 변경 없는 원본 처리 테스트"""
+
+import http.server
+import os
+import threading
+
+import pytest
+
+import collectors.un_collector as un_collector
+from collectors.base import download_sanctions_file, load_validators
+from collectors.un_collector import UNSanctionsCollector
+
+UN_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<CONSOLIDATED_LIST dateGenerated="2025-04-14T00:00:00">
+<INDIVIDUALS>
+<INDIVIDUAL><DATAID>1</DATAID><FIRST_NAME>ALI</FIRST_NAME><SECOND_NAME>HASSAN</SECOND_NAME><UN_LIST_TYPE>Al-Qaida</UN_LIST_TYPE><LISTED_ON>2005-01-01</LISTED_ON></INDIVIDUAL>
+</INDIVIDUALS>
+<ENTITIES>
+<ENTITY><DATAID>110</DATAID><FIRST_NAME>KOREA MINING DEVELOPMENT TRADING CORPORATION</FIRST_NAME><UN_LIST_TYPE>DPRK</UN_LIST_TYPE><LISTED_ON>2009-04-24</LISTED_ON></ENTITY>
+</ENTITIES>
+</CONSOLIDATED_LIST>
+"""
+
+class SourceServer:
+    """본문과 ETag 사용 여부를 바꿀 수 있는 테스트용 원본 서버"""
+    
+    def __init__(self):
+        self.body = UN_XML
+        self.etag = True
+        self.requests = []
+        server = self
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append(dict(self.headers))
+                etag = f'"{hash(server.body) & 0xffffffff:x}"'
+                if server.etag and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(server.body)))
+                if server.etag:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(server.body)
+            
+            def log_message(self, *args):
+                pass
+        
+        self._httpd = http.server.HTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_port}/consolidated.xml"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+    
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = SourceServer()
+    monkeypatch.setattr(un_collector, "UN_SANCTIONS_URL", source.url)
+    yield source
+    source.close()
+
+def _output_state(path):
+    stat = os.stat(path)
+    return stat.st_ino, stat.st_mtime_ns
+
+def test_conditional_download_304(server):
+    """저장된 ETag로 조건부 요청을 보내고 304이면 기존 임시 파일과 검증자를 반환하는지 확인합니다."""
+    os.makedirs("temp")
+    path, validators = download_sanctions_file(server.url, "un_sanctions.xml")
+    assert validators["etag"] and validators["sha256"]
+    with open(path, 'rb') as f:
+        assert f.read() == UN_XML
+    
+    again, unchanged = download_sanctions_file(server.url, "un_sanctions.xml", validators)
+    assert server.requests[-1].get('If-None-Match') == validators["etag"]
+    assert (again, unchanged) == (path, validators)
+
+def test_collect_304_keeps_output(server):
+    """304 응답이면 파싱과 저장을 건너뛰고 기존 출력 파일을 유지하는지 확인합니다."""
+    assert UNSanctionsCollector().collect()
+    collector = UNSanctionsCollector()
+    output = collector.output_file
+    before = _output_state(output)
+    assert load_validators("un_sanctions.xml")["etag"]
+    
+    assert collector.collect()
+    assert collector.is_unchanged()
+    assert server.requests[-1].get('If-None-Match')
+    assert _output_state(output) == before
+
+def test_collect_same_body_keeps_output(server):
+    """ETag 없이 같은 본문을 받으면(sha256 동일) 기존 출력과 변경분 파일을 유지하는지 확인합니다."""
+    server.etag = False
+    assert UNSanctionsCollector().collect()
+    output = UNSanctionsCollector().output_file
+    delta = os.path.join("docs", "data", "un_delta.json")
+    before = _output_state(output), _output_state(delta)
+    
+    assert UNSanctionsCollector().collect()
+    assert (_output_state(output), _output_state(delta)) == before
+    
+    # 본문이 바뀌면 다시 저장
+    server.body = UN_XML.replace(b"HASSAN", b"HASAN")
+    assert UNSanctionsCollector().collect()
+    assert _output_state(output) != before[0]
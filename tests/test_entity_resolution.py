@@ -0,0 +1,86 @@
+"""교차 소스 개체 식별 테스트"""
+
+from collectors.integrator import SanctionsIntegrator
+from collectors.spill import RecordStore
+
+def _record(record_id, source, name, type="INDIVIDUAL", birth_date="", aliases=(), nationalities=(),
+            identifications=()):
+    return {
+        "id": record_id,
+        "name": name,
+        "type": type,
+        "source": source,
+        "programs": [],
+        "details": {
+            "aliases": list(aliases),
+            "nationalities": list(nationalities),
+            "birthDate": birth_date,
+            "identifications": list(identifications)
+        }
+    }
+
+def _resolve(records):
+    store = RecordStore()
+    for record in records:
+        store.append(record)
+    resolved = SanctionsIntegrator(history_file=None)._resolve_entities(store)
+    return {record["id"]: record for record in resolved}
+
+def test_merges_same_person_across_sources():
+    """이름과 출생연도가 같은 다른 소스의 개인을 하나로 병합하는지 확인합니다."""
+    resolved = _resolve([
+        _record("UN-1", "UN", "Ri Won Ho", birth_date="1964-07-17", aliases=["Ri Won-ho"]),
+        _record("EU-1", "EU", "RI Won Ho", birth_date="17.7.1964", aliases=["Ri Won Ho (alias)"]),
+        _record("UN-2", "UN", "Kim Chol", birth_date="1970")
+    ])
+    assert set(resolved) == {"UN-1", "UN-2"}
+    merged = resolved["UN-1"]
+    assert merged["sourceIds"] == ["UN-1", "EU-1"]
+    assert "RI Won Ho" in merged["details"]["aliases"]
+    assert merged["name"] not in merged["details"]["aliases"]
+
+def test_merges_exact_full_name_without_birth_year():
+    """한쪽에만 생년이 있어도 세 단어 이상 이름이 완전히 같고 국적이 상충하지 않으면 병합하는지 확인합니다."""
+    resolved = _resolve([
+        _record("UN-1", "UN", "DINNO AMOR ROSALEJOS PAREJA", nationalities=["Philippines"]),
+        _record("EU-1", "EU", "Dinno Amor Rosalejos PAREJA", birth_date="1981-07-19"),
+        _record("UN-2", "UN", "Ahmad Khan Zadran", nationalities=["Afghanistan"]),
+        _record("EU-2", "EU", "Ahmad Khan Zadran", birth_date="1975", nationalities=["Pakistan"])
+    ])
+    assert resolved["UN-1"]["sourceIds"] == ["UN-1", "EU-1"]
+    assert resolved["UN-1"]["details"]["birthDate"] == "1981-07-19"
+    assert {"UN-2", "EU-2"} <= set(resolved)
+
+def test_requires_same_type_and_years():
+    """유형이 다르거나 출생연도가 겹치지 않으면 병합하지 않는지 확인합니다."""
+    resolved = _resolve([
+        _record("UN-1", "UN", "Al Furqan Foundation", type="ENTITY"),
+        _record("EU-1", "EU", "Al Furqan Foundation", type="VESSEL"),
+        _record("UN-2", "UN", "Mohamed Ali Hassan", birth_date="1960"),
+        _record("EU-2", "EU", "Mohamed Ali Hassan", birth_date="1985")
+    ])
+    assert len(resolved) == 4
+    assert not any("sourceIds" in record for record in resolved.values())
+
+def test_never_groups_two_records_of_one_source():
+    """연쇄 일치(A~B~C)로 같은 소스의 두 항목이 한 그룹이 되지 않는지 확인합니다."""
+    passport = {"type": "Passport", "number": "P1234567", "country": "Iraq"}
+    resolved = _resolve([
+        _record("UN-1", "UN", "Abu Bakr Baghdadi", birth_date="1971", identifications=[passport]),
+        _record("EU-1", "EU", "Abu Bakr al-Baghdadi", birth_date="1971", identifications=[passport]),
+        _record("UN-2", "UN", "Abu Bakr al Baghdadi", birth_date="1971")
+    ])
+    groups = [record.get("sourceIds", [record["id"]]) for record in resolved.values()]
+    assert sorted(map(len, groups)) == [1, 2]
+    for ids in groups:
+        sources = [record_id.split("-")[0] for record_id in ids]
+        assert len(sources) == len(set(sources))
+    assert sorted(record_id for ids in groups for record_id in ids) == ["EU-1", "UN-1", "UN-2"]
+
+def test_same_source_duplicates_are_not_merged():
+    """같은 소스 안의 같은 이름 항목은 병합 후보로 만들지 않는지 확인합니다."""
+    resolved = _resolve([
+        _record("EU-1", "EU", "Ivan Petrov Sidorov", birth_date="1970"),
+        _record("EU-2", "EU", "Ivan Petrov Sidorov", birth_date="1970")
+    ])
+    assert set(resolved) == {"EU-1", "EU-2"}
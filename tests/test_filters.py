@@ -0,0 +1,71 @@
+"""필터 인덱스 테스트"""
+
+import random
+
+import pytest
+
+from collectors.filters import FilterIndex, record_filter_keys
+
+COUNTRIES = ["Iran", "Russia", "Syria", "North Korea", ""]
+PROGRAMS = ["IRN", "RUS", "SYR", "DPRK", "ISIL"]
+TYPES = ["INDIVIDUAL", "ENTITY", "Vessel"]
+
+def _records(count, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        sanctions = [
+            {"program": rng.choice(PROGRAMS), "startDate": f"20{rng.randint(0, 24):02d}-{rng.randint(1, 12):02d}-01"}
+            for _ in range(rng.randint(0, 3))
+        ]
+        records.append({
+            "id": f"T-{index}",
+            "name": f"Name {index}",
+            "type": rng.choice(TYPES),
+            "country": rng.choice(COUNTRIES),
+            "programs": rng.sample(PROGRAMS, rng.randint(0, 2)),
+            "details": {"nationalities": rng.sample(COUNTRIES[:-1], rng.randint(0, 1)), "sanctions": sanctions}
+        })
+    return records
+
+def _linear(records, country=None, program=None, type=None, start_date=None, end_date=None):
+    """모든 항목을 차례로 확인한 결과"""
+    selected = []
+    for index, record in enumerate(records):
+        keys = record_filter_keys(record)
+        if country and country.casefold() not in keys["country"]:
+            continue
+        if program and program.casefold() not in keys["program"]:
+            continue
+        if type and type.casefold() not in keys["type"]:
+            continue
+        if start_date or end_date:
+            dates = [sanction["startDate"] for sanction in record["details"]["sanctions"]]
+            if not any((not start_date or date >= start_date) and (not end_date or date <= end_date) for date in dates):
+                continue
+        selected.append(index)
+    return selected
+
+@pytest.mark.parametrize("conditions", [
+    {"country": "iran"},
+    {"program": "DPRK", "type": "individual"},
+    {"country": "Russia", "program": "RUS", "type": "ENTITY"},
+    {"start_date": "2010-01-01"},
+    {"end_date": "2003-06-30"},
+    {"start_date": "2005-02-01", "end_date": "2017-11-01", "country": "Syria"},
+    {"start_date": "2015-05-01", "end_date": "2015-05-01"},
+    {"start_date": "2030-01-01"},
+    {"country": "Atlantis"}
+])
+def test_select_matches_linear_scan(conditions):
+    """비트맵 필터 결과가 모든 항목을 확인한 결과와 같은지 확인합니다."""
+    records = _records(3000)
+    selection = FilterIndex(records).select(**conditions)
+    expected = _linear(records, **conditions)
+    assert list(selection) == expected
+    assert len(selection) == len(expected)
+    assert selection.page(5, 10) == expected[5:15]
+
+def test_select_without_conditions():
+    """조건이 없으면 None을 반환하는지 확인합니다."""
+    assert FilterIndex(_records(10)).select() is None
@@ -0,0 +1,76 @@
+"""신분증/등록 번호 색인 테스트"""
+
+import copy
+
+import pytest
+
+from collectors.index import SanctionsIndex
+from collectors.normalize import normalize_record
+from collectors.snapshot import write_snapshot
+
+RECORDS = [
+    {"id": "UN-1", "name": "Ri Won Ho", "type": "INDIVIDUAL", "source": "UN", "details": {
+        "aliases": [],
+        "identifications": [{"type": "Passport", "number": "381310014", "country": "DPRK"}]
+    }},
+    {"id": "EU-1", "name": "Ivan Petrov", "type": "INDIVIDUAL", "source": "EU", "details": {
+        "aliases": [],
+        "identifications": [
+            {"type": "Passport", "number": "75 1234-567", "country": "Russia"},
+            {"type": "National ID", "number": "ab.12/34", "country": ""}
+        ]
+    }},
+    {"id": "EU-2", "name": "Petr Ivanov", "type": "INDIVIDUAL", "source": "EU", "details": {
+        "aliases": [],
+        "identifications": [{"type": "Passport", "number": "751234567", "country": "Ukraine"}]
+    }},
+    {"id": "EU-3", "name": "No Documents", "type": "ENTITY", "source": "EU", "details": {"aliases": []}}
+]
+
+@pytest.fixture(params=["records", "normalized", "snapshot"])
+def index(request, tmp_path):
+    """원본 항목, 정규화 결과가 있는 항목, 스냅샷으로 만든 인덱스"""
+    records = copy.deepcopy(RECORDS)
+    if request.param == "records":
+        return SanctionsIndex(records)
+    records = [normalize_record(record) for record in records]
+    if request.param == "normalized":
+        return SanctionsIndex(records)
+    path = str(tmp_path / "data.snap")
+    write_snapshot(path, records)
+    return SanctionsIndex.from_file(path)
+
+def _ids(records):
+    return [record["id"] for record in records]
+
+def test_identifier_map(index):
+    """번호 -> (항목 번호, 발급국가) 색인을 확인합니다."""
+    identifiers = index.identifier_map()
+    assert identifiers["381310014"] == [(0, "dprk")]
+    assert identifiers["751234567"] == [(1, "russia"), (2, "ukraine")]
+    assert identifiers["AB1234"] == [(1, "")]
+    assert index.identifier_map() is identifiers
+
+def test_find_passport_number(index):
+    """공백/하이픈/대소문자 차이를 무시하고 번호로 찾는지 확인합니다."""
+    assert _ids(index.find_identifier("381310014")) == ["UN-1"]
+    assert _ids(index.find_identifier(" 381-310-014 ")) == ["UN-1"]
+    assert _ids(index.find_identifier("751234567")) == ["EU-1", "EU-2"]
+    assert _ids(index.find_identifier("AB 12 34")) == ["EU-1"]
+    assert index.find_identifier("000000") == []
+    assert index.find_identifier("") == []
+
+def test_find_with_issuing_country(index):
+    """발급국가를 주면 같은 국가이거나 국가가 기록되지 않은 항목만 반환하는지 확인합니다."""
+    assert _ids(index.find_identifier("75-1234567", "Russia")) == ["EU-1"]
+    assert _ids(index.find_identifier("751234567", "UKRAINE")) == ["EU-2"]
+    assert _ids(index.find_identifier("ab1234", "France")) == ["EU-1"]
+    assert index.find_identifier("381310014", "Russia") == []
+
+def test_find_deduplicates_record():
+    """한 항목에 같은 번호가 여러 번 기록되어도 한 번만 반환하는지 확인합니다."""
+    record = copy.deepcopy(RECORDS[0])
+    record["details"]["identifications"].append({"type": "Diplomatic Passport", "number": "381 310 014", "country": ""})
+    index = SanctionsIndex([record])
+    assert _ids(index.find_identifier("381310014")) == ["UN-1"]
+    assert _ids(index.find_identifier("381310014", "DPRK")) == ["UN-1"]
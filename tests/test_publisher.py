@@ -0,0 +1,51 @@
+"""정적 샤드 배포 테스트"""
+
+import json
+import os
+
+from collectors.publisher import StaticPublisher, id_shard_key, shard_file_key
+
+RECORDS = [
+    {"id": "UN-1", "name": "Mohamed Ali", "type": "INDIVIDUAL", "source": "UN", "country": "Egypt",
+     "details": {"aliases": ["Мухаммад Али"]}},
+    {"id": "EU-2", "name": "Bank Melli", "type": "ENTITY", "source": "EU", "country": "Iran",
+     "details": {"aliases": ["Ελληνική Τράπεζα"]}},
+    {"id": "UN-3", "name": "김정은", "type": "INDIVIDUAL", "source": "UN", "country": "",
+     "details": {"aliases": ["金正恩"]}}
+]
+
+def _publish(tmp_path):
+    output_dir = str(tmp_path / "shards")
+    assert StaticPublisher(output_dir).publish(RECORDS)
+    with open(os.path.join(output_dir, "manifest.json"), encoding="utf-8") as f:
+        return output_dir, json.load(f)
+
+def test_shard_file_names_are_ascii(tmp_path):
+    """비ASCII 접두어 샤드도 파일 이름은 ASCII(UTF-8 바이트의 16진수)인지 확인합니다."""
+    output_dir, manifest = _publish(tmp_path)
+    
+    name_files = manifest["nameShards"]["files"]
+    assert {"ελ", "τρ", "金正"} <= set(name_files)
+    for key, stem in name_files.items():
+        assert stem.isascii()
+        assert stem.split(".")[0] == shard_file_key(key)
+    for directory in ("id", "names"):
+        for file_name in os.listdir(os.path.join(output_dir, directory)):
+            assert file_name.isascii()
+    assert shard_file_key("ελ") == "ceb5cebb"
+    assert shard_file_key("mo") == "6d6f"
+
+def test_manifest_locates_records(tmp_path):
+    """매니페스트의 파일 이름으로 ID 샤드와 이름 샤드를 찾을 수 있는지 확인합니다."""
+    output_dir, manifest = _publish(tmp_path)
+    
+    id_shards = manifest["idShards"]
+    for record in RECORDS:
+        stem = id_shards["files"][id_shard_key(record["id"], id_shards["count"])]
+        with open(os.path.join(output_dir, id_shards["dir"], f"{stem}.json"), encoding="utf-8") as f:
+            assert record in json.load(f)["data"]
+    
+    name_shards = manifest["nameShards"]
+    with open(os.path.join(output_dir, name_shards["dir"], f"{name_shards['files']['τρ']}.json"), encoding="utf-8") as f:
+        rows = [dict(zip(name_shards["fields"], row)) for row in json.load(f)["names"]]
+    assert [(row["matchedName"], row["id"]) for row in rows] == [("Ελληνική Τράπεζα", "EU-2")]
@@ -0,0 +1,41 @@
+"""검색 순위 테스트"""
+
+import pytest
+
+from collectors.index import SanctionsIndex
+
+NAMES = [
+    "Mohamed", "Mohamed Ali Hassan", "Ahmed Mohamed", "Mohammed", "Mohammed Said", "Mohamad Reza",
+    "Muhammad Ali", "Mohamedou Ould Slahi", "Hamed Moha",
+    "Bank Melli Iran", "Bank Saderat", "Sepah Bank", "Korea Daesong Bank", "Banks", "Banias Trading",
+    "Banka Trading", "Banco Internacional", "Frank Bankowski"
+]
+
+@pytest.fixture(scope="module")
+def index():
+    records = [
+        {"id": f"T-{number}", "name": name, "type": "ENTITY", "source": "T", "details": {"aliases": []}}
+        for number, name in enumerate(NAMES)
+    ]
+    return SanctionsIndex(records)
+
+def _names(index, query, **options):
+    return [hit.record["name"] for hit in index.search(query, limit=None, **options)]
+
+@pytest.mark.parametrize("query", ["mohamed", "bank"])
+def test_exact_word_names_rank_first(index, query):
+    """질의와 같은 단어가 있는 이름이 철자만 비슷한 이름보다 먼저 오는지 확인합니다."""
+    names = _names(index, query, min_score=40)
+    exact = [name for name in NAMES if query in name.casefold().split()]
+    assert sorted(names[:len(exact)]) == sorted(exact)
+    assert len(names) > len(exact)
+
+def test_default_threshold_results(index):
+    """기본 기준 점수에서는 같은 단어가 없는 이름이 나오지 않는지 확인합니다."""
+    assert _names(index, "mohamed") == ["Mohamed"]
+    assert _names(index, "bank", min_score=60) == ["Sepah Bank", "Bank Saderat", "Bank Melli Iran", "Korea Daesong Bank"]
+
+def test_single_word_query_ignores_phonetic_match(index):
+    """한 단어 질의는 음성 코드만 같은 단어(bank/Banias)로 일치하지 않는지 확인합니다."""
+    assert "Banias Trading" not in _names(index, "bank", min_score=60)
+    assert "Banias Trading" not in _names(index, "bank", min_score=40)[:4]
@@ -0,0 +1,68 @@
+"""바이너리 스냅샷 저장/읽기 테스트"""
+
+import copy
+
+from collectors.normalize import normalize_record
+from collectors.snapshot import SanctionsSnapshot, write_snapshot
+
+RECORDS = [
+    {
+        "id": "UN-1",
+        "name": "Mohamed Ali HASSAN",
+        "type": "INDIVIDUAL",
+        "country": "Egypt",
+        "programs": ["ISIL"],
+        "source": "UN,EU",
+        "matchScore": 100,
+        "sourceIds": ["UN-1", "EU-7"],
+        "details": {
+            "aliases": ["Muhammad Ali Hasan", "Абу Мухаммад"],
+            "nationalities": ["Egypt"],
+            "birthDate": "1970-01-01",
+            "identifications": [{"type": "Passport", "number": "A 123-456", "country": "Egypt"}],
+            "sanctions": [{"program": "ISIL", "startDate": "2015-03-01"}]
+        }
+    },
+    {
+        "id": "EU-2",
+        "name": "Bank Melli Iran",
+        "type": "ENTITY",
+        "country": "",
+        "programs": [],
+        "source": "EU",
+        "matchScore": 100,
+        "details": {"aliases": [], "nationalities": [], "sanctions": [{"program": "IRN", "startDate": "2012-10-15"}]}
+    },
+    {
+        "id": "EU-3",
+        "name": "Без деталей",
+        "type": "ENTITY",
+        "country": "",
+        "programs": [],
+        "source": "EU"
+    }
+]
+
+def test_snapshot_round_trip(tmp_path):
+    """저장한 항목을 그대로(normalized 포함) 다시 읽는지 확인합니다."""
+    records = [normalize_record(copy.deepcopy(record)) for record in RECORDS[:2]] + [copy.deepcopy(RECORDS[2])]
+    path = str(tmp_path / "data.snap")
+    
+    assert write_snapshot(path, records) == len(records)
+    with SanctionsSnapshot(path) as snapshot:
+        assert len(snapshot) == len(records)
+        assert list(snapshot) == records
+        assert snapshot.get("EU-2") == records[1]
+        assert snapshot.get("EU-404") is None
+        assert snapshot.field(0, "aliases") == RECORDS[0]["details"]["aliases"]
+        assert snapshot.names(1) == ["Bank Melli Iran"]
+
+def test_snapshot_scan_skips_normalized(tmp_path):
+    """normalized=False로 읽으면 정규화 결과만 빠지는지 확인합니다."""
+    records = [normalize_record(copy.deepcopy(record)) for record in RECORDS]
+    path = str(tmp_path / "data.snap")
+    write_snapshot(path, records)
+    
+    with SanctionsSnapshot(path) as snapshot:
+        scanned = list(snapshot.iter_records(normalized=False))
+    assert scanned == [{key: value for key, value in record.items() if key != "normalized"} for record in records]